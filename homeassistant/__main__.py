@@ -89,6 +89,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--trace-startup",
+        action="store_true",
+        help="Trace the integration setup times at startup and write a Chrome trace",
+    )
     parser.add_argument(
         "--skip-pip",
         action="store_true",
@@ -183,6 +188,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        trace_startup=args.trace_startup,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
@@ -30,11 +30,14 @@ from .setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    async_get_setup_trace,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    async_start_setup_trace,
 )
 from .util import dt as dt_util
 from .util.async_ import gather_with_concurrency
+from .util.json import save_json
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
 
@@ -44,6 +47,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_TRACE_FILENAME = "home-assistant.startup-trace.json"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -134,6 +138,8 @@ async def async_setup_hass(
             if not is_virtual_env():
                 await async_mount_local_lib_path(runtime_config.config_dir)
 
+            if runtime_config.trace_startup:
+                async_start_setup_trace(hass)
             basic_setup_success = (
                 await async_from_config_dict(config_dict, hass) is not None
             )
@@ -174,11 +180,20 @@ async def async_setup_hass(
 
         http_conf = (await http.async_get_last_config(hass)) or {}
 
+        if runtime_config.trace_startup:
+            async_start_setup_trace(hass)
         await async_from_config_dict(
             {"safe_mode": {}, "http": http_conf},
             hass,
         )
 
+    if runtime_config.trace_startup and (trace := async_get_setup_trace(hass)):
+        trace_path = hass.config.path(STARTUP_TRACE_FILENAME)
+        await hass.async_add_executor_job(
+            save_json, trace_path, trace.as_chrome_trace()
+        )
+        _LOGGER.info("Startup trace written to %s", trace_path)
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
@@ -215,6 +230,8 @@ async def async_from_config_dict(
     """
     start = monotonic()
 
+    await loader.async_load_manifest_index(hass)
+
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     await hass.config_entries.async_initialize()
 
@@ -580,6 +597,9 @@ async def _async_set_up_integrations(
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
     watch_task.cancel()
+    if (setup_trace := async_get_setup_trace(hass)) is not None:
+        setup_trace.async_finish()
+    await loader.async_save_manifest_index(hass)
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATONS, {})
 
     _LOGGER.debug(
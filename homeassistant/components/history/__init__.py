@@ -1,12 +1,13 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+import asyncio
+from collections.abc import Iterable, MutableMapping
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 import logging
 import time
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 from aiohttp import web
 import voluptuous as vol
@@ -25,7 +26,7 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
 from homeassistant.helpers.typing import ConfigType
@@ -39,6 +40,9 @@ HISTORY_USE_INCLUDE_ORDER = "history_use_include_order"
 
 CONF_ORDER = "use_include_order"
 
+# The time range fetched for each message of a history stream
+STREAM_WINDOW = timedelta(days=1)
+
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -64,6 +68,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_get_history_during_period)
+    websocket_api.async_register_command(hass, ws_stream_history_during_period)
 
     return True
 
@@ -118,7 +123,7 @@ async def ws_get_statistics_during_period(
         end_time = None
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -153,7 +158,7 @@ async def ws_get_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
@@ -174,20 +179,53 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar_response: bool,
+    max_points: int | None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
-    states = history.get_significant_states(
-        hass,
-        start_time,
-        end_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        True,
-    )
+    states: MutableMapping[str, Any]
+    if max_points:
+        return JSON_DUMP(
+            messages.result_message(
+                msg_id,
+                history.get_significant_states_downsampled(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    max_points,
+                    filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    True,
+                ),
+            )
+        )
+    if columnar_response:
+        states = history.get_significant_states_columnar(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+        )
+    else:
+        states = history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
 
     if not use_include_order or not filters:
         return JSON_DUMP(messages.result_message(msg_id, states))
@@ -215,6 +253,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar_response", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -260,7 +300,7 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -273,10 +313,148 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg["columnar_response"],
+            msg.get("max_points"),
         )
     )
 
 
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str] | None,
+    filters: Filters | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    partial: bool,
+) -> str | None:
+    """Fetch one window of a history stream and convert it to json in the executor.
+
+    Returns None if the window has no states and more windows follow.
+    """
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    if not states and partial:
+        return None
+    message: dict[str, Any] = {
+        "states": states,
+        "start_time": dt_util.utc_to_timestamp(start_time),
+        "end_time": dt_util.utc_to_timestamp(end_time),
+    }
+    if partial:
+        # This is a hint to consumers of the api that
+        # another window of history will follow
+        message["partial"] = True
+    return JSON_DUMP(messages.event_message(msg_id, message))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/stream_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+        vol.Optional("no_attributes", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_stream_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Handle history stream during period websocket command.
+
+    The history is fetched and sent one STREAM_WINDOW at a time, oldest
+    first. The next window is only fetched once the previous messages
+    have been written to the client so a slow client can't make us
+    buffer the whole result.
+    """
+    msg_id: int = msg["id"]
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+    utc_now = dt_util.utcnow()
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str:
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = min(dt_util.as_utc(end_time), utc_now)
+        else:
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = utc_now
+
+    task = asyncio.current_task()
+    assert task is not None
+
+    @callback
+    def _unsub() -> None:
+        """Stop streaming."""
+        task.cancel()
+
+    connection.subscriptions[msg_id] = _unsub
+    connection.send_result(msg_id)
+
+    instance = get_instance(hass)
+    window_start = start_time
+    try:
+        while True:
+            window_end = min(window_start + STREAM_WINDOW, end_time)
+            partial = window_end < end_time
+            # States are selected with last_updated > start_time so the
+            # following windows start a microsecond early to include the
+            # states that were updated exactly at the window boundary
+            query_start = (
+                window_start
+                if window_start == start_time
+                else window_start - timedelta(microseconds=1)
+            )
+            await connection.async_wait_for_drain()
+            message = await instance.async_add_read_executor_job(
+                _ws_stream_significant_states,
+                hass,
+                msg_id,
+                query_start,
+                window_end,
+                msg.get("entity_ids"),
+                hass.data[HISTORY_FILTERS],
+                msg["include_start_time_state"] and window_start == start_time,
+                msg["significant_changes_only"],
+                msg["minimal_response"],
+                msg["no_attributes"],
+                partial,
+            )
+            if message is not None:
+                connection.send_message(message)
+            if not partial:
+                return
+            window_start = window_end
+    finally:
+        # The subscription is done once the last window is sent or on error
+        connection.subscriptions.pop(msg_id, None)
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -338,7 +516,7 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await get_instance(hass).async_add_executor_job(
+            await get_instance(hass).async_add_read_executor_job(
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
@@ -365,7 +543,7 @@ class HistoryPeriodView(HomeAssistantView):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
 
-        with session_scope(hass=hass) as session:
+        with session_scope(hass=hass, read_only=True) as session:
             states = history.get_significant_states_with_session(
                 hass,
                 session,
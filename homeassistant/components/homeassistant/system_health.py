@@ -1,7 +1,9 @@
 """Provide info to system health."""
+from typing import Any
+
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import system_info
+from homeassistant.helpers import system_info, template
 
 
 @callback
@@ -29,4 +31,12 @@ async def system_health_info(hass):
         "os_version": info.get("os_version"),
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
+        "template_cache": _cache_summary(template.compiled_template_cache_info()),
+        "template_regex_cache": _cache_summary(template.regex_cache_info()),
     }
+
+
+def _cache_summary(info: dict[str, Any]) -> str:
+    """Summarize the size and hit rate of a template cache."""
+    hit_rate = "-" if info["hit_rate"] is None else f"{info['hit_rate']:.1%}"
+    return f"{info['size']}/{info['max_size']} entries, {hit_rate} hits"
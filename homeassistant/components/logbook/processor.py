@@ -179,7 +179,7 @@ class EventProcessor:
                 stmt.compile(compile_kwargs={"literal_binds": True}),
             )
 
-        with session_scope(hass=self.hass) as session:
+        with session_scope(hass=self.hass, read_only=True) as session:
             return self.humanify(yield_rows(session.execute(stmt)))
 
     def humanify(
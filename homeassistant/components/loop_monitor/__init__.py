@@ -0,0 +1,48 @@
+"""Measure the scheduling lag of the event loop and the jobs that hold it."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.loop_monitor import LoopMonitor
+
+from .const import DOMAIN, PLATFORMS, SLOW_JOB_THRESHOLD
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up from a config entry."""
+    monitor = LoopMonitor(hass.loop, SLOW_JOB_THRESHOLD)
+    monitor.start()
+    hass.job_monitor = hass.data[DOMAIN] = monitor
+    websocket_api.async_register_command(hass, websocket_loop_monitor_stats)
+    hass.config_entries.async_setup_platforms(entry, PLATFORMS)
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        monitor: LoopMonitor = hass.data.pop(DOMAIN)
+        monitor.stop()
+        if hass.job_monitor is monitor:
+            hass.job_monitor = None
+    return unload_ok
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "loop_monitor/stats"})
+@callback
+def websocket_loop_monitor_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the histograms and slow jobs measured by the loop monitor."""
+    if (monitor := hass.data.get(DOMAIN)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Loop monitor is not set up"
+        )
+        return
+    connection.send_result(msg["id"], monitor.as_dict())
@@ -0,0 +1,12 @@
+"""Constants for the Event Loop Monitor integration."""
+from typing import Final
+
+from homeassistant.const import Platform
+
+DOMAIN: Final = "loop_monitor"
+PLATFORMS: Final = [Platform.SENSOR]
+
+DEFAULT_NAME: Final = "Event Loop Monitor"
+
+# Jobs holding the event loop longer than this are attributed to their owner
+SLOW_JOB_THRESHOLD: Final = 0.05
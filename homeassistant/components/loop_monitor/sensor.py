@@ -0,0 +1,109 @@
+"""Sensors summarizing the histograms of the loop monitor."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import TIME_MILLISECONDS
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util.loop_monitor import Histogram, LoopMonitor
+
+from .const import DOMAIN
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+# How many owners of slow jobs are listed in the attributes
+SLOW_JOB_OWNERS = 5
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the platform from config_entry."""
+    monitor: LoopMonitor = hass.data[DOMAIN]
+    async_add_entities(
+        [
+            LoopLagSensor(entry, monitor),
+            JobDurationSensor(entry, monitor),
+            SlowJobsSensor(entry, monitor),
+        ],
+        True,
+    )
+
+
+def _percentiles(histogram: Histogram) -> dict[str, float]:
+    """Return the estimated percentiles of a histogram in milliseconds."""
+    return {
+        f"p{int(quantile * 100)}": round(histogram.quantile(quantile) * 1000, 1)
+        for quantile in (0.5, 0.95, 0.99)
+    }
+
+
+class LoopMonitorSensor(SensorEntity):
+    """Base class of the loop monitor sensors."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _key: str
+    _name: str
+
+    def __init__(self, entry: ConfigEntry, monitor: LoopMonitor) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+        self._attr_name = self._name
+        self._attr_unique_id = f"{entry.entry_id}_{self._key}"
+
+
+class LoopLagSensor(LoopMonitorSensor):
+    """Largest scheduling lag of the event loop since the previous update."""
+
+    _attr_native_unit_of_measurement = TIME_MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _key = "lag"
+    _name = "Event loop lag"
+
+    async def async_update(self) -> None:
+        """Update the sensor."""
+        self._attr_native_value = round(self._monitor.pop_max_lag() * 1000, 1)
+        self._attr_extra_state_attributes = _percentiles(self._monitor.lag)
+
+
+class JobDurationSensor(LoopMonitorSensor):
+    """Estimated 99th percentile of the time jobs hold the event loop."""
+
+    _attr_native_unit_of_measurement = TIME_MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _key = "job_duration"
+    _name = "Event loop job duration"
+
+    async def async_update(self) -> None:
+        """Update the sensor."""
+        percentiles = _percentiles(self._monitor.job_durations)
+        self._attr_native_value = percentiles["p99"]
+        self._attr_extra_state_attributes = percentiles
+
+
+class SlowJobsSensor(LoopMonitorSensor):
+    """Number of jobs that held the event loop too long."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _key = "slow_jobs"
+    _name = "Event loop slow jobs"
+
+    async def async_update(self) -> None:
+        """Update the sensor."""
+        monitor = self._monitor
+        self._attr_native_value = monitor.slow_job_count
+        attributes: dict[str, Any] = {
+            "threshold": round(monitor.slow_job_threshold * 1000, 1)
+        }
+        for owner, slow_jobs in sorted(
+            monitor.slow_jobs.items(), key=lambda item: -item[1].total
+        )[:SLOW_JOB_OWNERS]:
+            attributes[owner] = slow_jobs.count
+        self._attr_extra_state_attributes = attributes
@@ -3,10 +3,11 @@ from __future__ import annotations
 
 from ast import literal_eval
 import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 import datetime as dt
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
@@ -102,12 +103,18 @@ from .discovery import LAST_DISCOVERY
 from .models import (
     AsyncMessageCallbackType,
     MessageCallbackType,
+    MessageStats,
     PublishMessage,
     PublishPayloadType,
     ReceiveMessage,
     ReceivePayloadType,
 )
-from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
+from .util import (
+    _VALID_QOS_SCHEMA,
+    TopicTrie,
+    valid_publish_topic,
+    valid_subscribe_topic,
+)
 
 if TYPE_CHECKING:
     # Only import for paho-mqtt type checking here, imports are done locally
@@ -852,7 +859,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -928,6 +934,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscriptions_trie: TopicTrie[Subscription] = TopicTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -936,6 +943,11 @@ class MQTT:
 
         self._pending_operations: dict[str, asyncio.Event] = {}
 
+        # Messages received by the MQTT client thread, delivered in batches
+        self._pending_messages: deque[mqtt.MQTTMessage] = deque()
+        self._drain_scheduled = False
+        self.message_stats = MessageStats()
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -1062,11 +1074,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscriptions_trie.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -1079,7 +1089,7 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscriptions_trie.remove(topic, subscription)
 
             # Only unsubscribe if currently connected.
             if self.connected:
@@ -1092,7 +1102,7 @@ class MQTT:
 
         This method is a coroutine.
         """
-        if any(other.topic == topic for other in self.subscriptions):
+        if self._subscriptions_trie.has_filter(topic):
             # Other subscriptions on topic remaining - don't unsubscribe.
             return
 
@@ -1170,15 +1180,28 @@ class MQTT:
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
         """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        self._pending_messages.append(msg)
+        # The flag is cleared before the queue is drained, so a message queued
+        # while draining at worst schedules a drain of an empty queue.
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_drain_messages)
+
+    @callback
+    def _async_drain_messages(self) -> None:
+        """Handle the messages queued by the MQTT client thread."""
+        self._drain_scheduled = False
+        pending = self._pending_messages
+        if not (batch_size := len(pending)):
+            return
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        for _ in range(batch_size):
+            msg = pending.popleft()
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling message on %s", msg.topic)
+        self.message_stats.record_batch(batch_size, self.hass.loop.time())
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -1190,7 +1213,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self._subscriptions_trie.match(msg.topic)
 
         for subscription in subscriptions:
 
@@ -1290,16 +1313,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
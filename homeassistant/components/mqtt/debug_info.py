@@ -14,9 +14,10 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 
 from .const import ATTR_DISCOVERY_PAYLOAD, ATTR_DISCOVERY_TOPIC
-from .models import MessageCallbackType, PublishPayloadType
+from .models import DiscoveryStats, MessageCallbackType, PublishPayloadType
 
 DATA_MQTT_DEBUG_INFO = "mqtt_debug_info"
+DATA_MQTT_DISCOVERY_STATS = "mqtt_discovery_stats"
 STORED_MESSAGES = 10
 
 
@@ -25,6 +26,13 @@ def initialize(hass: HomeAssistant):
     hass.data[DATA_MQTT_DEBUG_INFO] = {"entities": {}, "triggers": {}}
 
 
+def discovery_stats(hass: HomeAssistant) -> DiscoveryStats:
+    """Return the statistics of MQTT discovery."""
+    if DATA_MQTT_DISCOVERY_STATS not in hass.data:
+        hass.data[DATA_MQTT_DISCOVERY_STATS] = DiscoveryStats()
+    return hass.data[DATA_MQTT_DISCOVERY_STATS]
+
+
 def log_messages(
     hass: HomeAssistant, entity_id: str
 ) -> Callable[[MessageCallbackType], MessageCallbackType]:
@@ -218,9 +226,13 @@ def _info_for_trigger(hass: HomeAssistant, trigger_key: str) -> dict[str, Any]:
 
 
 def info_for_config_entry(hass):
-    """Get debug info for all entities and triggers."""
-    mqtt_info = {"entities": [], "triggers": []}
+    """Get debug info for all entities and triggers and for discovery."""
     mqtt_debug_info = hass.data[DATA_MQTT_DEBUG_INFO]
+    mqtt_info: dict[str, Any] = {
+        "entities": [],
+        "triggers": [],
+        "discovery": discovery_stats(hass).as_dict(),
+    }
 
     for entity_id in mqtt_debug_info["entities"]:
         mqtt_info["entities"].append(_info_for_entity(hass, entity_id))
@@ -10,7 +10,7 @@ import re
 import time
 
 from homeassistant.const import CONF_DEVICE, CONF_PLATFORM
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import RESULT_TYPE_ABORT
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.dispatcher import (
@@ -19,6 +19,7 @@ from homeassistant.helpers.dispatcher import (
 )
 from homeassistant.loader import async_get_mqtt
 
+from . import debug_info
 from .. import mqtt
 from .abbreviations import ABBREVIATIONS, DEVICE_ABBREVIATIONS
 from .const import (
@@ -64,6 +65,7 @@ SUPPORTED_COMPONENTS = [
 
 ALREADY_DISCOVERED = "mqtt_discovered_components"
 PENDING_DISCOVERED = "mqtt_pending_components"
+DISCOVERY_PAYLOAD_HASHES = "mqtt_discovery_payload_hashes"
 DATA_CONFIG_FLOW_LOCK = "mqtt_discovery_config_flow_lock"
 DISCOVERY_UNSUBSCRIBE = "mqtt_discovery_unsubscribe"
 INTEGRATION_UNSUBSCRIBE = "mqtt_integration_discovery_unsubscribe"
@@ -97,8 +99,14 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_integrations = {}
 
-    async def async_discovery_message_received(msg):
-        """Process the received message."""
+    pending_messages: dict[tuple[str, str], list[tuple[str, str]]] = {}
+    processing = False
+    stats = debug_info.discovery_stats(hass)
+
+    @callback
+    def async_discovery_message_received(msg):
+        """Queue the received message, unless it repeats the discovered config."""
+        nonlocal processing
         hass.data[LAST_DISCOVERY] = time.time()
         payload = msg.payload
         topic = msg.topic
@@ -117,11 +125,84 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = " ".join((node_id, object_id)) if node_id else object_id
+        discovery_hash = (component, discovery_id)
+        stats.received += 1
+
+        # Retained discovery messages are received again on every reconnect,
+        # skip them without parsing if the config is unchanged
+        payload_hashes = hass.data[DISCOVERY_PAYLOAD_HASHES]
+        if payload:
+            payload_hash = hash(payload)
+            if (
+                discovery_hash in hass.data[ALREADY_DISCOVERED]
+                and payload_hashes.get(discovery_hash) == payload_hash
+            ):
+                _LOGGER.debug(
+                    "Ignoring unchanged discovery payload for %s %s",
+                    component,
+                    discovery_id,
+                )
+                stats.unchanged += 1
+                return
+            payload_hashes[discovery_hash] = payload_hash
+        else:
+            payload_hashes.pop(discovery_hash, None)
+
+        # Only the latest of consecutive configs in a burst is processed, but
+        # removals are kept to remove and rediscover the component
+        queued = pending_messages.setdefault(discovery_hash, [])
+        if payload and queued and queued[-1][1]:
+            stats.coalesced += 1
+            queued[-1] = (topic, payload)
+        else:
+            queued.append((topic, payload))
+
+        if not processing:
+            processing = True
+            hass.async_create_task(async_process_discovery_messages())
+
+    async def async_process_discovery_messages():
+        """Process the queued messages in batches until the queue is empty."""
+        nonlocal processing
+        while pending_messages:
+            batch = list(pending_messages.items())
+            pending_messages.clear()
+            start = time.monotonic()
+            results = await asyncio.gather(
+                *(
+                    async_process_discovery_messages_for(discovery_hash, messages)
+                    for discovery_hash, messages in batch
+                ),
+                return_exceptions=True,
+            )
+            for (discovery_hash, _), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error(
+                        "Error processing discovery message for %s",
+                        discovery_hash,
+                        exc_info=result,
+                    )
+            stats.record_batch(
+                sum(len(messages) for _, messages in batch), time.monotonic() - start
+            )
+        processing = False
+
+    async def async_process_discovery_messages_for(discovery_hash, messages):
+        """Process the queued messages of a discovery id in order."""
+        for topic, payload in messages:
+            await async_process_discovery_message(discovery_hash, topic, payload)
+
+    async def async_process_discovery_message(discovery_hash, topic, payload):
+        """Parse the payload of a discovery message and process it."""
+        component, discovery_id = discovery_hash
+
         if payload:
             try:
                 payload = json.loads(payload)
             except ValueError:
-                _LOGGER.warning("Unable to parse JSON %s: '%s'", object_id, payload)
+                _LOGGER.warning("Unable to parse JSON %s: '%s'", discovery_id, payload)
                 return
 
         payload = MQTTConfig(payload)
@@ -156,10 +237,6 @@ async def async_start(  # noqa: C901
                         if topic[-1] == TOPIC_BASE:
                             availability_conf[CONF_TOPIC] = f"{topic[:-1]}{base}"
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = " ".join((node_id, object_id)) if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if payload:
             # Attach MQTT topic to the payload, used for debug prints
             setattr(payload, "__configuration_source__", f"MQTT (topic: '{topic}')")
@@ -262,6 +339,7 @@ async def async_start(  # noqa: C901
 
     hass.data[ALREADY_DISCOVERED] = {}
     hass.data[PENDING_DISCOVERED] = {}
+    hass.data[DISCOVERY_PAYLOAD_HASHES] = {}
 
     discovery_topics = [
         f"{discovery_topic}/+/+/config",
@@ -3,13 +3,16 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
 import datetime as dt
-from typing import Union
+from typing import Any, Union
 
 import attr
 
 PublishPayloadType = Union[str, bytes, int, float, None]
 ReceivePayloadType = Union[str, bytes]
 
+# Number of seconds over which the rate of received messages is measured
+MESSAGE_RATE_WINDOW = 10.0
+
 
 @attr.s(slots=True, frozen=True)
 class PublishMessage:
@@ -33,5 +36,91 @@ class ReceiveMessage:
     timestamp: dt.datetime = attr.ib(default=None)
 
 
+@attr.s(slots=True)
+class MessageStats:
+    """Statistics of the batches of messages delivered to the event loop."""
+
+    messages: int = attr.ib(default=0)
+    batches: int = attr.ib(default=0)
+    max_batch_size: int = attr.ib(default=0)
+    _rate: float = attr.ib(default=0.0)
+    _window_start: float | None = attr.ib(default=None)
+    _window_messages: int = attr.ib(default=0)
+
+    def record_batch(self, size: int, now: float) -> None:
+        """Record a batch of messages delivered at loop time now."""
+        self.messages += size
+        self.batches += 1
+        if size > self.max_batch_size:
+            self.max_batch_size = size
+
+        if self._window_start is None:
+            self._window_start = now
+        self._window_messages += size
+        if (elapsed := now - self._window_start) >= MESSAGE_RATE_WINDOW:
+            self._rate = self._window_messages / elapsed
+            self._window_start = now
+            self._window_messages = 0
+
+    def messages_per_second(self, now: float) -> float:
+        """Return the rate of messages over the last complete window."""
+        if self._window_start is None:
+            return 0.0
+        if (elapsed := now - self._window_start) >= MESSAGE_RATE_WINDOW:
+            # No batch has closed the window since, so the rate has dropped
+            return self._window_messages / elapsed
+        return self._rate
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "messages": self.messages,
+            "batches": self.batches,
+            "average_batch_size": (
+                round(self.messages / self.batches, 2) if self.batches else 0
+            ),
+            "max_batch_size": self.max_batch_size,
+            "messages_per_second": round(self.messages_per_second(now), 2),
+        }
+
+
+@attr.s(slots=True)
+class DiscoveryStats:
+    """Statistics of the received and processed discovery messages."""
+
+    received: int = attr.ib(default=0)
+    unchanged: int = attr.ib(default=0)
+    coalesced: int = attr.ib(default=0)
+    processed: int = attr.ib(default=0)
+    batches: int = attr.ib(default=0)
+    max_batch_size: int = attr.ib(default=0)
+    processing_time: float = attr.ib(default=0.0)
+
+    def record_batch(self, size: int, duration: float) -> None:
+        """Record a batch of discovery messages processed in duration seconds."""
+        self.processed += size
+        self.batches += 1
+        if size > self.max_batch_size:
+            self.max_batch_size = size
+        self.processing_time += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "received": self.received,
+            "unchanged": self.unchanged,
+            "coalesced": self.coalesced,
+            "processed": self.processed,
+            "batches": self.batches,
+            "max_batch_size": self.max_batch_size,
+            "processing_time": round(self.processing_time, 3),
+            "messages_per_second": (
+                round(self.processed / self.processing_time, 1)
+                if self.processing_time
+                else 0
+            ),
+        }
+
+
 AsyncMessageCallbackType = Callable[[ReceiveMessage], Awaitable[None]]
 MessageCallbackType = Callable[[ReceiveMessage], None]
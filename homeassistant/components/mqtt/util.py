@@ -1,5 +1,9 @@
 """Utility functions for the MQTT integration."""
-from typing import Any
+from __future__ import annotations
+
+from itertools import count
+from operator import itemgetter
+from typing import Any, Generic, TypeVar
 
 import voluptuous as vol
 
@@ -15,6 +19,8 @@ from .const import (
     DEFAULT_RETAIN,
 )
 
+_T = TypeVar("_T")
+
 
 def valid_topic(value: Any) -> str:
     """Validate that this is a valid topic name/filter."""
@@ -99,3 +105,105 @@ MQTT_WILL_BIRTH_SCHEMA = vol.Schema(
     },
     required=True,
 )
+
+
+class _TopicNode(Generic[_T]):
+    """Level of a topic filter in a topic trie."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode[_T]] = {}
+        self.items: list[tuple[int, _T]] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Match topics against the topic filters of subscriptions.
+
+    Topic filters are stored level by level with the + and # wildcards as
+    regular levels, so matching a topic takes time in its depth instead of
+    in the number of subscriptions. Matches are returned in the order they
+    were added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the topic trie."""
+        self._root: _TopicNode[_T] = _TopicNode()
+        self._sequence = count()
+
+    def add(self, topic_filter: str, item: _T) -> None:
+        """Add an item for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.items.append((next(self._sequence), item))
+
+    def remove(self, topic_filter: str, item: _T) -> None:
+        """Remove an item of a topic filter."""
+        levels = topic_filter.split("/")
+        path = [self._root]
+        for level in levels:
+            if (child := path[-1].children.get(level)) is None:
+                raise KeyError(topic_filter)
+            path.append(child)
+
+        node = path[-1]
+        for idx, (_, node_item) in enumerate(node.items):
+            if node_item is item:
+                del node.items[idx]
+                break
+        else:
+            raise KeyError(topic_filter)
+
+        # Prune the levels that are no longer used
+        for level, parent in zip(reversed(levels), reversed(path[:-1])):
+            if node.items or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if any items are added for the topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.items)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the items of the topic filters matching a topic.
+
+        Wildcards in the first level do not match topics starting with $.
+        """
+        levels = topic.split("/")
+        wildcards = not topic.startswith("$")
+        matches: list[tuple[int, _T]] = []
+        nodes = [self._root]
+        for level in levels:
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if wildcards and (child := children.get("#")) is not None:
+                    matches.extend(child.items)
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if wildcards and (child := children.get("+")) is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+            wildcards = True
+        else:
+            for node in nodes:
+                matches.extend(node.items)
+                # A # filter also matches its parent level
+                if (child := node.children.get("#")) is not None:
+                    matches.extend(child.items)
+
+        if len(matches) > 1:
+            matches.sort(key=itemgetter(0))
+        return [item for _, item in matches]
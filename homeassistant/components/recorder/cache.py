@@ -0,0 +1,79 @@
+"""Caches used by the recorder to deduplicate shared data."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from lru import LRU  # pylint: disable=no-name-in-module
+
+
+class SharedIdCache:
+    """A bounded LRU cache of database ids keyed by their shared JSON.
+
+    The cache keeps hit, miss and eviction counters and a reverse map
+    from id to JSON so purged ids can be evicted without walking the cache.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache."""
+        self._ids: LRU = LRU(max_size, callback=self._evicted)
+        self._shared_by_id: dict[int, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evicted(self, shared: str, id_: int) -> None:
+        """Handle an entry being evicted because the cache is full."""
+        self.evictions += 1
+        self._shared_by_id.pop(id_, None)
+
+    def __len__(self) -> int:
+        """Return the number of cached ids."""
+        return len(self._ids)
+
+    def __contains__(self, shared: str) -> bool:
+        """Return if the JSON is cached without touching the counters."""
+        return shared in self._ids
+
+    @property
+    def max_size(self) -> int:
+        """Return the maximum number of cached ids."""
+        return self._ids.get_size()  # type: ignore[no-any-return]
+
+    def get(self, shared: str) -> int | None:
+        """Return the id for the JSON or None if it is not cached."""
+        if (id_ := self._ids.get(shared)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return id_  # type: ignore[no-any-return]
+
+    def __setitem__(self, shared: str, id_: int) -> None:
+        """Cache the id of the JSON."""
+        if (old_id := self._ids.get(shared)) is not None:
+            self._shared_by_id.pop(old_id, None)
+        self._ids[shared] = id_
+        self._shared_by_id[id_] = shared
+
+    def evict_ids(self, ids: Iterable[int]) -> None:
+        """Evict the ids that were removed from the database."""
+        for id_ in ids:
+            if (shared := self._shared_by_id.pop(id_, None)) is not None:
+                self._ids.pop(shared, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._ids.clear()
+        self._shared_by_id.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._ids),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
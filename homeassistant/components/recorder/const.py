@@ -1,12 +1,10 @@
 """Recorder constants."""
 
-from functools import partial
-import json
 from typing import Final
 
 from homeassistant.backports.enum import StrEnum
 from homeassistant.const import ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 
 DATA_INSTANCE = "recorder_instance"
 SQLITE_URL_PREFIX = "sqlite://"
@@ -26,8 +24,10 @@ MAX_QUEUE_BACKLOG = 40000
 MAX_ROWS_TO_PURGE = 998
 
 DB_WORKER_PREFIX = "DbWorker"
+# Read executor threads are database workers using the read only connections
+DB_READER_PREFIX = f"{DB_WORKER_PREFIX}Reader"
 
-JSON_DUMP: Final = partial(json.dumps, cls=JSONEncoder, separators=(",", ":"))
+JSON_DUMP: Final = json_dumps
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -13,7 +13,6 @@ import time
 from typing import Any, TypeVar, cast
 
 from awesomeversion import AwesomeVersion
-from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
@@ -29,7 +28,14 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
     MATCH_ALL,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    Event,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
 from homeassistant.helpers.event import (
     async_track_time_change,
     async_track_time_interval,
@@ -39,7 +45,9 @@ from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 
 from . import migration, statistics
+from .cache import SharedIdCache
 from .const import (
+    DB_READER_PREFIX,
     DB_WORKER_PREFIX,
     KEEPALIVE_TIME,
     MAX_QUEUE_BACKLOG,
@@ -47,7 +55,7 @@ from .const import (
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBInterruptibleThreadPoolExecutor, QueryLatencyStats
 from .models import (
     SCHEMA_VERSION,
     Base,
@@ -62,7 +70,14 @@ from .models import (
     process_timestamp,
 )
 from .pool import POOL_SIZE, MutexPool, RecorderPool
-from .queries import find_shared_attributes_id, find_shared_data_id
+from .queries import (
+    find_max_ids,
+    find_recent_shared_attributes,
+    find_recent_shared_data,
+    find_shared_attributes_id,
+    find_shared_data_id,
+    sync_postgresql_sequences,
+)
 from .run_history import RunHistory
 from .tasks import (
     AdjustStatisticsTask,
@@ -89,6 +104,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -103,15 +119,6 @@ DEFAULT_URL = "sqlite:///{hass_config_path}"
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
-# The number of attribute ids to cache in memory
-#
-# Based on:
-# - The number of overlapping attributes
-# - How frequently states with overlapping attributes will change
-# - How much memory our low end hardware has
-STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
-EVENT_DATA_ID_CACHE_SIZE = 2048
-
 SHUTDOWN_TASK = object()
 
 COMMIT_TASK = CommitTask()
@@ -140,10 +147,14 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         auto_repack: bool,
         keep_days: int,
+        purge_id_ranges: bool,
         commit_interval: int,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        db_read_url: str | None,
+        db_read_pool_size: int,
+        id_cache_size: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
         exclude_attributes_by_domain: dict[str, set[str]],
@@ -155,17 +166,21 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_id_ranges = purge_id_ranges
         self._hass_started: asyncio.Future[object] = asyncio.Future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_url = db_read_url
+        self.db_read_pool_size = db_read_pool_size
         self.engine_version: AwesomeVersion | None = None
         self.async_db_ready: asyncio.Future[bool] = asyncio.Future()
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        self.read_engine: Engine | None = None
         self.run_history = RunHistory()
 
         self.entity_filter = entity_filter
@@ -174,19 +189,27 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._old_states: dict[str, States] = {}
-        self._state_attributes_ids: LRU = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
-        self._event_data_ids: LRU = LRU(EVENT_DATA_ID_CACHE_SIZE)
+        self._state_attributes_ids = SharedIdCache(id_cache_size)
+        self._event_data_ids = SharedIdCache(id_cache_size)
         self._pending_state_attributes: dict[str, StateAttributes] = {}
         self._pending_event_data: dict[str, EventData] = {}
         self._pending_expunge: list[States] = []
+        self._pending_states: list[States] = []
+        self._pending_events: list[Events] = []
+        self._pending_old_states: list[tuple[States, States]] = []
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._read_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self.read_query_stats = QueryLatencyStats()
         self._exclude_attributes_by_domain = exclude_attributes_by_domain
+        self.state_recorded_listeners: dict[str, Callable[[Event], None]] = {}
+        self.hourly_statistics = statistics.HourlyStatisticsAccumulator()
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -226,6 +249,21 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session from the read only connection pool.
+
+        Only the threads of the read executor use the read only pool, which has
+        a connection for each of them. Other threads get a regular session, this
+        includes the recorder thread as the read only connections may not see
+        the rows the recorder has not committed yet.
+        """
+        if (
+            self._get_read_session is None
+            or not threading.current_thread().name.startswith(DB_READER_PREFIX)
+        ):
+            return self.get_session()
+        return self._get_read_session()
+
     def queue_task(self, task: RecorderTask) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -242,12 +280,24 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self.db_read_pool_size:
+            self._read_executor = DBInterruptibleThreadPoolExecutor(
+                thread_name_prefix=DB_READER_PREFIX,
+                max_workers=self.db_read_pool_size,
+                shutdown_hook=self._shutdown_read_pool,
+            )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
         if self.engine and hasattr(self.engine.pool, "shutdown"):
             self.engine.pool.shutdown()
 
+    def _shutdown_read_pool(self) -> None:
+        """Close the read only dbpool connections in the current thread."""
+        if self.read_engine and hasattr(self.read_engine.pool, "shutdown"):
+            self.read_engine.pool.shutdown()
+        self._shutdown_pool()
+
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
@@ -283,11 +333,31 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job(
+        self, target: Callable[..., T], *args: Any
+    ) -> asyncio.Future[T]:
+        """Add a read only executor job from within the event loop.
+
+        The job runs in the read executor if there is one and its latency
+        is recorded in read_query_stats.
+        """
+        return self.hass.loop.run_in_executor(
+            self._read_executor or self._db_executor,
+            self.read_query_stats.run,
+            time.monotonic(),
+            target,
+            *args,
+        )
+
     def _stop_executor(self) -> None:
         """Stop the executor."""
         assert self._db_executor is not None
         self._db_executor.shutdown()
         self._db_executor = None
+        if self._read_executor is not None:
+            self._read_executor.shutdown()
+            self._read_executor = None
 
     @callback
     def _async_check_queue(self, *_: Any) -> None:
@@ -740,6 +810,7 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         dbevent = Events.from_event(event)
         if not event.data:
+            self._pending_events.append(dbevent)
             self.event_session.add(dbevent)
             return
 
@@ -768,6 +839,7 @@ class Recorder(threading.Thread):
                 ] = dbevent_data
                 self.event_session.add(dbevent_data)
 
+        self._pending_events.append(dbevent)
         self.event_session.add(dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
@@ -812,14 +884,24 @@ class Recorder(threading.Thread):
             if old_state.state_id:
                 dbstate.old_state_id = old_state.state_id
             else:
-                dbstate.old_state = old_state
+                # The old state is part of the pending commit, the
+                # old_state_id is resolved once the ids are assigned
+                self._pending_old_states.append((dbstate, old_state))
         if event.data.get("new_state"):
             self._old_states[dbstate.entity_id] = dbstate
             self._pending_expunge.append(dbstate)
         else:
             dbstate.state = None
+        self._pending_states.append(dbstate)
         self.event_session.add(dbstate)
 
+        if self.state_recorded_listeners and (
+            state_recorded := self.state_recorded_listeners.get(
+                split_entity_id(dbstate.entity_id)[0]
+            )
+        ):
+            state_recorded(event)
+
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -857,11 +939,50 @@ class Recorder(threading.Thread):
                 tries += 1
                 time.sleep(self.db_retry_wait)
 
+    def _assign_pending_ids(self) -> None:
+        """Assign the primary keys of the pending rows and resolve foreign keys.
+
+        The recorder thread is the only writer to the events, event_data,
+        states and state_attributes tables, so the primary keys can be handed
+        out in memory starting from the current maximum ids. Once all rows of
+        a table have their primary key, the session inserts them with a single
+        executemany instead of one INSERT per row to fetch the generated key.
+        """
+        assert self.event_session is not None
+        with self.event_session.no_autoflush:
+            max_ids = self.event_session.execute(find_max_ids()).one()
+        event_id, data_id, state_id, attributes_id = (max_id or 0 for max_id in max_ids)
+        for event_id, dbevent in enumerate(self._pending_events, event_id + 1):
+            dbevent.event_id = event_id
+        for data_id, event_data in enumerate(
+            self._pending_event_data.values(), data_id + 1
+        ):
+            event_data.data_id = data_id
+        for state_id, dbstate in enumerate(self._pending_states, state_id + 1):
+            dbstate.state_id = state_id
+        for attributes_id, state_attributes in enumerate(
+            self._pending_state_attributes.values(), attributes_id + 1
+        ):
+            state_attributes.attributes_id = attributes_id
+        for dbstate, old_state in self._pending_old_states:
+            dbstate.old_state_id = old_state.state_id
+
+        if self.dialect_name == SupportedDialect.POSTGRESQL:
+            # Explicit ids do not advance the sequences on PostgreSQL
+            self.event_session.execute(
+                sync_postgresql_sequences(event_id, data_id, state_id, attributes_id)
+            )
+
     def _commit_event_session(self) -> None:
         assert self.event_session is not None
         self._commits_without_expire += 1
 
+        if self._pending_events or self._pending_states:
+            self._assign_pending_ids()
         self.event_session.commit()
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_old_states = []
         if self._pending_expunge:
             for dbstate in self._pending_expunge:
                 # Expunge the state so its not expired
@@ -902,10 +1023,13 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self._old_states = {}
-        self._state_attributes_ids = {}
-        self._event_data_ids = {}
+        self._state_attributes_ids.clear()
+        self._event_data_ids.clear()
         self._pending_state_attributes = {}
         self._pending_event_data = {}
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_old_states = []
 
         if not self.event_session:
             return
@@ -1057,6 +1181,52 @@ class Recorder(threading.Thread):
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
+        self._setup_read_connection()
+
+    def _setup_read_connection(self) -> None:
+        """Set up the read only connection pool.
+
+        Reads use the replica if one is configured, or their own WAL mode
+        connections to a SQLite database file. Otherwise they share the
+        connections of the database executor.
+        """
+        if not self.db_read_pool_size:
+            return
+        if self.db_read_url:
+            read_url = self.db_read_url
+        elif self._using_file_sqlite:
+            read_url = self.db_url
+        else:
+            return
+
+        kwargs: dict[str, Any] = {}
+
+        if read_url.startswith(SQLITE_URL_PREFIX):
+            # Connections can be closed by the pool from another thread
+            kwargs["connect_args"] = {"check_same_thread": False}
+            kwargs["poolclass"] = RecorderPool
+        else:
+            kwargs["max_overflow"] = 0
+            if read_url.startswith(MYSQLDB_URL_PREFIX):
+                with contextlib.suppress(ImportError):
+                    kwargs["connect_args"] = {"conv": build_mysqldb_conv()}
+        kwargs["pool_size"] = self.db_read_pool_size
+
+        def setup_read_only_connection(
+            dbapi_connection: Any, connection_record: Any
+        ) -> None:
+            """Dbapi specific read only connection settings."""
+            assert self.read_engine is not None
+            setup_read_only_connection_for_dialect(
+                self, self.read_engine.dialect.name, dbapi_connection
+            )
+
+        self.read_engine = create_engine(read_url, **kwargs, future=True)
+        sqlalchemy_event.listen(self.read_engine, "connect", setup_read_only_connection)
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+        _LOGGER.debug("Connected to recorder read only database")
 
     def _close_connection(self) -> None:
         """Close the connection."""
@@ -1064,6 +1234,10 @@ class Recorder(threading.Thread):
         self.engine.dispose()
         self.engine = None
         self._get_session = None
+        if self.read_engine is not None:
+            self.read_engine.dispose()
+            self.read_engine = None
+            self._get_read_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -1072,8 +1246,28 @@ class Recorder(threading.Thread):
             self.run_history.start(session)
             self._schedule_compile_missing_statistics(session)
 
+        self._load_recent_shared_ids()
         self._open_event_session()
 
+    def _load_recent_shared_ids(self) -> None:
+        """Warm the shared id caches from the most recent states and events.
+
+        This avoids a select for every state written in the first
+        minutes after a restart.
+        """
+        with session_scope(
+            session=self.get_session(),
+            exception_filter=lambda err: isinstance(err, SQLAlchemyError),
+        ) as session:
+            for attributes_id, shared_attrs in session.execute(
+                find_recent_shared_attributes(self._state_attributes_ids.max_size)
+            ):
+                self._state_attributes_ids[shared_attrs] = attributes_id
+            for data_id, shared_data in session.execute(
+                find_recent_shared_data(self._event_data_ids.max_size)
+            ):
+                self._event_data_ids[shared_data] = data_id
+
     def _schedule_compile_missing_statistics(self, session: Session) -> None:
         """Add tasks for missing statistics runs."""
         now = dt_util.utcnow()
@@ -1093,6 +1287,23 @@ class Recorder(threading.Thread):
             self.queue_task(StatisticsTask(start))
             start = end
 
+    @callback
+    def async_cache_info(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics of the shared id caches."""
+        return {
+            "state_attributes": self._state_attributes_ids.as_dict(),
+            "event_data": self._event_data_ids.as_dict(),
+        }
+
+    @callback
+    def async_read_query_info(self) -> dict[str, Any]:
+        """Return the read only pool and the latency of its queries."""
+        return {
+            "read_pool": self.read_engine is not None,
+            "read_pool_size": self.db_read_pool_size,
+            "queries": self.read_query_stats.as_dict(),
+        }
+
     def _end_session(self) -> None:
         """End the recorder session."""
         if self.event_session is None:
@@ -4,11 +4,14 @@ from __future__ import annotations
 from collections.abc import Callable
 from concurrent.futures.thread import _threads_queues, _worker
 import threading
-from typing import Any
+import time
+from typing import Any, TypeVar
 import weakref
 
 from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
+_T = TypeVar("_T")
+
 
 def _worker_with_shutdown_hook(
     shutdown_hook: Callable[[], None], *args: Any, **kwargs: Any
@@ -59,3 +62,54 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+class QueryLatencyStats:
+    """Latency of the queries run in an executor, keyed by the job name.
+
+    The wait is the time a job was queued before a worker picked it up, the
+    run is the time it took the worker to execute it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self._lock = threading.Lock()
+        # name -> [count, total wait, total run, max run]
+        self._stats: dict[str, list[float]] = {}
+
+    def run(self, queued: float, target: Callable[..., _T], *args: Any) -> _T:
+        """Run the job and record its latency."""
+        started = time.monotonic()
+        try:
+            return target(*args)
+        finally:
+            self.record(
+                getattr(target, "__name__", repr(target)),
+                started - queued,
+                time.monotonic() - started,
+            )
+
+    def record(self, name: str, wait: float, run: float) -> None:
+        """Record the latency of a job."""
+        with self._lock:
+            if (stats := self._stats.get(name)) is None:
+                stats = self._stats[name] = [0, 0.0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += wait
+            stats[2] += run
+            stats[3] = max(stats[3], run)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the latency in milliseconds per job name."""
+        with self._lock:
+            return {
+                name: {
+                    "count": int(count),
+                    "mean_wait_ms": round(total_wait / count * 1000, 3),
+                    "mean_run_ms": round(total_run / count * 1000, 3),
+                    "max_run_ms": round(max_run * 1000, 3),
+                }
+                for name, (count, total_wait, total_run, max_run) in sorted(
+                    self._stats.items()
+                )
+            }
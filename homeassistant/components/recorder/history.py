@@ -1,13 +1,15 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import groupby
 import logging
+from sys import intern
 import time
-from typing import Any, cast
+from typing import Any, Literal, Union, cast
 
 from sqlalchemy import Column, Text, and_, func, lambda_stmt, or_, select
 from sqlalchemy.engine.row import Row
@@ -21,9 +23,11 @@ from homeassistant.components.websocket_api.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
+from . import statistics
 from .filters import Filters
 from .models import (
     LazyState,
@@ -41,6 +45,24 @@ from .util import execute_stmt_lambda_element, session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# The states column is float64 when every state is numeric
+HistoryColumns = dict[str, Union["array[float]", list[str]]]
+
+# The statistics periods history is downsampled to, finest first
+DOWNSAMPLE_PERIODS: list[tuple[timedelta, Literal["5minute", "hour", "day"]]] = [
+    (timedelta(minutes=5), "5minute"),
+    (timedelta(hours=1), "hour"),
+    (timedelta(days=1), "day"),
+]
+STATISTICS_PERIOD_LENGTH: dict[str, timedelta] = {
+    "5minute": timedelta(minutes=5),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "month": timedelta(days=31),
+}
+# Windows where a point covers less than this are not downsampled
+RAW_HISTORY_RESOLUTION = timedelta(minutes=1)
+
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
 
@@ -167,7 +189,7 @@ def get_significant_states(
     compressed_state_format: bool = False,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return get_significant_states_with_session(
             hass,
             session,
@@ -331,6 +353,263 @@ def get_full_significant_states_with_session(
     )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, HistoryColumns]:
+    """Return the significant state changes as per-entity columns.
+
+    This is the columnar variant of a minimal response without attributes.
+    Each entity maps to {"s": states, "lu": timestamps} where the timestamps
+    are a float64 array and the states are a float64 array when every state
+    of the entity is numeric or a list of interned strings otherwise.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        stmt = _significant_states_stmt(
+            _schema_version(hass),
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+            True,
+        )
+        states = execute_stmt_lambda_element(
+            session, stmt, None if entity_ids else start_time, end_time
+        )
+        return _sorted_states_to_columns(
+            hass,
+            session,
+            states,
+            start_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+        )
+
+
+def downsample_period(
+    start_time: datetime, end_time: datetime, max_points: int
+) -> Literal["5minute", "hour", "day", "month"] | None:
+    """Return the statistics period which fits start_time-end_time in max_points.
+
+    Returns None if the window is short enough to return the states as is.
+    """
+    resolution = (end_time - start_time) / max_points
+    if resolution < RAW_HISTORY_RESOLUTION:
+        return None
+    for duration, period in DOWNSAMPLE_PERIODS:
+        if resolution <= duration:
+            return period
+    return "month"
+
+
+def get_significant_states_downsampled(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    max_points: int,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> dict[str, Any]:
+    """Return the history downsampled to about max_points per entity.
+
+    Entities with mean statistics are returned as buckets with the min, max and
+    mean of each statistics period, read from the statistics the recorder
+    already compiled instead of from the states. The newest bucket, which the
+    recorder has not compiled yet, is summarized from the states. Each entity
+    maps to {"start": timestamps, "mean": means, "min": mins, "max": maxes} in
+    the unit of its states.
+
+    Entities without statistics during the window or in a unit the statistics
+    can't be converted to, and all entities if the window is short or
+    entity_ids is omitted, are returned as significant states like
+    get_significant_states does.
+    """
+    if end_time is None:
+        end_time = dt_util.utcnow()
+    period = downsample_period(start_time, end_time, max_points)
+    # The short term statistics are purged with the states
+    short_term_retention = timedelta(days=recorder.get_instance(hass).keep_days)
+    if period == "5minute" and start_time < dt_util.utcnow() - short_term_retention:
+        period = "hour"
+    buckets: dict[str, dict[str, Any]] = {}
+    if period is not None and entity_ids:
+        statistic_ids = [
+            statistic["statistic_id"]
+            for statistic in statistics.list_statistic_ids(hass, entity_ids, "mean")
+        ]
+        if statistic_ids:
+            buckets = _statistics_buckets(
+                hass, start_time, end_time, statistic_ids, period
+            )
+
+    remaining_entity_ids = entity_ids
+    if entity_ids:
+        remaining_entity_ids = [i for i in entity_ids if i not in buckets]
+    states: MutableMapping[str, list[State | dict[str, Any]]] = {}
+    if remaining_entity_ids is None or remaining_entity_ids:
+        states = get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            remaining_entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return {"period": period if buckets else None, "buckets": buckets, "states": states}
+
+
+def _statistics_buckets(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime,
+    statistic_ids: list[str],
+    period: Literal["5minute", "hour", "day", "month"],
+) -> dict[str, dict[str, Any]]:
+    """Return the statistics of the entities as buckets in the unit of the states."""
+    stats = statistics.statistics_during_period(
+        hass, start_time, end_time, statistic_ids, period, True, convert_units=False
+    )
+    metadata = statistics.get_metadata(hass, statistic_ids=list(stats))
+    compiled_until = {
+        statistic_id: min(_as_datetime(rows[-1]["end"]), end_time)
+        for statistic_id, rows in stats.items()
+        if rows
+    }
+    if not compiled_until:
+        return {}
+    # The states are only known up until now
+    tail_end = min(end_time, dt_util.utcnow())
+    # The newest period, which was not compiled yet, is summarized from the
+    # states. It is at most one period long, so the states since statistics
+    # which stopped long ago are not loaded.
+    earliest_tail_start = tail_end - STATISTICS_PERIOD_LENGTH[period]
+    tail_starts = {
+        statistic_id: max(until, earliest_tail_start)
+        for statistic_id, until in compiled_until.items()
+    }
+    statistic_ids_by_tail_start: dict[datetime, list[str]] = defaultdict(list)
+    for statistic_id, tail_start in tail_starts.items():
+        statistic_ids_by_tail_start[tail_start].append(statistic_id)
+    # The states of the tail, and the state at its start to know the unit of
+    # the states
+    tail_states: MutableMapping[str, list[State | dict[str, Any]]] = {}
+    for tail_start, tail_statistic_ids in statistic_ids_by_tail_start.items():
+        tail_states.update(
+            get_significant_states(
+                hass,
+                tail_start,
+                tail_end,
+                tail_statistic_ids,
+                significant_changes_only=False,
+            )
+        )
+
+    buckets: dict[str, dict[str, Any]] = {}
+    for statistic_id, tail_start in tail_starts.items():
+        entity_states = cast(list[State], tail_states.get(statistic_id, []))
+        state_unit = next(
+            (
+                state.attributes[ATTR_UNIT_OF_MEASUREMENT]
+                for state in reversed(entity_states)
+                if ATTR_UNIT_OF_MEASUREMENT in state.attributes
+            ),
+            None,
+        )
+        convert = statistics.statistic_to_state_unit_converter(
+            metadata[statistic_id][1]["unit_of_measurement"], state_unit
+        )
+        if convert is None:
+            continue
+
+        rows = stats[statistic_id]
+        bucket: dict[str, Any] = {
+            "start": array(
+                "d", (_as_datetime(row["start"]).timestamp() for row in rows)
+            ),
+            "mean": [_convert_or_none(convert, row["mean"]) for row in rows],
+            "min": [_convert_or_none(convert, row["min"]) for row in rows],
+            "max": [_convert_or_none(convert, row["max"]) for row in rows],
+        }
+        if tail_start < tail_end and (
+            tail := _summarize_states(entity_states, tail_start, tail_end)
+        ):
+            bucket["start"].append(tail_start.timestamp())
+            for key, value in zip(("mean", "min", "max"), tail):
+                bucket[key].append(value)
+        buckets[statistic_id] = bucket
+    return buckets
+
+
+def _as_datetime(value: datetime | str) -> datetime:
+    """Return the start or end of a statistics row as a datetime."""
+    if isinstance(value, str):
+        return cast(datetime, dt_util.parse_datetime(value))
+    return value
+
+
+def _convert_or_none(
+    convert: Callable[[float], float], value: float | None
+) -> float | None:
+    """Convert a statistic if there is one."""
+    return convert(value) if value is not None else None
+
+
+def _summarize_states(
+    states: list[State], start_time: datetime, end_time: datetime
+) -> tuple[float, float, float] | None:
+    """Return the time weighted mean, min and max of numeric states in a window.
+
+    Returns None if none of the states in the window are numeric.
+    """
+    value: float | None = None
+    value_start = start_time
+    weighted_sum = duration = 0.0
+    minimum = maximum = None
+
+    def add_value(until: datetime) -> None:
+        """Add the current value up until a time."""
+        nonlocal weighted_sum, duration, minimum, maximum
+        if value is None or until <= value_start:
+            return
+        seconds = (until - value_start).total_seconds()
+        weighted_sum += value * seconds
+        duration += seconds
+        minimum = value if minimum is None else min(minimum, value)
+        maximum = value if maximum is None else max(maximum, value)
+
+    for state in states:
+        if state.last_updated >= end_time:
+            break
+        if state.last_updated > start_time:
+            add_value(state.last_updated)
+            value_start = state.last_updated
+        try:
+            value = float(state.state)
+        except ValueError:
+            value = None
+    add_value(end_time)
+
+    if minimum is None or maximum is None:
+        return None
+    return weighted_sum / duration, minimum, maximum
+
+
 def _state_changed_during_period_stmt(
     schema_version: int,
     start_time: datetime,
@@ -376,7 +655,7 @@ def state_changes_during_period(
     """Return states changes during UTC period start_time - end_time."""
     entity_id = entity_id.lower() if entity_id is not None else None
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         stmt = _state_changed_during_period_stmt(
             _schema_version(hass),
             start_time,
@@ -430,7 +709,7 @@ def get_last_state_changes(
     start_time = dt_util.utcnow()
     entity_id = entity_id.lower() if entity_id is not None else None
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         stmt = _get_last_state_changes_stmt(
             _schema_version(hass), number_of_states, entity_id
         )
@@ -721,3 +1000,93 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    hass: HomeAssistant,
+    session: Session,
+    states: Iterable[Row],
+    start_time: datetime,
+    entity_ids: list[str] | None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, HistoryColumns]:
+    """Convert SQL results into per-entity columns.
+
+    States must be sorted by entity_id and last_updated.
+
+    Unlike _sorted_states_to_dict no object is created per row, the
+    state and last_updated of every row are appended to the columns
+    of the entity and consecutive duplicate states are dropped.
+    """
+    result: dict[str, HistoryColumns] = {}
+    # Set all entity IDs to empty columns in result set to maintain the order
+    if entity_ids is not None:
+        for ent_id in entity_ids:
+            result[ent_id] = {}
+
+    initial_states: dict[str, Row] = {}
+    if include_start_time_state:
+        initial_states = {
+            row.entity_id: row
+            for row in _get_rows_with_session(
+                hass,
+                session,
+                start_time,
+                entity_ids,
+                filters=filters,
+                no_attributes=True,
+            )
+        }
+    start_timestamp = process_datetime_to_timestamp(start_time)
+
+    if entity_ids and len(entity_ids) == 1:
+        states_iter: Iterable[tuple[str | Column, Iterator[States]]] = (
+            (entity_ids[0], iter(states)),
+        )
+    else:
+        states_iter = groupby(states, lambda state: state.entity_id)
+
+    for ent_id, group in states_iter:
+        timestamps = array("d")
+        state_values: list[str] = []
+        prev_state: str | None = None
+        if row := initial_states.pop(ent_id, None):
+            prev_state = row.state
+            timestamps.append(start_timestamp)
+            state_values.append(row.state)
+
+        for row in group:
+            if (state := row.state) == prev_state:
+                continue
+            timestamps.append(process_datetime_to_timestamp(row.last_updated))
+            state_values.append(state)
+            prev_state = state
+
+        if state_values:
+            result[ent_id] = _history_columns(state_values, timestamps)
+
+    # If there are no states beyond the initial state,
+    # the state a was never popped from initial_states
+    for ent_id, row in initial_states.items():
+        result[ent_id] = _history_columns([row.state], array("d", [start_timestamp]))
+
+    # Filter out the entities without any states
+    return {key: val for key, val in result.items() if val}
+
+
+def _history_columns(
+    state_values: list[str], timestamps: array[float]
+) -> HistoryColumns:
+    """Return the columns of an entity with numeric states stored as float64."""
+    states: array[float] | list[str]
+    try:
+        states = array("d", map(float, state_values))
+    except (TypeError, ValueError):
+        states = [
+            intern(state) if state is not None else state for state in state_values
+        ]
+    return {
+        COMPRESSED_STATE_STATE: states,
+        COMPRESSED_STATE_LAST_UPDATED: timestamps,
+    }
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
-from datetime import datetime
+from datetime import datetime, timedelta
 from functools import partial
 from itertools import islice, zip_longest
 import logging
@@ -12,9 +12,10 @@ from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
 from homeassistant.const import EVENT_STATE_CHANGED
+import homeassistant.util.dt as dt_util
 
 from .const import MAX_ROWS_TO_PURGE, SupportedDialect
-from .models import Events, StateAttributes, States
+from .models import Events, StateAttributes, States, process_timestamp
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_sqlite,
@@ -22,17 +23,26 @@ from .queries import (
     data_ids_exist_in_events_sqlite,
     delete_event_data_rows,
     delete_event_rows,
+    delete_events_range,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
+    delete_states_range,
     delete_states_rows,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
+    disconnect_states_range,
     disconnect_states_rows,
+    find_attributes_ids_in_states_range,
+    find_data_ids_in_events_range,
+    find_events_range_to_purge,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_event,
+    find_oldest_state,
     find_short_term_statistics_to_purge,
+    find_states_range_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -47,6 +57,10 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# The id range of a day is purged in chunks of this many ids with a commit after
+# each chunk to keep the transactions small. The rows are still deleted one by
+# one, this is not a partition drop.
+PURGE_RANGE_CHUNK_SIZE = 10000
 
 
 def take(take_num: int, iterable: Iterable) -> list[Any]:
@@ -94,6 +108,16 @@ def purge_old_data(
             has_more_to_purge |= _purge_legacy_format(
                 instance, session, purge_before, using_sqlite
             )
+        elif instance.purge_id_ranges:
+            _LOGGER.debug(
+                "Purge running by id range as there are NO legacy rows remaining"
+            )
+            has_more_to_purge |= _purge_oldest_day_of_states(
+                instance, session, purge_before, using_sqlite
+            )
+            has_more_to_purge |= _purge_oldest_day_of_events(
+                instance, session, purge_before, using_sqlite
+            )
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id remaining"
@@ -225,6 +249,147 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _end_of_oldest_day(oldest: datetime | None, purge_before: datetime) -> datetime:
+    """Return the end of the day of the oldest row, capped to purge_before."""
+    if oldest is None or (oldest := process_timestamp(oldest)) >= purge_before:
+        return purge_before
+    day_end = dt_util.start_of_local_day(dt_util.as_local(oldest)) + timedelta(days=1)
+    return min(dt_util.as_utc(day_end), purge_before)
+
+
+def _purge_oldest_day_of_states(
+    instance: Recorder, session: Session, purge_before: datetime, using_sqlite: bool
+) -> bool:
+    """Purge the oldest day of states and the attributes only it uses.
+
+    The states of a day are a contiguous range of state_ids since the ids
+    increase with time, so the day is deleted by its primary key range instead
+    of selecting the ids to delete. The range is deleted in chunks of
+    PURGE_RANGE_CHUNK_SIZE ids which are committed one at a time.
+
+    Returns true if there are more states to purge.
+    """
+    oldest = session.execute(find_oldest_state()).scalar()
+    day_end = _end_of_oldest_day(oldest, purge_before)
+    first_state_id, last_state_id = session.execute(
+        find_states_range_to_purge(day_end)
+    ).one()
+    if first_state_id is None:
+        return False
+
+    for chunk_first_id, chunk_last_id in _chunked_id_range(
+        first_state_id, last_state_id
+    ):
+        _purge_states_range(
+            instance, session, chunk_first_id, chunk_last_id, day_end, using_sqlite
+        )
+        session.commit()
+    return True
+
+
+def _purge_states_range(
+    instance: Recorder,
+    session: Session,
+    first_state_id: int,
+    last_state_id: int,
+    purge_before: datetime,
+    using_sqlite: bool,
+) -> None:
+    """Purge a range of states and the attributes only they use."""
+    attributes_ids = {
+        attributes_id
+        for attributes_id, in session.execute(
+            find_attributes_ids_in_states_range(
+                first_state_id, last_state_id, purge_before
+            )
+        )
+        if attributes_id is not None
+    }
+    # Update old_state_id to NULL before deleting, see _purge_state_ids
+    disconnected_rows = session.execute(
+        disconnect_states_range(first_state_id, last_state_id, purge_before)
+    )
+    _LOGGER.debug(
+        "Updated %s states to remove old_state_id", disconnected_rows.rowcount
+    )
+    deleted_rows = session.execute(
+        delete_states_range(first_state_id, last_state_id, purge_before)
+    )
+    _LOGGER.debug(
+        "Deleted %s states with ids %s to %s before %s",
+        deleted_rows.rowcount,
+        first_state_id,
+        last_state_id,
+        purge_before.isoformat(),
+    )
+    _evict_purged_state_range_from_old_states_cache(
+        instance, first_state_id, last_state_id, purge_before
+    )
+    _purge_unused_attributes_ids(instance, session, attributes_ids, using_sqlite)
+
+
+def _purge_oldest_day_of_events(
+    instance: Recorder, session: Session, purge_before: datetime, using_sqlite: bool
+) -> bool:
+    """Purge the oldest day of events and the event data only it uses.
+
+    See _purge_oldest_day_of_states.
+
+    Returns true if there are more events to purge.
+    """
+    oldest = session.execute(find_oldest_event()).scalar()
+    day_end = _end_of_oldest_day(oldest, purge_before)
+    first_event_id, last_event_id = session.execute(
+        find_events_range_to_purge(day_end)
+    ).one()
+    if first_event_id is None:
+        return False
+
+    for chunk_first_id, chunk_last_id in _chunked_id_range(
+        first_event_id, last_event_id
+    ):
+        _purge_events_range(
+            instance, session, chunk_first_id, chunk_last_id, day_end, using_sqlite
+        )
+        session.commit()
+    return True
+
+
+def _purge_events_range(
+    instance: Recorder,
+    session: Session,
+    first_event_id: int,
+    last_event_id: int,
+    purge_before: datetime,
+    using_sqlite: bool,
+) -> None:
+    """Purge a range of events and the event data only they use."""
+    data_ids = {
+        data_id
+        for data_id, in session.execute(
+            find_data_ids_in_events_range(first_event_id, last_event_id, purge_before)
+        )
+        if data_id is not None
+    }
+    deleted_rows = session.execute(
+        delete_events_range(first_event_id, last_event_id, purge_before)
+    )
+    _LOGGER.debug(
+        "Deleted %s events with ids %s to %s before %s",
+        deleted_rows.rowcount,
+        first_event_id,
+        last_event_id,
+        purge_before.isoformat(),
+    )
+    _purge_unused_data_ids(instance, session, data_ids, using_sqlite)
+
+
+def _chunked_id_range(first_id: int, last_id: int) -> Iterable[tuple[int, int]]:
+    """Split an id range into ranges of at most PURGE_RANGE_CHUNK_SIZE ids."""
+    for chunk_first_id in range(first_id, last_id + 1, PURGE_RANGE_CHUNK_SIZE):
+        yield chunk_first_id, min(chunk_first_id + PURGE_RANGE_CHUNK_SIZE - 1, last_id)
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime
 ) -> tuple[set[int], set[int]]:
@@ -470,41 +635,18 @@ def _evict_purged_states_from_old_states_cache(
         old_states.pop(old_state_reversed[purged_state_id], None)
 
 
-def _evict_purged_data_from_data_cache(
-    instance: Recorder, purged_data_ids: set[int]
-) -> None:
-    """Evict purged data ids from the data ids cache."""
-    # Make a map from data_id to the data json
-    event_data_ids = instance._event_data_ids  # pylint: disable=protected-access
-    event_data_ids_reversed = {
-        data_id: data for data, data_id in event_data_ids.items()
-    }
-
-    # Evict any purged data from the event_data_ids cache
-    for purged_attribute_id in purged_data_ids.intersection(event_data_ids_reversed):
-        event_data_ids.pop(event_data_ids_reversed[purged_attribute_id], None)
-
-
-def _evict_purged_attributes_from_attributes_cache(
-    instance: Recorder, purged_attributes_ids: set[int]
+def _evict_purged_state_range_from_old_states_cache(
+    instance: Recorder, first_state_id: int, last_state_id: int, purge_before: datetime
 ) -> None:
-    """Evict purged attribute ids from the attribute ids cache."""
-    # Make a map from attributes_id to the attributes json
-    state_attributes_ids = (
-        instance._state_attributes_ids  # pylint: disable=protected-access
-    )
-    state_attributes_ids_reversed = {
-        attributes_id: attributes
-        for attributes, attributes_id in state_attributes_ids.items()
-    }
-
-    # Evict any purged attributes from the state_attributes_ids cache
-    for purged_attribute_id in purged_attributes_ids.intersection(
-        state_attributes_ids_reversed
-    ):
-        state_attributes_ids.pop(
-            state_attributes_ids_reversed[purged_attribute_id], None
-        )
+    """Evict a purged range of states from the old states cache."""
+    old_states = instance._old_states  # pylint: disable=protected-access
+    for entity_id, old_state in list(old_states.items()):
+        if (
+            old_state.state_id
+            and first_state_id <= old_state.state_id <= last_state_id
+            and old_state.last_updated < purge_before
+        ):
+            old_states.pop(entity_id)
 
 
 def _purge_batch_attributes_ids(
@@ -518,7 +660,9 @@ def _purge_batch_attributes_ids(
         _LOGGER.debug("Deleted %s attribute states", deleted_rows)
 
     # Evict any entries in the state_attributes_ids cache referring to a purged state
-    _evict_purged_attributes_from_attributes_cache(instance, attributes_ids)
+    instance._state_attributes_ids.evict_ids(  # pylint: disable=protected-access
+        attributes_ids
+    )
 
 
 def _purge_batch_data_ids(
@@ -530,7 +674,7 @@ def _purge_batch_data_ids(
         _LOGGER.debug("Deleted %s data events", deleted_rows)
 
     # Evict any entries in the event_data_ids cache referring to a purged state
-    _evict_purged_data_from_data_cache(instance, data_ids)
+    instance._event_data_ids.evict_ids(data_ids)  # pylint: disable=protected-access
 
 
 def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None:
@@ -652,7 +796,7 @@ def _purge_filtered_events(
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
     if EVENT_STATE_CHANGED in excluded_event_types:
         session.query(StateAttributes).delete(synchronize_session=False)
-        instance._state_attributes_ids = {}  # pylint: disable=protected-access
+        instance._state_attributes_ids.clear()  # pylint: disable=protected-access
 
 
 @retryable_database_job("purge")
@@ -4,7 +4,17 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    delete,
+    distinct,
+    func,
+    lambda_stmt,
+    select,
+    text,
+    union_all,
+    update,
+)
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -40,6 +50,63 @@ def find_shared_data_id(attr_hash: int, shared_data: str) -> StatementLambdaElem
     )
 
 
+def find_recent_shared_attributes(limit: int) -> Select:
+    """Find the shared attributes used by the most recent states."""
+    recent_states = (
+        select(States.attributes_id)
+        .order_by(States.state_id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    return select(StateAttributes.attributes_id, StateAttributes.shared_attrs).filter(
+        StateAttributes.attributes_id.in_(select(recent_states.c.attributes_id))
+    )
+
+
+def find_recent_shared_data(limit: int) -> Select:
+    """Find the shared data used by the most recent events."""
+    recent_events = (
+        select(Events.data_id).order_by(Events.event_id.desc()).limit(limit).subquery()
+    )
+    return select(EventData.data_id, EventData.shared_data).filter(
+        EventData.data_id.in_(select(recent_events.c.data_id))
+    )
+
+
+def find_max_ids() -> StatementLambdaElement:
+    """Find the max event_id, data_id, state_id and attributes_id."""
+    return lambda_stmt(
+        lambda: select(
+            select(func.max(Events.event_id)).scalar_subquery(),
+            select(func.max(EventData.data_id)).scalar_subquery(),
+            select(func.max(States.state_id)).scalar_subquery(),
+            select(func.max(StateAttributes.attributes_id)).scalar_subquery(),
+        )
+    )
+
+
+def sync_postgresql_sequences(
+    event_id: int, data_id: int, state_id: int, attributes_id: int
+) -> TextClause:
+    """Move the PostgreSQL sequences past ids that were assigned by the recorder."""
+    return text(
+        "SELECT "
+        "setval(pg_get_serial_sequence('events', 'event_id'), "
+        "GREATEST(:event_id, 1), :event_id > 0), "
+        "setval(pg_get_serial_sequence('event_data', 'data_id'), "
+        "GREATEST(:data_id, 1), :data_id > 0), "
+        "setval(pg_get_serial_sequence('states', 'state_id'), "
+        "GREATEST(:state_id, 1), :state_id > 0), "
+        "setval(pg_get_serial_sequence('state_attributes', 'attributes_id'), "
+        "GREATEST(:attributes_id, 1), :attributes_id > 0)"
+    ).bindparams(
+        event_id=event_id,
+        data_id=data_id,
+        state_id=state_id,
+        attributes_id=attributes_id,
+    )
+
+
 def _state_attrs_exist(attr: int | None) -> Select:
     """Check if a state attributes id exists in the states table."""
     return select(func.min(States.attributes_id)).where(States.attributes_id == attr)
@@ -596,6 +663,107 @@ def find_states_to_purge(purge_before: datetime) -> StatementLambdaElement:
     )
 
 
+def find_oldest_state() -> StatementLambdaElement:
+    """Find the last_updated of the oldest state."""
+    return lambda_stmt(lambda: select(func.min(States.last_updated)))
+
+
+def find_oldest_event() -> StatementLambdaElement:
+    """Find the time_fired of the oldest event."""
+    return lambda_stmt(lambda: select(func.min(Events.time_fired)))
+
+
+def find_states_range_to_purge(purge_before: datetime) -> StatementLambdaElement:
+    """Find the range of state_ids to purge."""
+    return lambda_stmt(
+        lambda: select(func.min(States.state_id), func.max(States.state_id)).filter(
+            States.last_updated < purge_before
+        )
+    )
+
+
+def find_events_range_to_purge(purge_before: datetime) -> StatementLambdaElement:
+    """Find the range of event_ids to purge."""
+    return lambda_stmt(
+        lambda: select(func.min(Events.event_id), func.max(Events.event_id)).filter(
+            Events.time_fired < purge_before
+        )
+    )
+
+
+def find_attributes_ids_in_states_range(
+    first_state_id: int, last_state_id: int, purge_before: datetime
+) -> StatementLambdaElement:
+    """Find the attributes_ids used by a range of states to purge."""
+    return lambda_stmt(
+        lambda: select(distinct(States.attributes_id))
+        .filter(States.state_id >= first_state_id)
+        .filter(States.state_id <= last_state_id)
+        .filter(States.last_updated < purge_before)
+    )
+
+
+def find_data_ids_in_events_range(
+    first_event_id: int, last_event_id: int, purge_before: datetime
+) -> StatementLambdaElement:
+    """Find the data_ids used by a range of events to purge."""
+    return lambda_stmt(
+        lambda: select(distinct(Events.data_id))
+        .filter(Events.event_id >= first_event_id)
+        .filter(Events.event_id <= last_event_id)
+        .filter(Events.time_fired < purge_before)
+    )
+
+
+def disconnect_states_range(
+    first_state_id: int, last_state_id: int, purge_before: datetime
+) -> StatementLambdaElement:
+    """Disconnect the states referring to a range of states to purge."""
+    # The ids are selected from a derived table since MySQL does not allow
+    # selecting from the table that is updated in a subquery
+    purged_state_ids = (
+        select(States.state_id)
+        .filter(States.state_id >= first_state_id)
+        .filter(States.state_id <= last_state_id)
+        .filter(States.last_updated < purge_before)
+        .subquery()
+    )
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.old_state_id >= first_state_id)
+        .where(States.old_state_id <= last_state_id)
+        .where(States.old_state_id.in_(select(purged_state_ids.c.state_id)))
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_range(
+    first_state_id: int, last_state_id: int, purge_before: datetime
+) -> StatementLambdaElement:
+    """Delete a range of states rows."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.state_id >= first_state_id)
+        .where(States.state_id <= last_state_id)
+        .where(States.last_updated < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_events_range(
+    first_event_id: int, last_event_id: int, purge_before: datetime
+) -> StatementLambdaElement:
+    """Delete a range of events rows."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.event_id >= first_event_id)
+        .where(Events.event_id <= last_event_id)
+        .where(Events.time_fired < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime,
 ) -> StatementLambdaElement:
@@ -23,6 +23,11 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
 from homeassistant.const import (
+    ENERGY_KILO_WATT_HOUR,
+    ENERGY_MEGA_WATT_HOUR,
+    ENERGY_WATT_HOUR,
+    POWER_KILO_WATT,
+    POWER_WATT,
     PRESSURE_PA,
     TEMP_CELSIUS,
     VOLUME_CUBIC_FEET,
@@ -148,6 +153,17 @@ STATISTIC_UNIT_TO_DISPLAY_UNIT_CONVERSIONS = {
     else None,
 }
 
+# Convert energy and power statistics from the normalized unit used for statistics
+# to the unit of the states they were compiled from
+STATISTIC_UNIT_TO_STATE_UNIT_FACTORS: dict[str, dict[str, float]] = {
+    ENERGY_KILO_WATT_HOUR: {
+        ENERGY_KILO_WATT_HOUR: 1,
+        ENERGY_MEGA_WATT_HOUR: 1 / 1000,
+        ENERGY_WATT_HOUR: 1000,
+    },
+    POWER_WATT: {POWER_WATT: 1, POWER_KILO_WATT: 1 / 1000},
+}
+
 # Convert volume statistics from the display unit configured by the user
 # to the normalized unit used for statistics
 # This is used to support adjusting statistics in the display unit
@@ -170,6 +186,69 @@ class PlatformCompiledStatistics:
     current_metadata: dict[str, tuple[int, StatisticMetaData]]
 
 
+class HourlyStatisticsAccumulator:
+    """Keep the 5-minute statistics compiled during the current hour in memory.
+
+    When every 5-minute period of the hour was compiled by the recorder, the
+    hourly statistics are summarized from memory instead of re-aggregating
+    the short term statistics table.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        self._hour_start: datetime | None = None
+        self._periods: dict[datetime, dict[int, StatisticData]] = {}
+
+    def add_period(self, start: datetime, stats: dict[int, StatisticData]) -> None:
+        """Add the statistics of a 5-minute period keyed by metadata_id."""
+        hour_start = start.replace(minute=0)
+        if hour_start != self._hour_start:
+            self._hour_start = hour_start
+            self._periods = {}
+        self._periods[start] = stats
+
+    def reset(self) -> None:
+        """Forget the accumulated statistics after the database was changed."""
+        self._hour_start = None
+        self._periods = {}
+
+    def summary(self, start_time: datetime) -> dict[int, StatisticData] | None:
+        """Summarize the hour starting at start_time.
+
+        Returns None if not all 5-minute periods of the hour were accumulated.
+        """
+        if start_time != self._hour_start or len(self._periods) != 12:
+            return None
+
+        # Mirror QUERY_STATISTICS_SUMMARY_MEAN and QUERY_STATISTICS_SUMMARY_SUM:
+        # aggregates skip missing values and the sum is taken from the last period
+        by_metadata_id: dict[int, list[StatisticData]] = defaultdict(list)
+        for _, stats in sorted(self._periods.items()):
+            for metadata_id, stat in stats.items():
+                by_metadata_id[metadata_id].append(stat)
+
+        summary: dict[int, StatisticData] = {}
+        for metadata_id, period_stats in by_metadata_id.items():
+            means = [
+                stat["mean"] for stat in period_stats if stat.get("mean") is not None
+            ]
+            mins = [stat["min"] for stat in period_stats if stat.get("min") is not None]
+            maxes = [
+                stat["max"] for stat in period_stats if stat.get("max") is not None
+            ]
+            last = period_stats[-1]
+            summary[metadata_id] = {
+                "start": start_time,
+                "mean": sum(means) / len(means) if means else None,
+                "min": min(mins) if mins else None,
+                "max": max(maxes) if maxes else None,
+                "last_reset": process_timestamp(last.get("last_reset")),
+                "state": last.get("state"),
+                "sum": last.get("sum"),
+            }
+        return summary
+
+
 def split_statistic_id(entity_id: str) -> list[str]:
     """Split a state entity ID into domain and object ID."""
     return entity_id.split(":", 1)
@@ -506,6 +585,11 @@ def compile_hourly_statistics(
     start_time = start.replace(minute=0)
     end_time = start_time + timedelta(hours=1)
 
+    if (accumulated := instance.hourly_statistics.summary(start_time)) is not None:
+        for metadata_id, stat in accumulated.items():
+            session.add(Statistics.from_stats(metadata_id, stat))
+        return
+
     # Compute last hour's average, min, max
     summary: dict[str, StatisticData] = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time, end_time)
@@ -595,9 +679,21 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
         current_metadata.update(compiled.current_metadata)
 
     # Insert collected statistics in the database
+    short_term_statistics: dict[int, StatisticData] = {}
+    inserted = True
+    filter_unique_constraint_integrity_error = (
+        _filter_unique_constraint_integrity_error(instance)
+    )
+
+    def _exception_filter(err: Exception) -> bool:
+        """Don't accumulate the statistics if they were not inserted."""
+        nonlocal inserted
+        inserted = False
+        return filter_unique_constraint_integrity_error(err)
+
     with session_scope(
         session=instance.get_session(),
-        exception_filter=_filter_unique_constraint_integrity_error(instance),
+        exception_filter=_exception_filter,
     ) as session:
         for stats in platform_stats:
             metadata_id = _update_or_add_metadata(
@@ -609,13 +705,20 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
                 metadata_id,
                 stats["stat"],
             )
+            short_term_statistics[metadata_id] = stats["stat"]
 
         if start.minute == 55:
-            # A full hour is ready, summarize it
+            # A full hour is ready, summarize it including this period
+            instance.hourly_statistics.add_period(start, short_term_statistics)
             compile_hourly_statistics(instance, session, start)
 
         session.add(StatisticsRuns(start=start))
 
+    if inserted:
+        instance.hourly_statistics.add_period(start, short_term_statistics)
+    else:
+        instance.hourly_statistics.reset()
+
     return True
 
 
@@ -784,8 +887,32 @@ def _configured_unit(unit: str | None, units: UnitSystem) -> str | None:
     return unit
 
 
+def statistic_to_state_unit_converter(
+    statistic_unit: str | None, state_unit: str | None
+) -> Callable[[float], float] | None:
+    """Return a function converting statistics to the unit of their states.
+
+    Returns None if the statistics can't be converted to the unit.
+    """
+    if statistic_unit == state_unit:
+        return lambda x: x
+    if state_unit is None:
+        return None
+    factors = STATISTIC_UNIT_TO_STATE_UNIT_FACTORS.get(statistic_unit or "", {})
+    if (factor := factors.get(state_unit)) is not None:
+        return lambda x: x * factor
+    if statistic_unit == PRESSURE_PA and state_unit in pressure_util.VALID_UNITS:
+        return lambda x: pressure_util.convert(x, PRESSURE_PA, state_unit)
+    if statistic_unit == TEMP_CELSIUS and state_unit in temperature_util.VALID_UNITS:
+        return lambda x: temperature_util.convert(x, TEMP_CELSIUS, state_unit)
+    if statistic_unit == VOLUME_CUBIC_METERS and state_unit in volume_util.VALID_UNITS:
+        return lambda x: volume_util.convert(x, VOLUME_CUBIC_METERS, state_unit)
+    return None
+
+
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
+    instance.hourly_statistics.reset()
     with session_scope(session=instance.get_session()) as session:
         session.query(StatisticsMeta).filter(
             StatisticsMeta.statistic_id.in_(statistic_ids)
@@ -830,7 +957,7 @@ def list_statistic_ids(
     result = {}
 
     # Query the database
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         metadata = get_metadata_with_session(
             hass, session, statistic_type=statistic_type, statistic_ids=statistic_ids
         )
@@ -1016,14 +1143,17 @@ def statistics_during_period(
     statistic_ids: list[str] | None = None,
     period: Literal["5minute", "day", "hour", "month"] = "hour",
     start_time_as_datetime: bool = False,
+    convert_units: bool = True,
 ) -> dict[str, list[dict[str, Any]]]:
     """Return statistics during UTC period start_time - end_time for the statistic_ids.
 
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
+    If convert_units is False, the statistics are in the unit of their metadata
+    instead of the unit configured by the user.
     """
     metadata = None
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         # Fetch metadata for the given (or all) statistic_ids
         metadata = get_metadata_with_session(hass, session, statistic_ids=statistic_ids)
         if not metadata:
@@ -1053,14 +1183,22 @@ def statistics_during_period(
                 stats,
                 statistic_ids,
                 metadata,
-                True,
+                convert_units,
                 table,
                 start_time,
                 start_time_as_datetime,
             )
 
         result = _sorted_statistics_to_dict(
-            hass, session, stats, statistic_ids, metadata, True, table, start_time, True
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            convert_units,
+            table,
+            start_time,
+            True,
         )
 
         if period == "day":
@@ -1437,7 +1575,7 @@ def adjust_statistics(
     sum_adjustment: float,
 ) -> bool:
     """Process an add_statistics job."""
-
+    instance.hourly_statistics.reset()
     with session_scope(session=instance.get_session()) as session:
         metadata = get_metadata_with_session(
             instance.hass, session, statistic_ids=(statistic_id,)
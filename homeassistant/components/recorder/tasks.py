@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 import threading
 from typing import TYPE_CHECKING, Any
 
@@ -253,6 +254,10 @@ class AddRecorderPlatformTask(RecorderTask):
         platforms[domain] = platform
         if hasattr(self.platform, "exclude_attributes"):
             hass.data[EXCLUDE_ATTRIBUTES][domain] = platform.exclude_attributes(hass)
+        if hasattr(self.platform, "state_recorded"):
+            instance.state_recorded_listeners[domain] = partial(
+                platform.state_recorded, hass
+            )
 
 
 @dataclass
@@ -28,6 +28,8 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_cache_info)
+    websocket_api.async_register_command(hass, ws_read_query_info)
     websocket_api.async_register_command(hass, ws_backup_start)
     websocket_api.async_register_command(hass, ws_backup_end)
     websocket_api.async_register_command(hass, ws_adjust_sum_statistics)
@@ -83,7 +85,7 @@ async def ws_get_statistics_metadata(
 ) -> None:
     """Get metadata for a list of statistic_ids."""
     instance: Recorder = hass.data[DATA_INSTANCE]
-    statistic_ids = await instance.async_add_executor_job(
+    statistic_ids = await instance.async_add_read_executor_job(
         list_statistic_ids, hass, msg.get("statistic_ids")
     )
     connection.send_result(msg["id"], statistic_ids)
@@ -163,6 +165,34 @@ def ws_info(
     connection.send_result(msg["id"], recorder_info)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/cache_info",
+    }
+)
+@callback
+def ws_cache_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the statistics of the recorder shared id caches."""
+    instance: Recorder = hass.data[DATA_INSTANCE]
+    connection.send_result(msg["id"], instance.async_cache_info())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/read_query_info",
+    }
+)
+@callback
+def ws_read_query_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the read only pool and the latency of its queries."""
+    instance: Recorder = hass.data[DATA_INSTANCE]
+    connection.send_result(msg["id"], instance.async_read_query_info())
+
+
 @websocket_api.ws_require_user(only_supervisor=True)
 @websocket_api.websocket_command({vol.Required("type"): "backup/start"})
 @websocket_api.async_response
@@ -277,6 +277,10 @@ class SensorEntity(Entity):
     # Temporary private attribute to track if deprecation has been logged.
     __datetime_as_string_deprecation_logged = False
 
+    # The device class can be cached between state writes, the unit of
+    # measurement depends on the configured unit system and sensor options
+    _static_state_properties = frozenset({"device_class"})
+
     async def async_internal_added_to_hass(self) -> None:
         """Call when the sensor entity is added to hass."""
         await super().async_internal_added_to_hass()
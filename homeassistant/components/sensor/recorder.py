@@ -44,7 +44,7 @@ from homeassistant.const import (
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
@@ -127,6 +127,84 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Keep track of the recorded sensor states to compile statistics from memory
+RECORDED_STATES = "sensor_recorded_states"
+
+
+class RecordedStates:
+    """The sensor states recorded since the previous statistics period.
+
+    The recorder feeds every recorded sensor state from its thread, which is
+    also where statistics are compiled, so the history of a statistics period
+    which started after the tracking started is known without querying the
+    states table. The first state of each sensor is seeded with the old state
+    of its first state_changed event.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the recorded states."""
+        self.tracking_since = dt_util.utcnow()
+        self._states: dict[str, list[State]] = {}
+
+    def add(self, event: Event) -> None:
+        """Add the new state of a recorded state_changed event."""
+        entity_id: str = event.data["entity_id"]
+        if (new_state := event.data.get("new_state")) is None:
+            self._states.pop(entity_id, None)
+            return
+        if (states := self._states.get(entity_id)) is None:
+            old_state: State | None = event.data.get("old_state")
+            states = self._states[entity_id] = [old_state] if old_state else []
+        states.append(new_state)
+
+    def history(
+        self,
+        current_state: State,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        significant_changes_only: bool,
+    ) -> list[State] | None:
+        """Return the states during start-end like the history query does.
+
+        Returns None if the history is not known.
+        """
+        if (states := self._states.get(current_state.entity_id)) is None:
+            # The sensor has not changed since the tracking started
+            if current_state.last_updated < start:
+                return [current_state]
+            return None
+
+        start_state: State | None = None
+        entity_history: list[State] = []
+        for state in states:
+            if state.last_updated < start:
+                start_state = state
+            elif state.last_updated < end and (
+                not significant_changes_only or state.last_changed == state.last_updated
+            ):
+                entity_history.append(state)
+        if start_state is not None:
+            entity_history.insert(0, start_state)
+        return entity_history or [current_state]
+
+    def prune(self, start: datetime.datetime) -> None:
+        """Drop the states before start except the state at start."""
+        for entity_id, states in self._states.items():
+            idx = 0
+            while idx + 1 < len(states) and states[idx + 1].last_updated < start:
+                idx += 1
+            if idx:
+                self._states[entity_id] = states[idx:]
+
+
+def state_recorded(hass: HomeAssistant, event: Event) -> None:
+    """Keep a recorded sensor state to compile statistics from memory.
+
+    Note: This is called from the recorder thread
+    """
+    if (recorded_states := hass.data.get(RECORDED_STATES)) is None:
+        recorded_states = hass.data[RECORDED_STATES] = RecordedStates()
+    recorded_states.add(event)
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -412,34 +490,50 @@ def _compile_statistics(  # noqa: C901
         hass, session, statistic_ids=[i.entity_id for i in sensor_states]
     )
 
-    # Get history between start and end
+    # Get history between start and end, from memory if the states were tracked
+    history_list: MutableMapping[str, list[State]] = {}
+    recorded_states: RecordedStates | None = hass.data.get(RECORDED_STATES)
+    if recorded_states is not None and start >= recorded_states.tracking_since:
+        for _state in sensor_states:
+            entity_history = recorded_states.history(
+                _state, start, end, "sum" not in wanted_statistics[_state.entity_id]
+            )
+            if entity_history is not None:
+                history_list[_state.entity_id] = entity_history
+        recorded_states.prune(start)
+
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in history_list
     ]
-    history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            )
         )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in history_list
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+            )
         )
-        history_list = {**history_list, **_history_list}
     # If there are no recent state changes, the sensor's state may already be pruned
     # from the recorder. Get the state from the state machine instead.
     for _state in sensor_states:
@@ -6,12 +6,17 @@ from typing import Final, cast
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
 from . import commands, connection, const, decorators, http, messages  # noqa: F401
 from .connection import ActiveConnection, current_connection  # noqa: F401
 from .const import (  # noqa: F401
+    CONF_COMPRESSION_LEVEL,
+    CONF_COMPRESSION_THRESHOLD,
+    DEFAULT_COMPRESSION_LEVEL,
+    DEFAULT_COMPRESSION_THRESHOLD,
     ERR_HOME_ASSISTANT_ERROR,
     ERR_INVALID_FORMAT,
     ERR_NOT_FOUND,
@@ -41,6 +46,22 @@ DOMAIN: Final = const.DOMAIN
 
 DEPENDENCIES: Final[tuple[str]] = ("http",)
 
+CONFIG_SCHEMA: Final = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(
+                    CONF_COMPRESSION_LEVEL, default=DEFAULT_COMPRESSION_LEVEL
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=9)),
+                vol.Optional(
+                    CONF_COMPRESSION_THRESHOLD, default=DEFAULT_COMPRESSION_THRESHOLD
+                ): cv.positive_int,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 @bind_hass
 @callback
@@ -65,6 +86,12 @@ def async_register_command(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the websocket API."""
-    hass.http.register_view(http.WebsocketAPIView())
+    conf = config.get(DOMAIN, {})
+    hass.http.register_view(
+        http.WebsocketAPIView(
+            conf.get(CONF_COMPRESSION_LEVEL, DEFAULT_COMPRESSION_LEVEL),
+            conf.get(CONF_COMPRESSION_THRESHOLD, DEFAULT_COMPRESSION_THRESHOLD),
+        )
+    )
     commands.async_register_commands(hass, async_register_command)
     return True
@@ -32,7 +32,11 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+    async_get_setup_trace,
+)
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -50,6 +54,7 @@ def async_register_commands(
 ) -> None:
     """Register commands."""
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_connection_stats)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
@@ -58,6 +63,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -236,35 +242,24 @@ def handle_get_states(
     """Handle get states command."""
     states = _async_get_allowed_states(hass, connection)
 
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.result_message(msg["id"], states)
-    try:
-        connection.send_message(const.JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
-        connection.logger.error(
-            "Unable to serialize to JSON. Bad data found at %s",
-            format_unserializable_data(
-                find_paths_unserializable_data(response, dump=const.JSON_DUMP)
-            ),
-        )
-    del response
-
-    # If we can't serialize, we'll filter out unserializable states
-    serialized = []
+    # The JSON of each state is cached on the state, so connecting clients
+    # share it. States that can't be serialized are left out, this command
+    # is required to succeed for the UI to show.
+    serialized_states = []
     for state in states:
         try:
-            serialized.append(const.JSON_DUMP(state))
+            serialized_states.append(state.as_dict_json())
         except (ValueError, TypeError):
-            # Error is already logged above
-            pass
+            connection.logger.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(state, dump=const.JSON_DUMP)
+                ),
+            )
 
-    # We now have partially serialized states. Craft some JSON.
-    response2 = const.JSON_DUMP(messages.result_message(msg["id"], ["TO_REPLACE"]))
-    response2 = response2.replace('"TO_REPLACE"', ", ".join(serialized))
-    connection.send_message(response2)
+    connection.send_message(
+        messages.construct_result_message(msg["id"], f'[{",".join(serialized_states)}]')
+    )
 
 
 @callback
@@ -281,63 +276,63 @@ def handle_subscribe_entities(
     entity_ids = set(msg.get("entity_ids", []))
 
     @callback
-    def forward_entity_changes(event: Event) -> None:
-        """Forward entity state changed events to websocket."""
-        if not connection.user.permissions.check_entity(
-            event.data["entity_id"], POLICY_READ
-        ):
+    def forward_entity_changes(events: list[Event]) -> None:
+        """Forward a batch of entity state changed events to websocket."""
+        check_entity = connection.user.permissions.check_entity
+        forward_events = tuple(
+            event
+            for event in events
+            if check_entity(event.data["entity_id"], POLICY_READ)
+            and (not entity_ids or event.data["entity_id"] in entity_ids)
+        )
+        if not forward_events:
             return
-        if entity_ids and event.data["entity_id"] not in entity_ids:
+
+        if len(forward_events) == 1:
+            event = forward_events[0]
+            connection.send_message(
+                lambda: messages.cached_state_diff_message(msg["id"], event)
+            )
             return
 
         connection.send_message(
-            lambda: messages.cached_state_diff_message(msg["id"], event)
+            lambda: messages.cached_state_diff_batch_message(msg["id"], forward_events)
         )
 
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED, forward_entity_changes, run_immediately=True
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen_batch(
+        EVENT_STATE_CHANGED, forward_entity_changes
     )
     connection.send_result(msg["id"])
-    data: dict[str, dict[str, dict]] = {
-        messages.ENTITY_EVENT_ADD: {
-            state.entity_id: messages.compressed_state_dict_add(state)
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
-        }
-    }
-
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.event_message(msg["id"], data)
-    try:
-        connection.send_message(const.JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
-        connection.logger.error(
-            "Unable to serialize to JSON. Bad data found at %s",
-            format_unserializable_data(
-                find_paths_unserializable_data(response, dump=const.JSON_DUMP)
-            ),
-        )
-    del response
 
-    add_entities = data[messages.ENTITY_EVENT_ADD]
-    cannot_serialize: list[str] = []
-    for entity_id, state_dict in add_entities.items():
+    # The JSON of each compressed state is cached on the state, so connecting
+    # clients share it. States that can't be serialized are left out.
+    serialized_states = []
+    for state in states:
+        if entity_ids and state.entity_id not in entity_ids:
+            continue
         try:
-            const.JSON_DUMP(state_dict)
+            serialized_states.append(state.as_compressed_state_json())
         except (ValueError, TypeError):
-            cannot_serialize.append(entity_id)
-
-    for entity_id in cannot_serialize:
-        del add_entities[entity_id]
+            connection.logger.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(
+                        {state.entity_id: state.as_compressed_state()},
+                        dump=const.JSON_DUMP,
+                    )
+                ),
+            )
 
-    connection.send_message(const.JSON_DUMP(messages.event_message(msg["id"], data)))
+    added = "{" + ",".join(serialized_states) + "}"
+    connection.send_message(
+        messages.construct_event_message(
+            msg["id"], f'{{"{messages.ENTITY_EVENT_ADD}":{added}}}'
+        )
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -410,6 +405,36 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_trace"})
+def handle_integration_setup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration setup trace command."""
+    if (trace := async_get_setup_trace(hass)) is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "Startup has not been traced"
+        )
+        return
+
+    connection.send_result(msg["id"], trace.as_chrome_trace())
+
+
+@decorators.websocket_command({vol.Required("type"): "connection/stats"})
+@callback
+def handle_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle connection stats command."""
+    connection.send_result(
+        msg["id"],
+        {
+            "message_bytes_sent": connection.message_bytes_sent,
+            "bytes_sent": connection.bytes_sent,
+        },
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
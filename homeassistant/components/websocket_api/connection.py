@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
@@ -33,6 +33,8 @@ class ActiveConnection:
         send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_for_drain: Callable[[], Awaitable[None]] | None = None,
+        bytes_sent: Callable[[], tuple[int, int]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -40,6 +42,8 @@ class ActiveConnection:
         self.send_message = send_message
         self.user = user
         self.refresh_token_id = refresh_token.id
+        self._wait_for_drain = wait_for_drain
+        self._bytes_sent = bytes_sent
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         current_connection.set(self)
@@ -60,6 +64,29 @@ class ActiveConnection:
         )
         self.send_message(content)
 
+    async def async_wait_for_drain(self) -> None:
+        """Wait until the pending messages have been written to the client.
+
+        Commands that stream large results wait for the drain before
+        sending the next chunk so a slow client applies backpressure.
+        """
+        if self._wait_for_drain is not None:
+            await self._wait_for_drain()
+
+    @property
+    def message_bytes_sent(self) -> int:
+        """Return the number of bytes of the messages sent to the client."""
+        if self._bytes_sent is None:
+            return 0
+        return self._bytes_sent()[0]
+
+    @property
+    def bytes_sent(self) -> int:
+        """Return the number of bytes sent to the client, as compressed."""
+        if self._bytes_sent is None:
+            return 0
+        return self._bytes_sent()[1]
+
     @callback
     def send_error(self, msg_id: int, code: str, message: str) -> None:
         """Send a error message."""
@@ -6,9 +6,12 @@ from collections.abc import Callable
 from contextlib import suppress
 import datetime as dt
 import logging
-from typing import Any, Final
+from typing import Any, Final, cast
+import zlib
 
+import aiohttp
 from aiohttp import WSMsgType, web
+from aiohttp.http import WebSocketWriter
 import async_timeout
 
 from homeassistant.components.http import HomeAssistantView
@@ -21,6 +24,8 @@ from .auth import AuthPhase, auth_required_message
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    DEFAULT_COMPRESSION_LEVEL,
+    DEFAULT_COMPRESSION_THRESHOLD,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -31,8 +36,13 @@ from .const import (
 from .error import Disconnect
 from .messages import message_to_json
 
+_LOGGER: Final = logging.getLogger(__name__)
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
+# The compression writer overrides internals of aiohttp, so it is only used
+# with the version of aiohttp it is tested against
+TESTED_AIOHTTP_VERSION: Final = "3.8.1"
+
 
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
@@ -41,9 +51,30 @@ class WebsocketAPIView(HomeAssistantView):
     url: str = URL
     requires_auth: bool = False
 
+    def __init__(
+        self,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ) -> None:
+        """Initialize the websocket API view."""
+        if compression_level and aiohttp.__version__ != TESTED_AIOHTTP_VERSION:
+            _LOGGER.warning(
+                "The compression level and threshold are ignored with aiohttp %s, "
+                "they are only supported with aiohttp %s",
+                aiohttp.__version__,
+                TESTED_AIOHTTP_VERSION,
+            )
+        self.compression_level = compression_level
+        self.compression_threshold = compression_threshold
+
     async def get(self, request: web.Request) -> web.WebSocketResponse:
         """Handle an incoming websocket connection."""
-        return await WebSocketHandler(request.app["hass"], request).async_handle()
+        return await WebSocketHandler(
+            request.app["hass"],
+            request,
+            self.compression_level,
+            self.compression_threshold,
+        ).async_handle()
 
 
 class WebSocketAdapter(logging.LoggerAdapter):
@@ -54,19 +85,127 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+class CompressionWebSocketWriter(WebSocketWriter):
+    """Write websocket frames compressed at a level above a size threshold.
+
+    Once permessage-deflate is negotiated, aiohttp compresses every message
+    at the fastest level. Counts the bytes of the messages and of the frames
+    sent, to tell how much the compression saves.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        compression_level: int,
+        compression_threshold: int,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the writer."""
+        super().__init__(*args, **kwargs)
+        self.compression_threshold = compression_threshold
+        self.message_bytes_sent = 0
+        self.bytes_sent = 0
+        if self.compress:
+            self._compressobj = zlib.compressobj(
+                level=compression_level, wbits=-self.compress
+            )
+
+    async def _send_frame(
+        self, message: bytes, opcode: int, compress: int | None = None
+    ) -> None:
+        """Send a frame, uncompressed if the message is below the threshold."""
+        if opcode >= WSMsgType.CLOSE:
+            # Control frames are never compressed
+            await super()._send_frame(message, opcode, compress)
+            return
+
+        self.message_bytes_sent += len(message)
+        if not self.compress or len(message) >= self.compression_threshold:
+            await super()._send_frame(message, opcode, compress)
+            return
+
+        # Messages may be sent uncompressed without resetting the context
+        compress_bits, self.compress = self.compress, 0
+        try:
+            await super()._send_frame(message, opcode, compress)
+        finally:
+            self.compress = compress_bits
+
+    def _write(self, data: bytes) -> None:
+        """Write data to the transport."""
+        super()._write(data)
+        self.bytes_sent += len(data)
+
+
+class CompressionWebSocketResponse(web.WebSocketResponse):
+    """Websocket response using the compression settings of the API."""
+
+    def __init__(
+        self, *, compression_level: int, compression_threshold: int, **kwargs: Any
+    ) -> None:
+        """Initialize the response."""
+        super().__init__(compress=compression_level > 0, **kwargs)
+        self._compression_level = compression_level
+        self._compression_threshold = compression_threshold
+
+    def _pre_start(self, request: web.BaseRequest) -> tuple[str, WebSocketWriter]:
+        """Replace the writer of aiohttp after the handshake."""
+        protocol, writer = super()._pre_start(request)
+        return protocol, CompressionWebSocketWriter(
+            writer.protocol,
+            writer.transport,
+            compress=writer.compress,
+            notakeover=writer.notakeover,
+            compression_level=self._compression_level,
+            compression_threshold=self._compression_threshold,
+        )
+
+    @property
+    def message_bytes_sent(self) -> int:
+        """Return the number of bytes of the messages sent."""
+        if self._writer is None:
+            return 0
+        return cast(CompressionWebSocketWriter, self._writer).message_bytes_sent
+
+    @property
+    def bytes_sent(self) -> int:
+        """Return the number of bytes of the frames sent, as compressed."""
+        if self._writer is None:
+            return 0
+        return cast(CompressionWebSocketWriter, self._writer).bytes_sent
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
-    def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        request: web.Request,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ) -> None:
         """Initialize an active connection."""
         self.hass = hass
         self.request = request
-        self.wsock = web.WebSocketResponse(heartbeat=55)
+        self.wsock: web.WebSocketResponse
+        if aiohttp.__version__ == TESTED_AIOHTTP_VERSION:
+            self.wsock = CompressionWebSocketResponse(
+                heartbeat=55,
+                compression_level=compression_level,
+                compression_threshold=compression_threshold,
+            )
+        else:
+            self.wsock = web.WebSocketResponse(
+                heartbeat=55, compress=compression_level > 0
+            )
         self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._drained = asyncio.Event()
+        self._drained.set()
 
     async def _writer(self) -> None:
         """Write outgoing messages."""
@@ -82,6 +221,11 @@ class WebSocketHandler:
                     message = process
                 self._logger.debug("Sending %s", message)
                 await self.wsock.send_str(message)
+                if self._to_write.empty():
+                    self._drained.set()
+
+        # Release anyone waiting for the queue to drain
+        self._drained.set()
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
@@ -101,6 +245,7 @@ class WebSocketHandler:
 
         try:
             self._to_write.put_nowait(message)
+            self._drained.clear()
         except asyncio.QueueFull:
             self._logger.error(
                 "Client exceeded max pending messages [2]: %s", MAX_PENDING_MSG
@@ -119,6 +264,17 @@ class WebSocketHandler:
                 self.hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    async def _async_wait_for_drain(self) -> None:
+        """Wait until all pending messages have been written to the socket."""
+        await self._drained.wait()
+
+    @callback
+    def _bytes_sent(self) -> tuple[int, int]:
+        """Return the bytes of the messages and of the frames sent."""
+        if not isinstance(wsock := self.wsock, CompressionWebSocketResponse):
+            return 0, 0
+        return wsock.message_bytes_sent, wsock.bytes_sent
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
@@ -170,7 +326,13 @@ class WebSocketHandler:
         self._writer_task = asyncio.create_task(self._writer())
 
         auth = AuthPhase(
-            self._logger, self.hass, self._send_message, self._cancel, request
+            self._logger,
+            self.hass,
+            self._send_message,
+            self._cancel,
+            request,
+            self._async_wait_for_drain,
+            self._bytes_sent,
         )
         connection = None
         disconnect_warn = None
@@ -250,6 +412,9 @@ class WebSocketHandler:
                 self._writer_task.cancel()
 
             finally:
+                self._logger.debug(
+                    "Sent %s bytes of messages in %s bytes", *self._bytes_sent()
+                )
                 if disconnect_warn is None:
                     self._logger.debug("Disconnected")
                 else:
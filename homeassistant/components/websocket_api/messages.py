@@ -51,6 +51,14 @@ def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def construct_result_message(iden: int, payload: str) -> str:
+    """Construct a success result message JSON from a JSON serialized result."""
+    return (
+        f'{{"id":{iden},"type":"{const.TYPE_RESULT}","success":true,'
+        f'"result":{payload}}}'
+    )
+
+
 def error_message(iden: int | None, code: str, message: str) -> dict[str, Any]:
     """Return an error result message."""
     return {
@@ -66,6 +74,11 @@ def event_message(iden: JSON_TYPE | int, event: Any) -> dict[str, Any]:
     return {"id": iden, "type": "event", "event": event}
 
 
+def construct_event_message(iden: int, payload: str) -> str:
+    """Construct an event message JSON from a JSON serialized event."""
+    return f'{{"id":{iden},"type":"event","event":{payload}}}'
+
+
 def cached_event_message(iden: int, event: Event) -> str:
     """Return an event message.
 
@@ -110,6 +123,58 @@ def _cached_state_diff_message(event: Event) -> str:
     return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
 
 
+def cached_state_diff_batch_message(iden: int, events: tuple[Event, ...]) -> str:
+    """Return an event message with the combined diff of a batch of events.
+
+    Serialize to json once per batch.
+    """
+    return _cached_state_diff_batch_message(events).replace(
+        IDEN_JSON_TEMPLATE, str(iden), 1
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_batch_message(events: tuple[Event, ...]) -> str:
+    """Cache and serialize the combined diff of the events to json.
+
+    The IDEN_TEMPLATE is used which will be replaced
+    with the actual iden in cached_state_diff_batch_message
+    """
+    return message_to_json(
+        event_message(IDEN_TEMPLATE, _state_diff_batch_event(events))
+    )
+
+
+def _state_diff_batch_event(events: tuple[Event, ...]) -> dict:
+    """Convert a batch of state_changed events to one minimal event.
+
+    Entities changing more than once in the batch are diffed from their
+    first old state to their last new state.
+    """
+    changes: dict[str, tuple[State | None, State | None]] = {}
+    for event in events:
+        entity_id = event.data["entity_id"]
+        if (change := changes.get(entity_id)) is None:
+            changes[entity_id] = (event.data["old_state"], event.data["new_state"])
+        else:
+            changes[entity_id] = (change[0], event.data["new_state"])
+
+    diff: dict[str, Any] = {}
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                diff.setdefault(ENTITY_EVENT_REMOVE, []).append(entity_id)
+        elif old_state is None:
+            diff.setdefault(ENTITY_EVENT_ADD, {})[
+                entity_id
+            ] = compressed_state_dict_add(new_state)
+        else:
+            diff.setdefault(ENTITY_EVENT_CHANGE, {}).update(
+                _state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE]
+            )
+    return diff
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -169,25 +234,8 @@ def _state_diff(
 
 
 def compressed_state_dict_add(state: State) -> dict[str, Any]:
-    """Build a compressed dict of a state for adds.
-
-    Omits the lu (last_updated) if it matches (lc) last_changed.
-
-    Sends c (context) as a string if it only contains an id.
-    """
-    if state.context.parent_id is None and state.context.user_id is None:
-        context: dict[str, Any] | str = state.context.id
-    else:
-        context = state.context.as_dict()
-    compressed_state: dict[str, Any] = {
-        COMPRESSED_STATE_STATE: state.state,
-        COMPRESSED_STATE_ATTRIBUTES: state.attributes,
-        COMPRESSED_STATE_CONTEXT: context,
-        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
-    }
-    if state.last_changed != state.last_updated:
-        compressed_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
-    return compressed_state
+    """Build a compressed dict of a state for adds."""
+    return state.as_compressed_state()
 
 
 def message_to_json(message: dict[str, Any]) -> str:
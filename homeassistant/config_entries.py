@@ -23,7 +23,11 @@ from .helpers import device_registry, entity_registry, storage
 from .helpers.event import async_call_later
 from .helpers.frame import report
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
-from .setup import async_process_deps_reqs, async_setup_component
+from .setup import (
+    async_process_deps_reqs,
+    async_setup_component,
+    async_trace_setup_phase,
+)
 from .util import uuid as uuid_util
 from .util.decorator import Registry
 
@@ -332,7 +336,8 @@ class ConfigEntry:
         error_reason = None
 
         try:
-            result = await component.async_setup_entry(hass, self)
+            with async_trace_setup_phase(hass, integration.domain, "async_setup_entry"):
+                result = await component.async_setup_entry(hass, self)
 
             if not isinstance(result, bool):
                 _LOGGER.error(
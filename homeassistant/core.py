@@ -12,9 +12,11 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     Mapping,
 )
+from contextlib import contextmanager
 import datetime
 import enum
 import functools
@@ -45,9 +47,15 @@ from . import block_async_io, loader, util
 from .backports.enum import StrEnum
 from .const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     CONF_UNIT_SYSTEM_IMPERIAL,
     EVENT_CALL_SERVICE,
     EVENT_CORE_CONFIG_UPDATE,
@@ -88,6 +96,7 @@ if TYPE_CHECKING:
     from .auth import AuthManager
     from .components.http import ApiConfig, HomeAssistantHTTP
     from .config_entries import ConfigEntries
+    from .util.loop_monitor import LoopMonitor
 
 
 STAGE_1_SHUTDOWN_TIMEOUT = 100
@@ -246,6 +255,8 @@ class HomeAssistant:
         self.loop = asyncio.get_running_loop()
         self._pending_tasks: list[asyncio.Future[Any]] = []
         self._track_task = True
+        # Measures the jobs run in the event loop if set
+        self.job_monitor: LoopMonitor | None = None
         self.bus = EventBus(self)
         self.services = ServiceRegistry(self)
         self.states = StateMachine(self.bus, self.loop)
@@ -448,11 +459,17 @@ class HomeAssistant:
                 hassjob.target = cast(
                     Callable[..., Coroutine[Any, Any, _R]], hassjob.target
                 )
-            task = self.loop.create_task(hassjob.target(*args))
+            coro = hassjob.target(*args)
+            if self.job_monitor is not None:
+                coro = self.job_monitor.wrap_coroutine(hassjob.target, coro)
+            task = self.loop.create_task(coro)
         elif hassjob.job_type == HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob.target = cast(Callable[..., _R], hassjob.target)
-            self.loop.call_soon(hassjob.target, *args)
+            if self.job_monitor is not None:
+                self.loop.call_soon(self.job_monitor.run_callback, hassjob.target, args)
+            else:
+                self.loop.call_soon(hassjob.target, *args)
             return None
         else:
             if TYPE_CHECKING:
@@ -542,7 +559,10 @@ class HomeAssistant:
         if hassjob.job_type == HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob.target = cast(Callable[..., _R], hassjob.target)
-            hassjob.target(*args)
+            if self.job_monitor is not None:
+                self.job_monitor.run_callback(hassjob.target, args)
+            else:
+                hassjob.target(*args)
             return None
 
         return self.async_add_hass_job(hassjob, *args)
@@ -808,12 +828,43 @@ class _FilterableJob(NamedTuple):
     run_immediately: bool
 
 
+class _EventMatchIndex:
+    """Listeners of an event type indexed by the entity_id of the event data."""
+
+    __slots__ = ("entity_ids", "domains", "count")
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self.entity_ids: dict[str, list[_FilterableJob]] = {}
+        self.domains: dict[str, list[_FilterableJob]] = {}
+        self.count = 0
+
+    def matching(self, entity_id: str) -> list[_FilterableJob]:
+        """Return the listeners matching an entity_id."""
+        entity_id_listeners = self.entity_ids.get(entity_id)
+        domain, dot, _ = entity_id.partition(".")
+        # An entity_id without a dot is not in any domain
+        if not dot or (domain_listeners := self.domains.get(domain)) is None:
+            return entity_id_listeners or []
+        if entity_id_listeners is None:
+            return domain_listeners
+        return entity_id_listeners + [
+            listener
+            for listener in domain_listeners
+            if listener not in entity_id_listeners
+        ]
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        self._match_indexes: dict[str, _EventMatchIndex] = {}
+        self._batch_listeners: dict[str, list[HassJob[None]]] = {}
+        # Events waiting for the batch listeners while in async_batch
+        self._pending_batches: dict[str, list[Event]] | None = None
         self._hass = hass
 
     @callback
@@ -822,7 +873,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, match_index in self._match_indexes.items():
+            listeners[key] = listeners.get(key, 0) + match_index.count
+        for key, batch_listeners in self._batch_listeners.items():
+            listeners[key] = listeners.get(key, 0) + len(batch_listeners)
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -866,12 +922,27 @@ class EventBus:
         if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
             listeners = match_all_listeners + listeners
 
+        # Listeners matching the entity_id are looked up instead of filtered
+        if (
+            (match_index := self._match_indexes.get(event_type)) is not None
+            and event_data is not None
+            and isinstance(entity_id := event_data.get(ATTR_ENTITY_ID), str)
+            and (matching_listeners := match_index.matching(entity_id))
+        ):
+            listeners = listeners + matching_listeners
+
         event = Event(event_type, event_data, origin, time_fired, context)
         if not event.context.origin_event:
             event.context.origin_event = event
 
         _LOGGER.debug("Bus:Handling %s", event)
 
+        if (batch_listeners := self._batch_listeners.get(event_type)) is not None:
+            if self._pending_batches is not None:
+                self._pending_batches.setdefault(event_type, []).append(event)
+            else:
+                self._async_run_batch_listeners(batch_listeners, [event])
+
         if not listeners:
             return
 
@@ -918,6 +989,8 @@ class EventBus:
         listener: Callable[[Event], None | Awaitable[None]],
         event_filter: Callable[[Event], bool] | None = None,
         run_immediately: bool = False,
+        match_entity_ids: Iterable[str] | None = None,
+        match_domains: Iterable[str] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -928,6 +1001,12 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        If match_entity_ids or match_domains are passed, the listener only
+        runs for events with an entity_id in the event data that is one of
+        the entity_ids or in one of the domains. These listeners are looked
+        up by the entity_id when the event is fired instead of having their
+        filter called for every event, and run after the other listeners.
+
         If run_immediately is passed, the callback will be run
         right away instead of using call_soon. Only use this if
         the callback results in scheduling another task.
@@ -938,10 +1017,61 @@ class EventBus:
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         if run_immediately and not is_callback(listener):
             raise HomeAssistantError(f"Event listener {listener} is not a callback")
-        return self._async_listen_filterable_job(
-            event_type, _FilterableJob(HassJob(listener), event_filter, run_immediately)
+        filterable_job = _FilterableJob(
+            HassJob(listener), event_filter, run_immediately
+        )
+        if match_entity_ids is None and match_domains is None:
+            return self._async_listen_filterable_job(event_type, filterable_job)
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Matching listeners need a specific event type")
+        return self._async_listen_matching_job(
+            event_type,
+            filterable_job,
+            set(match_entity_ids or ()),
+            set(match_domains or ()),
         )
 
+    @callback
+    def _async_listen_matching_job(
+        self,
+        event_type: str,
+        filterable_job: _FilterableJob,
+        entity_ids: set[str],
+        domains: set[str],
+    ) -> CALLBACK_TYPE:
+        match_index = self._match_indexes.setdefault(event_type, _EventMatchIndex())
+        for index, keys in (
+            (match_index.entity_ids, entity_ids),
+            (match_index.domains, domains),
+        ):
+            for key in keys:
+                index.setdefault(key, []).append(filterable_job)
+        match_index.count += 1
+        removed = False
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            nonlocal removed
+            if removed:
+                _LOGGER.error(
+                    "Unable to remove unknown job listener %s", filterable_job
+                )
+                return
+            removed = True
+            for index, keys in (
+                (match_index.entity_ids, entity_ids),
+                (match_index.domains, domains),
+            ):
+                for key in keys:
+                    index[key].remove(filterable_job)
+                    if not index[key]:
+                        del index[key]
+            match_index.count -= 1
+            if not match_index.count:
+                self._match_indexes.pop(event_type, None)
+
+        return remove_listener
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJob
@@ -954,6 +1084,71 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_batch(
+        self, event_type: str, listener: Callable[[list[Event]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for batches of events of a specific type.
+
+        The listener is called with all events fired inside an async_batch
+        block at once when the block exits, and with a single event for
+        events fired outside of one. The listener must be a callback and
+        is run right away.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Batch listeners need a specific event type")
+        if not is_callback(listener):
+            raise HomeAssistantError(f"Batch listener {listener} is not a callback")
+        job: HassJob[None] = HassJob(listener)
+        self._batch_listeners.setdefault(event_type, []).append(job)
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            try:
+                self._batch_listeners[event_type].remove(job)
+            except (KeyError, ValueError):
+                _LOGGER.error("Unable to remove unknown batch listener %s", job)
+                return
+            if not self._batch_listeners[event_type]:
+                del self._batch_listeners[event_type]
+
+        return remove_listener
+
+    @contextmanager
+    def async_batch(self) -> Generator[None, None, None]:
+        """Hand the events fired in the block to batch listeners at once.
+
+        Regular listeners still receive every event as it is fired.
+
+        This method must be run in the event loop.
+        """
+        if self._pending_batches is not None:
+            # Nested batches are part of the outer batch
+            yield
+            return
+
+        self._pending_batches = {}
+        try:
+            yield
+        finally:
+            pending_batches, self._pending_batches = self._pending_batches, None
+            for event_type, events in pending_batches.items():
+                if batch_listeners := self._batch_listeners.get(event_type):
+                    self._async_run_batch_listeners(batch_listeners, events)
+
+    @callback
+    def _async_run_batch_listeners(
+        self, batch_listeners: list[HassJob[None]], events: list[Event]
+    ) -> None:
+        """Run the batch listeners with a batch of events."""
+        for job in list(batch_listeners):
+            try:
+                job.target(events)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running batch job: %s", job)
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None | Awaitable[None]]
     ) -> CALLBACK_TYPE:
@@ -1061,6 +1256,9 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_as_compressed_state",
+        "_as_compressed_state_json",
     ]
 
     def __init__(
@@ -1096,6 +1294,9 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._as_compressed_state: ReadOnlyDict[str, Any] | None = None
+        self._as_compressed_state_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -1130,6 +1331,61 @@ class State:
             )
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return the dict representation of the State serialized to JSON.
+
+        The JSON is cached on the State, so it is shared by every caller.
+        """
+        if self._as_dict_json is None:
+            # Circular dep
+            # pylint: disable-next=import-outside-toplevel
+            from .helpers.json import json_dumps
+
+            self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
+
+    def as_compressed_state(self) -> ReadOnlyDict[str, Any]:
+        """Build a compressed dict of a state for adds.
+
+        Omits the lu (last_updated) if it matches (lc) last_changed.
+
+        Sends c (context) as a string if it only contains an id.
+        """
+        if self._as_compressed_state is None:
+            if self.context.parent_id is None and self.context.user_id is None:
+                context: dict[str, Any] | str = self.context.id
+            else:
+                context = self.context.as_dict()
+            compressed_state: dict[str, Any] = {
+                COMPRESSED_STATE_STATE: self.state,
+                COMPRESSED_STATE_ATTRIBUTES: self.attributes,
+                COMPRESSED_STATE_CONTEXT: context,
+                COMPRESSED_STATE_LAST_CHANGED: self.last_changed.timestamp(),
+            }
+            if self.last_changed != self.last_updated:
+                compressed_state[
+                    COMPRESSED_STATE_LAST_UPDATED
+                ] = self.last_updated.timestamp()
+            self._as_compressed_state = ReadOnlyDict(compressed_state)
+        return self._as_compressed_state
+
+    def as_compressed_state_json(self) -> str:
+        """Build a compressed JSON key value pair of a state for adds.
+
+        The JSON is the entity_id and the compressed state as a key value pair
+        without the enclosing braces, so it can be joined into an object. It
+        is cached on the State, so it is shared by every caller.
+        """
+        if self._as_compressed_state_json is None:
+            # Circular dep
+            # pylint: disable-next=import-outside-toplevel
+            from .helpers.json import json_dumps
+
+            self._as_compressed_state_json = json_dumps(
+                {self.entity_id: self.as_compressed_state()}
+            )[1:-1]
+        return self._as_compressed_state_json
+
     @classmethod
     def from_dict(cls: type[_StateT], json_dict: dict[str, Any]) -> _StateT | None:
         """Initialize a state from a dict.
@@ -196,6 +196,7 @@ FLOWS = {
         "locative",
         "logi_circle",
         "lookin",
+        "loop_monitor",
         "luftdaten",
         "lutron_caseta",
         "lyric",
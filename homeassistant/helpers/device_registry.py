@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections import OrderedDict
 import logging
+from operator import itemgetter
 import time
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
@@ -225,6 +226,10 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={
+                "devices": itemgetter("id"),
+                "deleted_devices": itemgetter("id"),
+            },
         )
         self._clear_index()
 
@@ -611,11 +616,26 @@ class DeviceRegistry:
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the device registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        self._store.async_delay_save(
+            self._data_to_save, SAVE_DELAY, snapshot_func=self._async_snapshot
+        )
 
     @callback
-    def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
-        """Return data of device registry to store in a file."""
+    def _async_snapshot(
+        self,
+    ) -> tuple[tuple[DeviceEntry, ...], tuple[DeletedDeviceEntry, ...]]:
+        """Return the devices to store, entries are immutable."""
+        return tuple(self.devices.values()), tuple(self.deleted_devices.values())
+
+    @staticmethod
+    def _data_to_save(
+        snapshot: tuple[tuple[DeviceEntry, ...], tuple[DeletedDeviceEntry, ...]]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return data of device registry to store in a file.
+
+        Runs in the executor.
+        """
+        devices, deleted_devices = snapshot
         data = {}
 
         data["devices"] = [
@@ -636,7 +656,7 @@ class DeviceRegistry:
                 "disabled_by": entry.disabled_by,
                 "configuration_url": entry.configuration_url,
             }
-            for entry in self.devices.values()
+            for entry in devices
         ]
         data["deleted_devices"] = [
             {
@@ -646,7 +666,7 @@ class DeviceRegistry:
                 "id": entry.id,
                 "orphaned_timestamp": entry.orphaned_timestamp,
             }
-            for entry in self.deleted_devices.values()
+            for entry in deleted_devices
         ]
 
         return data
@@ -50,6 +50,7 @@ from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
 from . import entity_registry as er
 from .device_registry import DeviceEntryType
 from .entity_platform import EntityPlatform
+from .entity_values import EntityValues
 from .event import async_track_entity_registry_updated_event
 from .typing import StateType
 
@@ -63,6 +64,28 @@ SOURCE_PLATFORM_CONFIG = "platform_config"
 # epsilon to make the string representation readable
 FLOAT_PRECISION = abs(int(math.floor(math.log10(abs(sys.float_info.epsilon))))) - 1
 
+# Entity properties written as state attributes which don't change between state
+# writes as long as their implementation only depends on _attr_ attributes, the
+# entity description and the registry entry
+_STATIC_STATE_PROPERTIES: Final = frozenset(
+    {
+        "assumed_state",
+        "attribution",
+        "device_class",
+        "entity_picture",
+        "icon",
+        "name",
+        "supported_features",
+        "unit_of_measurement",
+    }
+)
+
+# Entity attributes which invalidate the cached static state attributes when set
+_STATIC_STATE_SOURCES: Final = frozenset(
+    {"entity_description", "entity_id", "registry_entry"}
+    | {f"_attr_{name}" for name in _STATIC_STATE_PROPERTIES}
+)
+
 
 @callback
 @bind_hass
@@ -234,6 +257,30 @@ class EntityDescription:
     unit_of_measurement: str | None = None
 
 
+@ft.lru_cache(maxsize=None)
+def _dynamic_state_properties(entity_class: type[Entity]) -> frozenset[str]:
+    """Return the static state properties an entity class overrides.
+
+    A property is only static if the class implementing it lists it in its
+    _static_state_properties.
+    """
+    dynamic = set()
+    for name in _STATIC_STATE_PROPERTIES:
+        for klass in entity_class.__mro__:
+            if name in klass.__dict__:
+                if name not in klass.__dict__.get("_static_state_properties", ()):
+                    dynamic.add(name)
+                break
+    return frozenset(dynamic)
+
+
+def _static_state_setattr(self: Entity, name: str, value: Any) -> None:
+    """Set an attribute and drop the cached static state attributes."""
+    if name in _STATIC_STATE_SOURCES:
+        object.__setattr__(self, "_static_state_attributes", None)
+    object.__setattr__(self, name, value)
+
+
 class Entity(ABC):
     """An abstract class for Home Assistant entities."""
 
@@ -281,6 +328,27 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _platform_state = EntityPlatformState.NOT_ADDED
 
+    # If the platform batches the state writes of its entities, set by the
+    # entity platform when the entity is added
+    _batch_state_writes = False
+
+    # Set by entity classes to cache the state attributes of their static state
+    # properties between state writes. The cache is only dropped when the entity
+    # id, the registry entry, the entity description or one of the _attr_
+    # attributes of the static state properties is set, mutating the entity
+    # description or other data the properties depend on in place is not
+    # picked up.
+    _cache_static_state_attributes = False
+
+    # Properties implemented by this class which only depend on their _attr_
+    # attribute and the entity description
+    _static_state_properties = _STATIC_STATE_PROPERTIES
+
+    # Cached state attributes of the static state properties and the customize
+    # config they were calculated with
+    _static_state_attributes: dict[str, Any] | None = None
+    _static_state_customize: EntityValues | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -530,6 +598,11 @@ class Entity(ABC):
                 f"No entity id specified for entity {self.name}"
             )
 
+        if self._batch_state_writes:
+            assert self.platform is not None
+            self.platform.async_schedule_state_write(self)
+            return
+
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
@@ -573,33 +646,30 @@ class Entity(ABC):
             attr.update(self.state_attributes or {})
             attr.update(self.extra_state_attributes or {})
 
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        entry = self.registry_entry
-
-        if assumed_state := self.assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        if (attribution := self.attribution) is not None:
-            attr[ATTR_ATTRIBUTION] = attribution
-
-        if (
-            device_class := (entry and entry.device_class) or self.device_class
-        ) is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
-
-        if (entity_picture := self.entity_picture) is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        if (icon := (entry and entry.icon) or self.icon) is not None:
-            attr[ATTR_ICON] = icon
-
-        if (name := (entry and entry.name) or self.name) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+        if not self._cache_static_state_attributes:
+            self._async_add_state_attributes(attr, _STATIC_STATE_PROPERTIES)
+            # Overwrite properties that have been set in the config file.
+            if customize is not None:
+                attr.update(customize.get(self.entity_id))
+        else:
+            if dynamic_properties := _dynamic_state_properties(type(self)):
+                self._async_add_state_attributes(attr, dynamic_properties)
+
+            if (
+                static_attr := self._static_state_attributes
+            ) is None or customize is not self._static_state_customize:
+                static_attr = {}
+                self._async_add_state_attributes(
+                    static_attr, _STATIC_STATE_PROPERTIES - dynamic_properties
+                )
+                # Overwrite properties that have been set in the config file.
+                if customize is not None:
+                    static_attr.update(customize.get(self.entity_id))
+                self._static_state_attributes = static_attr
+                self._static_state_customize = customize
 
-        if (supported_features := self.supported_features) is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+            attr.update(static_attr)
 
         end = timer()
 
@@ -614,15 +684,8 @@ class Entity(ABC):
                 report_issue,
             )
 
-        # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
-
         def _convert_temperature(state: str, attr: dict[str, Any]) -> str:
             # Convert temperature if we detect one
-            # pylint: disable-next=import-outside-toplevel
-            from homeassistant.components.sensor import SensorEntity
-
             unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
             units = self.hass.config.units
             if unit_of_measure == units.temperature_unit or unit_of_measure not in (
@@ -631,6 +694,9 @@ class Entity(ABC):
             ):
                 return state
 
+            # pylint: disable-next=import-outside-toplevel
+            from homeassistant.components.sensor import SensorEntity
+
             domain = split_entity_id(self.entity_id)[0]
             if domain != "sensor":
                 if not self._temperature_reported:
@@ -681,6 +747,72 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_add_state_attributes(
+        self, attr: dict[str, Any], properties: frozenset[str]
+    ) -> None:
+        """Add the state attributes of the static state properties."""
+        entry = self.registry_entry
+
+        if (
+            "unit_of_measurement" in properties
+            and (unit_of_measurement := self.unit_of_measurement) is not None
+        ):
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        if "assumed_state" in properties and (assumed_state := self.assumed_state):
+            attr[ATTR_ASSUMED_STATE] = assumed_state
+
+        if (
+            "attribution" in properties
+            and (attribution := self.attribution) is not None
+        ):
+            attr[ATTR_ATTRIBUTION] = attribution
+
+        if (
+            "device_class" in properties
+            and (device_class := (entry and entry.device_class) or self.device_class)
+            is not None
+        ):
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        if (
+            "entity_picture" in properties
+            and (entity_picture := self.entity_picture) is not None
+        ):
+            attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        if (
+            "icon" in properties
+            and (icon := (entry and entry.icon) or self.icon) is not None
+        ):
+            attr[ATTR_ICON] = icon
+
+        if (
+            "name" in properties
+            and (name := (entry and entry.name) or self.name) is not None
+        ):
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        if (
+            "supported_features" in properties
+            and (supported_features := self.supported_features) is not None
+        ):
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Drop the cached static state attributes when their sources are set.
+
+        Only entity classes caching their static state attributes pay for
+        the check on attribute assignment.
+        """
+        super().__init_subclass__(**kwargs)
+        if (
+            cls.__dict__.get("_cache_static_state_attributes")
+            and "__setattr__" not in cls.__dict__
+        ):
+            cls.__setattr__ = _static_state_setattr  # type: ignore[assignment]
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -106,6 +106,11 @@ class EntityPlatform:
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
+        # Platforms can opt in to coalesce the state writes of their
+        # entities per event loop iteration into one batch.
+        self.batch_state_writes: bool = getattr(platform, "BATCH_STATE_WRITES", False)
+        self._pending_state_writes: dict[str, Entity] = {}
+
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
@@ -149,6 +154,27 @@ class EntityPlatform:
 
         return self.parallel_updates
 
+    @callback
+    def async_schedule_state_write(self, entity: Entity) -> None:
+        """Write the state of an entity with the next batch of state writes."""
+        if not self._pending_state_writes:
+            self.hass.loop.call_soon(self._async_write_pending_states)
+        assert entity.entity_id is not None
+        self._pending_state_writes[entity.entity_id] = entity
+
+    @callback
+    def _async_write_pending_states(self) -> None:
+        """Write the pending states as one batch of state changes."""
+        pending_state_writes = self._pending_state_writes
+        self._pending_state_writes = {}
+        with self.hass.bus.async_batch():
+            for entity in pending_state_writes.values():
+                # One entity failing to write must not lose the others' writes
+                try:
+                    entity._async_write_ha_state()  # pylint: disable=protected-access
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error writing state of %s", entity.entity_id)
+
     async def async_setup(
         self,
         platform_config: ConfigType,
@@ -424,6 +450,9 @@ class EntityPlatform:
             self,
             self._get_parallel_updates_semaphore(hasattr(entity, "update")),
         )
+        entity._batch_state_writes = (  # pylint: disable=protected-access
+            self.batch_state_writes
+        )
 
         # Update properties before we generate the entity_id
         if update_before_add:
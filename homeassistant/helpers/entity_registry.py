@@ -12,6 +12,7 @@ from __future__ import annotations
 from collections import UserDict
 from collections.abc import Callable, Iterable, Mapping
 import logging
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, cast
 
 import attr
@@ -230,6 +231,7 @@ class EntityRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"entities": itemgetter("id")},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -748,11 +750,21 @@ class EntityRegistry:
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the entity registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        self._store.async_delay_save(
+            self._data_to_save, SAVE_DELAY, snapshot_func=self._async_snapshot
+        )
 
     @callback
-    def _data_to_save(self) -> dict[str, Any]:
-        """Return data of entity registry to store in a file."""
+    def _async_snapshot(self) -> tuple[RegistryEntry, ...]:
+        """Return the entries to store, entries are immutable."""
+        return tuple(self.entities.values())
+
+    @staticmethod
+    def _data_to_save(entries: tuple[RegistryEntry, ...]) -> dict[str, Any]:
+        """Return data of entity registry to store in a file.
+
+        Runs in the executor.
+        """
         data: dict[str, Any] = {}
 
         data["entities"] = [
@@ -778,7 +790,7 @@ class EntityRegistry:
                 "unique_id": entry.unique_id,
                 "unit_of_measurement": entry.unit_of_measurement,
             }
-            for entry in self.entities.values()
+            for entry in entries
         ]
 
         return data
@@ -258,56 +258,55 @@ def _async_track_state_change_event(
     action: Callable[[Event], Any],
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
-
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
+    entity_callbacks: dict[str, list[HassJob[Any]]] = hass.data.setdefault(
+        TRACK_STATE_CHANGE_CALLBACKS, {}
+    )
+    entity_listeners: dict[str, CALLBACK_TYPE] = hass.data.setdefault(
+        TRACK_STATE_CHANGE_LISTENER, {}
+    )
 
     job = HassJob(action)
 
     for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
+        if (jobs := entity_callbacks.get(entity_id)) is None:
+            jobs = entity_callbacks[entity_id] = []
+            # The bus looks the listener up by the entity_id of the state
+            # change instead of calling a filter for every state change
+            entity_listeners[entity_id] = hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                ft.partial(_async_dispatch_state_change, hass, jobs),
+                match_entity_ids=(entity_id,),
+            )
+        jobs.append(job)
 
     @callback
     def remove_listener() -> None:
         """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            job,
-        )
+        for entity_id in entity_ids:
+            jobs = entity_callbacks[entity_id]
+            jobs.remove(job)
+            if not jobs:
+                del entity_callbacks[entity_id]
+                entity_listeners.pop(entity_id)()
 
     return remove_listener
 
 
+@callback
+def _async_dispatch_state_change(
+    hass: HomeAssistant, jobs: list[HassJob[Any]], event: Event
+) -> None:
+    """Dispatch a state change to the jobs tracking its entity_id."""
+    for job in jobs[:]:
+        try:
+            hass.async_run_hass_job(job, event)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "Error while processing state change for %s",
+                event.data.get("entity_id"),
+            )
+
+
 @callback
 def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
@@ -815,6 +814,11 @@ class _TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        # Positions of the tracked templates by the entities and domains
+        # they use, and of those that need to consider every state change.
+        self._templates_by_entity: dict[str, set[int]] = {}
+        self._templates_by_domain: dict[str, set[int]] = {}
+        self._templates_for_all: set[int] = set()
 
     def async_setup(self, raise_on_template_error: bool, strict: bool = False) -> None:
         """Activation of template tracking."""
@@ -862,6 +866,7 @@ class _TrackTemplateResultInfo:
         self._track_state_changes = async_track_state_change_filtered(
             self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
         )
+        self._update_template_index()
         self._update_time_listeners()
         _LOGGER.debug(
             "Template group %s listens for %s, first render blocker by super template: %s",
@@ -904,6 +909,38 @@ class _TrackTemplateResultInfo:
             self.hass, _refresh_from_time, second=0
         )
 
+    @callback
+    def _update_template_index(self) -> None:
+        """Index the tracked templates by the entities and domains they use."""
+        by_entity: dict[str, set[int]] = {}
+        by_domain: dict[str, set[int]] = {}
+        for_all: set[int] = set()
+
+        for idx, track_template_ in enumerate(self._track_templates):
+            if (info := self._info.get(track_template_.template)) is None or (
+                info.exception or info.all_states or info.all_states_lifecycle
+            ):
+                for_all.add(idx)
+                continue
+            for entity_id in info.entities:
+                by_entity.setdefault(entity_id, set()).add(idx)
+            for domain in info.domains | info.domains_lifecycle:
+                by_domain.setdefault(domain, set()).add(idx)
+
+        self._templates_by_entity = by_entity
+        self._templates_by_domain = by_domain
+        self._templates_for_all = for_all
+
+    @callback
+    def _templates_for_event(self, event: Event) -> list[TrackTemplate]:
+        """Return the tracked templates that may re-render from an event."""
+        entity_id: str = event.data[ATTR_ENTITY_ID]
+        matched = self._templates_for_all.union(
+            self._templates_by_entity.get(entity_id, ()),
+            self._templates_by_domain.get(split_entity_id(entity_id)[0], ()),
+        )
+        return [self._track_templates[idx] for idx in sorted(matched)]
+
     @callback
     def _update_time_listeners(self) -> None:
         for template, info in self._info.items():
@@ -1035,7 +1072,10 @@ class _TrackTemplateResultInfo:
         block_updates = False
         super_template = self._track_templates[0] if self._has_super_template else None
 
-        track_templates = track_templates or self._track_templates
+        if track_templates is None:
+            track_templates = (
+                self._templates_for_event(event) if event else self._track_templates
+            )
 
         # Update the super template first
         if super_template is not None:
@@ -1074,6 +1114,7 @@ class _TrackTemplateResultInfo:
                 info_changed |= _apply_update(update, track_template_.template)
 
         if info_changed:
+            self._update_template_index()
             assert self._track_state_changes
             self._track_state_changes.async_update_listeners(
                 _render_infos_to_track_states(
@@ -1612,13 +1653,16 @@ def _event_triggers_rerender(event: Event, info: RenderInfo) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = cast(str, event.data.get(ATTR_ENTITY_ID))
 
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+
     if info.filter(entity_id):
-        return True
+        if old_state is None or new_state is None:
+            return True
+        # Skip the render when none of the accessed fields changed
+        return info.state_fields_changed(entity_id, old_state, new_state)
 
-    if (
-        event.data.get("new_state") is not None
-        and event.data.get("old_state") is not None
-    ):
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
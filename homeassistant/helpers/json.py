@@ -1,25 +1,14 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
 import datetime
-import json
 from typing import Any
 
-
-class JSONEncoder(json.JSONEncoder):
-    """JSONEncoder that supports Home Assistant objects."""
-
-    def default(self, o: Any) -> Any:
-        """Convert Home Assistant objects.
-
-        Hand other objects to the original method.
-        """
-        if isinstance(o, datetime.datetime):
-            return o.isoformat()
-        if isinstance(o, set):
-            return list(o)
-        if hasattr(o, "as_dict"):
-            return o.as_dict()
-
-        return json.JSONEncoder.default(self, o)
+from homeassistant.util.json import (  # noqa: F401
+    JSON_ENCODE_EXCEPTIONS,
+    JSONEncoder,
+    json_bytes,
+    json_dumps,
+    json_encoder_default,
+)
 
 
 class ExtendedJSONEncoder(JSONEncoder):
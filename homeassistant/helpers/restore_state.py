@@ -32,6 +32,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the last seen time of an unchanged state is kept, so that dumping
+# an unchanged state does not count as a change in the journal of the store
+LAST_SEEN_REFRESH_INTERVAL = timedelta(days=1)
+
 _StoredStateT = TypeVar("_StoredStateT", bound="StoredState")
 
 
@@ -140,9 +144,13 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            journal_keys={None: _stored_state_key},
         )
         self.last_states: dict[str, StoredState] = {}
+        self._last_stored: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
 
     @callback
@@ -163,15 +171,30 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                state, self.entities[state.entity_id].extra_restore_state_data, now
+        refresh_time = now - LAST_SEEN_REFRESH_INTERVAL
+        stored_states = []
+        for state in all_states:
+            if (
+                state.entity_id not in self.entities
+                # Ignore all states that are entity registry placeholders
+                or state.attributes.get(ATTR_RESTORED)
+            ):
+                continue
+            last_seen = now
+            if (last_stored := self._last_stored.get(state.entity_id)) is not None and (
+                last_stored.state is state and last_stored.last_seen > refresh_time
+            ):
+                last_seen = last_stored.last_seen
+            stored_states.append(
+                StoredState(
+                    state,
+                    self.entities[state.entity_id].extra_restore_state_data,
+                    last_seen,
+                )
             )
-            for state in all_states
-            if state.entity_id in self.entities and
-            # Ignore all states that are entity registry placeholders
-            not state.attributes.get(ATTR_RESTORED)
-        ]
+        self._last_stored = {
+            stored_state.state.entity_id: stored_state for stored_state in stored_states
+        }
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
@@ -254,6 +277,11 @@ class RestoreStateData:
         self.entities.pop(entity_id)
 
 
+def _stored_state_key(item: dict[str, Any]) -> str:
+    """Return the key of a stored state in the journal of the store."""
+    return cast(str, item["state"]["entity_id"])
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
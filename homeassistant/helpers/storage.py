@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from contextlib import suppress
 from copy import deepcopy
+from functools import partial
 import inspect
+import json
 from json import JSONEncoder
 import logging
 import os
@@ -13,8 +15,9 @@ from typing import Any
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
-from homeassistant.util import json as json_util
+from homeassistant.util import json as json_util, uuid as uuid_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -24,6 +27,11 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+JOURNAL_SUFFIX = ".journal"
+# A journal is compacted into the main file once it holds more entries than
+# the store has items, but never before it holds this many entries
+JOURNAL_MIN_COMPACT_ENTRIES = 100
+
 
 @bind_hass
 async def async_migrator(
@@ -65,9 +73,190 @@ async def async_migrator(
     return config
 
 
+class _StoreJournal:
+    """Keep track of what a store in journal mode has persisted.
+
+    A store in journal mode only rewrites its main file when the journal is
+    compacted. In between, every write appends a line for each item of the
+    journaled collections that was added, changed or removed since the
+    previous write. Items are compared by their serialized form.
+    """
+
+    def __init__(
+        self,
+        keys: Mapping[str | None, Callable[[Any], str]],
+        encoder: type[JSONEncoder] | None,
+    ) -> None:
+        """Initialize the journal."""
+        self.keys = keys
+        self._dumps = json_util.json_encoder_dumps(encoder)
+        self.journal_id: str | None = None
+        self.entries = 0
+        # Serialized items and remaining data of the last write, None if
+        # the next write has to compact
+        self._items: dict[str | None, dict[str, str]] | None = None
+        self._rest: str | None = None
+
+    def _split(self, data: dict) -> tuple[str, dict[str | None, dict[str, str]]]:
+        """Split stored data in its serialized items and remaining data."""
+        payload = data["data"]
+        rest = {
+            key: value
+            for key, value in data.items()
+            if key not in ("data", "journal_id")
+        }
+        if None in self.keys:
+            collections = {None: payload}
+        else:
+            rest["data"] = {
+                key: value for key, value in payload.items() if key not in self.keys
+            }
+            collections = {
+                collection: payload.get(collection, []) for collection in self.keys
+            }
+        dumps = self._dumps
+        try:
+            return dumps(rest), {
+                collection: {self.keys[collection](item): dumps(item) for item in items}
+                for collection, items in collections.items()
+            }
+        except json_util.JSON_ENCODE_EXCEPTIONS as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {err}"
+            ) from err
+
+    def write_changes(self, path: str, data: dict, private: bool) -> bool:
+        """Append the changes since the previous write to the journal.
+
+        Returns False if the store has to be compacted instead.
+        """
+        if self._items is None:
+            return False
+
+        old_items = self._items
+        self._items = None
+        rest, items = self._split(data)
+        if rest != self._rest:
+            return False
+
+        dumps = self._dumps
+        lines = []
+        total = 0
+        for collection, new in items.items():
+            old = old_items[collection]
+            total += len(new)
+            prefix = f'{{"c":{dumps(collection)},"k":'
+            for key, value in new.items():
+                if old.get(key) != value:
+                    lines.append(f'{prefix}{dumps(key)},"v":{value}}}\n')
+            for key in old.keys() - new.keys():
+                lines.append(f'{prefix}{dumps(key)},"v":null}}\n')
+
+        if self.entries + len(lines) > max(total, JOURNAL_MIN_COMPACT_ENTRIES):
+            return False
+
+        if lines:
+            if self.entries == 0:
+                lines.insert(0, dumps({"journal_id": self.journal_id}) + "\n")
+            _LOGGER.debug("Appending %s changes to %s", len(lines), path)
+            try:
+                fdesc = os.open(
+                    path + JOURNAL_SUFFIX,
+                    os.O_WRONLY
+                    | os.O_CREAT
+                    | (os.O_APPEND if self.entries else os.O_TRUNC),
+                    0o600 if private else 0o644,
+                )
+                with open(fdesc, "w", encoding="utf-8") as file:
+                    file.write("".join(lines))
+            except OSError as err:
+                raise json_util.WriteError(err) from err
+            self.entries += len(lines)
+
+        self._items = items
+        return True
+
+    def compacted(self, path: str, data: dict) -> None:
+        """Handle the main file being written with all data."""
+        self.journal_id = data["journal_id"]
+        self.entries = 0
+        # A journal left behind is ignored on load and truncated on next write
+        with suppress(OSError):
+            os.unlink(path + JOURNAL_SUFFIX)
+        rest, self._items = self._split(data)
+        self._rest = rest
+
+    def reset(self) -> None:
+        """Compact on the next write."""
+        self.journal_id = None
+        self.entries = 0
+        self._items = None
+
+    def replay(self, path: str, data: dict) -> None:
+        """Apply the journal that belongs to the loaded main file."""
+        try:
+            with open(path + JOURNAL_SUFFIX, encoding="utf-8") as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.exception("Journal reading failed: %s", path)
+            raise HomeAssistantError(err) from err
+
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except ValueError:
+            header = {}
+        if "journal_id" not in data or header.get("journal_id") != data["journal_id"]:
+            # Left behind by a compaction that was interrupted
+            _LOGGER.debug("Ignoring stale journal of %s", path)
+            return
+
+        indexes: dict[str | None, dict[str, int]] = {}
+        for line in lines[1:]:
+            try:
+                change = json.loads(line)
+            except ValueError:
+                # A write was interrupted, everything before it is complete
+                _LOGGER.warning("Ignoring incomplete journal entry of %s", path)
+                break
+
+            collection = change["c"]
+            if collection is None:
+                items = data["data"]
+            else:
+                items = data["data"].setdefault(collection, [])
+            if (index := indexes.get(collection)) is None:
+                key_func = self.keys[collection]
+                index = indexes[collection] = {
+                    key_func(item): idx
+                    for idx, item in enumerate(items)
+                    if item is not None
+                }
+
+            if (idx := index.get(change["k"])) is not None:
+                items[idx] = change["v"]
+                if change["v"] is None:
+                    del index[change["k"]]
+            elif change["v"] is not None:
+                index[change["k"]] = len(items)
+                items.append(change["v"])
+
+        for collection in indexes:
+            items = data["data"] if collection is None else data["data"][collection]
+            items[:] = [item for item in items if item is not None]
+
+
 @bind_hass
 class Store:
-    """Class to help storing data."""
+    """Class to help storing data.
+
+    Stores holding large collections of items can pass journal_keys to write
+    in journal mode. It maps the key of each collection in the stored dict,
+    or None if the stored data is a list of items, to a function returning
+    the unique key of an item. Only changed items are then appended to a
+    journal next to the main file, which is compacted periodically.
+    """
 
     def __init__(
         self,
@@ -79,6 +268,7 @@ class Store:
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
+        journal_keys: Mapping[str | None, Callable[[Any], str]] | None = None,
     ) -> None:
         """Initialize storage class."""
         self.version = version
@@ -91,8 +281,12 @@ class Store:
         self._unsub_final_write_listener: CALLBACK_TYPE | None = None
         self._write_lock = asyncio.Lock()
         self._load_task: asyncio.Future | None = None
-        self._encoder = encoder
+        # Home Assistant objects are converted unless another encoder is given
+        self._encoder = encoder or json_util.JSONEncoder
         self._atomic_writes = atomic_writes
+        self._journal = (
+            None if journal_keys is None else _StoreJournal(journal_keys, self._encoder)
+        )
 
     @property
     def path(self):
@@ -131,16 +325,17 @@ class Store:
             data = self._data
 
             # If we didn't generate data yet, do it now.
-            if "data_func" in data:
+            if "snapshot_func" in data:
+                data_func = data.pop("data_func")
+                data["data"] = data_func(data.pop("snapshot_func")())
+            elif "data_func" in data:
                 data["data"] = data.pop("data_func")()
 
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data, self.path)
 
             if data == {}:
                 return None
@@ -196,10 +391,17 @@ class Store:
     @callback
     def async_delay_save(
         self,
-        data_func: Callable[[], dict | list],
+        data_func: Callable[..., dict | list],
         delay: float = 0,
+        *,
+        snapshot_func: Callable[[], Any] | None = None,
     ) -> None:
-        """Save data with an optional delay."""
+        """Save data with an optional delay.
+
+        If snapshot_func is passed, only the snapshot it returns is taken in the
+        event loop and data_func is called with it in the executor. The snapshot
+        must not change afterwards, for example a tuple of frozen entries.
+        """
         # pylint: disable-next=import-outside-toplevel
         from .event import async_call_later
 
@@ -209,6 +411,8 @@ class Store:
             "key": self.key,
             "data_func": data_func,
         }
+        if snapshot_func is not None:
+            self._data["snapshot_func"] = snapshot_func
 
         self._async_cleanup_delay_listener()
         self._async_ensure_final_write_listener()
@@ -267,22 +471,44 @@ class Store:
 
             data = self._data
 
-            if "data_func" in data:
+            if "snapshot_func" in data:
+                data["data_func"] = partial(
+                    data["data_func"], data.pop("snapshot_func")()
+                )
+            elif "data_func" in data:
                 data["data"] = data.pop("data_func")()
 
             self._data = None
 
             try:
                 await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
+                    self._build_and_write_data, self.path, data
                 )
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self, path: str) -> dict | list:
+        """Load the data and apply the journal."""
+        data = json_util.load_json(path)
+        if self._journal is not None and data:
+            self._journal.replay(path, data)  # type: ignore[arg-type]
+        return data
+
+    def _build_and_write_data(self, path: str, data: dict) -> None:
+        """Build the data from its snapshot if needed and write it."""
+        if "data_func" in data:
+            data["data"] = data.pop("data_func")()
+        self._write_data(path, data)
+
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if self._journal is not None:
+            if self._journal.write_changes(path, data, self._private):
+                return
+            data = {**data, "journal_id": uuid_util.random_uuid_hex()}
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_util.save_json(
             path,
@@ -292,6 +518,9 @@ class Store:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal is not None:
+            self._journal.compacted(path, data)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -303,3 +532,10 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal is not None:
+            self._journal.reset()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, self.path + JOURNAL_SUFFIX
+                )
@@ -4,6 +4,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager, suppress
@@ -21,7 +22,6 @@ from struct import error as StructError, pack, unpack_from
 import sys
 from typing import Any, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import pass_context, pass_environment
@@ -31,6 +31,7 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_PERSONS,
@@ -70,6 +71,9 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+REGEX_CACHE_SIZE = 1024
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -79,15 +83,20 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 _GROUP_DOMAIN_PREFIX = "group."
 _ZONE_DOMAIN_PREFIX = "zone."
 
-_COLLECTABLE_STATE_ATTRIBUTES = {
-    "state",
-    "attributes",
-    "last_changed",
-    "last_updated",
-    "context",
-    "domain",
-    "object_id",
-    "name",
+# Any change of the state re-renders the template
+_ALL_STATE_FIELDS = "*"
+
+# The field of the state that is collected when a template accesses one of
+# its properties, None for properties that never change for an entity.
+_COLLECTABLE_STATE_ATTRIBUTES: dict[str, str | tuple[str, str] | None] = {
+    "state": "state",
+    "attributes": "attributes",
+    "last_changed": "last_changed",
+    "last_updated": "last_updated",
+    "context": "context",
+    "domain": None,
+    "object_id": None,
+    "name": ("attributes", ATTR_FRIENDLY_NAME),
 }
 
 ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
@@ -238,6 +247,12 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The fields of the state of each entity the template accessed,
+        # attributes read with state_attr are tracked by name.
+        self.entity_fields: dict[str, set[str | tuple[str, str]]] = {}
+        # If any field besides the entity_id of the states returned by
+        # iterating all states or a domain was accessed.
+        self.iterated_states_accessed = False
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -259,6 +274,47 @@ class RenderInfo:
         """Template should re-render if the entity is added or removed with domains watched."""
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def _collect_field(
+        self, entity_id: str, field: str | tuple[str, str] | None
+    ) -> None:
+        """Collect the entity and the field of its state that was accessed."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        if (fields := self.entity_fields.get(entity_id)) is None:
+            fields = self.entity_fields[entity_id] = set()
+        if field is not None:
+            fields.add(field)
+
+    def state_fields_changed(
+        self, entity_id: str, old_state: State, new_state: State
+    ) -> bool:
+        """Return if the fields of the state the template accessed changed.
+
+        Templates iterating all states or a domain without accessing the
+        iterated states besides their entity_id only need to re-render
+        when entities are added or removed.
+        """
+        if self.exception:
+            return True
+
+        iterated = self.all_states or split_entity_id(entity_id)[0] in self.domains
+        if iterated and self.iterated_states_accessed:
+            return True
+
+        if (fields := self.entity_fields.get(entity_id)) is None:
+            return not iterated
+
+        for field in fields:
+            if field == _ALL_STATE_FIELDS:
+                return True
+            if isinstance(field, tuple):
+                name = field[1]
+                if old_state.attributes.get(name) != new_state.attributes.get(name):
+                    return True
+            elif getattr(old_state, field) != getattr(new_state, field):
+                return True
+
+        return False
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -734,18 +790,27 @@ class TemplateStateBase(State):
         self._collect = collect
         self._entity_id = entity_id
 
-    def _collect_state(self) -> None:
-        if self._collect and _RENDER_INFO in self._hass.data:
-            self._hass.data[_RENDER_INFO].entities.add(self._entity_id)
+    def _collect_state(
+        self, field: str | tuple[str, str] | None = _ALL_STATE_FIELDS
+    ) -> None:
+        if (render_info := self._hass.data.get(_RENDER_INFO)) is None:
+            return
+        if self._collect:
+            render_info._collect_field(self._entity_id, field)
+        else:
+            render_info.iterated_states_accessed = True
+
+    def _get_attribute(self, name: str) -> Any:
+        """Return an attribute of the state and only collect that attribute."""
+        self._collect_state(("attributes", name))
+        return self._state.attributes.get(name)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item):
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and _RENDER_INFO in self._hass.data:
-                self._hass.data[_RENDER_INFO].entities.add(self._entity_id)
+            self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES[item])
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -764,55 +829,56 @@ class TemplateStateBase(State):
     @property
     def state(self):
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state("state")
         return self._state.state
 
     @property
     def attributes(self):
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.attributes
 
     @property
     def last_changed(self):
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state("last_changed")
         return self._state.last_changed
 
     @property
     def last_updated(self):
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state("last_updated")
         return self._state.last_updated
 
     @property
     def context(self):
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state("context")
         return self._state.context
 
     @property
     def domain(self):
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state(None)
         return self._state.domain
 
     @property
     def object_id(self):
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state(None)
         return self._state.object_id
 
     @property
     def name(self):
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state(("attributes", ATTR_FRIENDLY_NAME))
         return self._state.name
 
     @property
     def state_with_unit(self) -> str:
         """Return the state concatenated with the unit if available."""
-        self._collect_state()
+        self._collect_state("state")
+        self._collect_state(("attributes", ATTR_UNIT_OF_MEASUREMENT))
         unit = self._state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return f"{self._state.state} {unit}" if unit else self._state.state
 
@@ -835,6 +901,7 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -861,7 +928,7 @@ class TemplateStateFromEntityId(TemplateStateBase):
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := hass.data.get(_RENDER_INFO)) is not None:
-        entity_collect.entities.add(entity_id)
+        entity_collect._collect_field(entity_id, _ALL_STATE_FIELDS)
 
 
 def _state_generator(hass: HomeAssistant, domain: str | None) -> Generator:
@@ -1305,7 +1372,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._get_attribute(name)
     return None
 
 
@@ -1646,29 +1713,33 @@ def is_number(value):
     return True
 
 
+def _compile_regex(find: str, ignorecase: bool) -> re.Pattern:
+    """Return the compiled pattern from the regex cache."""
+    key = (find, ignorecase)
+    if (regex := _REGEX_CACHE.get(key)) is None:
+        regex = _REGEX_CACHE[key] = re.compile(find, re.I if ignorecase else 0)
+    return regex
+
+
 def regex_match(value, find="", ignorecase=False):
     """Match value using regex."""
     if not isinstance(value, str):
         value = str(value)
-    flags = re.I if ignorecase else 0
-    return bool(re.match(find, value, flags))
+    return bool(_compile_regex(find, ignorecase).match(value))
 
 
 def regex_replace(value="", find="", replace="", ignorecase=False):
     """Replace using regex."""
     if not isinstance(value, str):
         value = str(value)
-    flags = re.I if ignorecase else 0
-    regex = re.compile(find, flags)
-    return regex.sub(replace, value)
+    return _compile_regex(find, ignorecase).sub(replace, value)
 
 
 def regex_search(value, find="", ignorecase=False):
     """Search using regex."""
     if not isinstance(value, str):
         value = str(value)
-    flags = re.I if ignorecase else 0
-    return bool(re.search(find, value, flags))
+    return bool(_compile_regex(find, ignorecase).search(value))
 
 
 def regex_findall_index(value, find="", index=0, ignorecase=False):
@@ -1680,8 +1751,7 @@ def regex_findall(value, find="", ignorecase=False):
     """Find all matches using regex."""
     if not isinstance(value, str):
         value = str(value)
-    flags = re.I if ignorecase else 0
-    return re.findall(find, value, flags)
+    return _compile_regex(find, ignorecase).findall(value)
 
 
 def bitwise_and(first_value, second_value):
@@ -1883,6 +1953,88 @@ class LoggingUndefined(jinja2.Undefined):
         return super().__bool__()
 
 
+class TemplateCache:
+    """A size bounded LRU cache that keeps hit and miss counters."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache."""
+        self._cache: OrderedDict[Any, Any] = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._cache)
+
+    def __contains__(self, key: Any) -> bool:
+        """Return if the key is cached without touching the counters."""
+        return key in self._cache
+
+    def get(self, key: Any) -> Any | None:
+        """Return the cached value or None if it is not cached."""
+        if (value := self._cache.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # The cache can be used from executor threads while
+        # validating config, the key may have been evicted since.
+        try:
+            self._cache.move_to_end(key)
+        except KeyError:
+            pass
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Cache a value and evict the least recently used entries."""
+        self._cache[key] = value
+        while len(self._cache) > self.max_size:
+            try:
+                self._cache.popitem(last=False)
+            except KeyError:
+                break
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._cache.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+# Compiled template code shared by all template environments, keyed by
+# the environment flavour and the template source. The code is bound to
+# a specific environment when the template is rendered.
+_COMPILED_TEMPLATE_CACHE = TemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
+def compiled_template_cache_info() -> dict[str, Any]:
+    """Return the size and hit rate of the compiled template cache."""
+    return _COMPILED_TEMPLATE_CACHE.as_dict()
+
+
+# Compiled patterns used by the regex filters and tests, keyed by the
+# pattern and if the case is ignored.
+_REGEX_CACHE = TemplateCache(REGEX_CACHE_SIZE)
+
+
+def regex_cache_info() -> dict[str, Any]:
+    """Return the size and hit rate of the regex pattern cache."""
+    return _REGEX_CACHE.as_dict()
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -1894,7 +2046,16 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        # The available filters and globals differ per flavour and jinja
+        # checks them while compiling, so the code is cached per flavour.
+        if hass is None:
+            self.flavour = "no_hass"
+        elif limited:
+            self.flavour = "limited"
+        elif strict:
+            self.flavour = "strict"
+        else:
+            self.flavour = "normal"
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -2088,8 +2249,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (self.flavour, source)
+        if (cached := _COMPILED_TEMPLATE_CACHE.get(key)) is None:
+            cached = _COMPILED_TEMPLATE_CACHE[key] = super().compile(source)
 
         return cached
 
@@ -24,6 +24,7 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from .exceptions import HomeAssistantError
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.dhcp import DHCP
 from .generated.mqtt import MQTT
@@ -31,6 +32,7 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .util.async_ import gather_with_concurrency
+from .util.file import write_utf8_file_atomic
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -43,6 +45,9 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
+MANIFEST_INDEX_FILE = "core.manifest_index"
+MANIFEST_INDEX_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -120,6 +125,96 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class ManifestIndex:
+    """Parsed manifest.json files, invalidated when a file changes on disk.
+
+    Entries are keyed by the path of the manifest and hold the mtime and size
+    of the file when it was parsed.
+    """
+
+    def __init__(self, entries: dict[str, list[Any]] | None = None) -> None:
+        """Initialize the index."""
+        self._entries: dict[str, list[Any]] = entries or {}
+        self._used: set[str] = set()
+        self.changed = False
+
+    def __len__(self) -> int:
+        """Return the number of indexed manifests."""
+        return len(self._entries)
+
+    def load_manifest(self, manifest_path: pathlib.Path) -> Manifest:
+        """Return the manifest, only parsing the file if it changed.
+
+        Raises OSError if the file can't be read and ValueError if it is not
+        valid JSON.
+        """
+        stat = manifest_path.stat()
+        key = str(manifest_path)
+        self._used.add(key)
+        if (entry := self._entries.get(key)) is not None and entry[:2] == [
+            stat.st_mtime_ns,
+            stat.st_size,
+        ]:
+            return cast(Manifest, dict(entry[2]))
+
+        manifest = json.loads(manifest_path.read_text())
+        self._entries[key] = [stat.st_mtime_ns, stat.st_size, manifest]
+        self.changed = True
+        return cast(Manifest, dict(manifest))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the entries of the manifests that were loaded to store them."""
+        return {
+            "version": MANIFEST_INDEX_VERSION,
+            "data": {
+                key: entry for key, entry in self._entries.items() if key in self._used
+            },
+        }
+
+
+def _read_manifest_index(path: pathlib.Path) -> dict[str, list[Any]] | None:
+    """Read the stored manifest index."""
+    try:
+        stored = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(stored, dict) or stored.get("version") != MANIFEST_INDEX_VERSION:
+        return None
+    return cast(dict[str, list[Any]], stored["data"])
+
+
+def _write_manifest_index(path: pathlib.Path, data: dict[str, Any]) -> None:
+    """Write the manifest index."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_utf8_file_atomic(str(path), json.dumps(data))
+
+
+async def async_load_manifest_index(hass: HomeAssistant) -> ManifestIndex:
+    """Load the manifest index stored at the last startup."""
+    if (index := hass.data.get(DATA_MANIFEST_INDEX)) is not None:
+        return cast(ManifestIndex, index)
+
+    path = pathlib.Path(hass.config.path(".storage", MANIFEST_INDEX_FILE))
+    entries = await hass.async_add_executor_job(_read_manifest_index, path)
+    index = hass.data[DATA_MANIFEST_INDEX] = ManifestIndex(entries)
+    return index
+
+
+async def async_save_manifest_index(hass: HomeAssistant) -> None:
+    """Store the manifest index if manifests changed since it was loaded."""
+    index: ManifestIndex | None = hass.data.get(DATA_MANIFEST_INDEX)
+    if index is None or not index.changed:
+        return
+
+    path = pathlib.Path(hass.config.path(".storage", MANIFEST_INDEX_FILE))
+    try:
+        await hass.async_add_executor_job(_write_manifest_index, path, index.as_dict())
+    except (OSError, HomeAssistantError) as err:
+        _LOGGER.warning("Unable to store the manifest index: %s", err)
+        return
+    index.changed = False
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -359,6 +454,7 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index: ManifestIndex | None = hass.data.get(DATA_MANIFEST_INDEX)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
@@ -366,7 +462,10 @@ class Integration:
                 continue
 
             try:
-                manifest = json.loads(manifest_path.read_text())
+                if index is None:
+                    manifest = json.loads(manifest_path.read_text())
+                else:
+                    manifest = index.load_manifest(manifest_path)
             except ValueError as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
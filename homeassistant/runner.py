@@ -46,6 +46,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    trace_startup: bool = False
 
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
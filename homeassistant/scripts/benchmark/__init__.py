@@ -6,20 +6,24 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
-import json
 import logging
+import pathlib
+import re
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 from typing import TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import template
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -121,6 +125,131 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+async def _fire_events_to_many_listeners(hass, listener_count, use_match):
+    """Fire events for one entity with a listener per entity."""
+    count = 0
+    events_to_fire = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    def _filter_entity_id(entity_id):
+        @core.callback
+        def event_filter(event):
+            """Filter event."""
+            return event.data.get("entity_id") == entity_id
+
+        return event_filter
+
+    for idx in range(listener_count):
+        entity_id = f"sensor.benchmark_{idx}"
+        if use_match:
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED, listener, match_entity_ids=[entity_id]
+            )
+        else:
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                listener,
+                event_filter=_filter_entity_id(entity_id),
+            )
+
+    event_data = {"entity_id": "sensor.benchmark_0"}
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_with_filter_1k_listeners(hass):
+    """Fire 10k events to 1k listeners filtering on their entity_id."""
+    return await _fire_events_to_many_listeners(hass, 10**3, False)
+
+
+@benchmark
+async def fire_events_with_filter_10k_listeners(hass):
+    """Fire 10k events to 10k listeners filtering on their entity_id."""
+    return await _fire_events_to_many_listeners(hass, 10**4, False)
+
+
+@benchmark
+async def fire_events_with_match_1k_listeners(hass):
+    """Fire 10k events to 1k listeners matching on their entity_id."""
+    return await _fire_events_to_many_listeners(hass, 10**3, True)
+
+
+@benchmark
+async def fire_events_with_match_10k_listeners(hass):
+    """Fire 10k events to 10k listeners matching on their entity_id."""
+    return await _fire_events_to_many_listeners(hass, 10**4, True)
+
+
+@benchmark
+async def load_integrations_100(hass):
+    """Resolve 100 integrations 10 times with a manifest index."""
+    return await _load_integrations(hass, 100, True)
+
+
+@benchmark
+async def load_integrations_100_unindexed(hass):
+    """Resolve 100 integrations 10 times parsing their manifests."""
+    return await _load_integrations(hass, 100, False)
+
+
+@benchmark
+async def load_integrations_300(hass):
+    """Resolve 300 integrations 10 times with a manifest index."""
+    return await _load_integrations(hass, 300, True)
+
+
+@benchmark
+async def load_integrations_300_unindexed(hass):
+    """Resolve 300 integrations 10 times parsing their manifests."""
+    return await _load_integrations(hass, 300, False)
+
+
+async def _load_integrations(hass, count, use_index):
+    """Resolve the integrations and their dependencies like bootstrap does."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import components, loader
+
+    hass.config.config_dir = tempfile.gettempdir()
+    hass.config.safe_mode = True
+    domains = sorted(
+        manifest.parent.name
+        for manifest in pathlib.Path(components.__path__[0]).glob("*/manifest.json")
+    )[:count]
+
+    if use_index:
+        # The index stored by the previous startup
+        hass.data[loader.DATA_MANIFEST_INDEX] = loader.ManifestIndex()
+        for domain in domains:
+            await loader.async_get_integration(hass, domain)
+
+    start = timer()
+
+    for _ in range(10):
+        hass.data.pop(loader.DATA_INTEGRATIONS, None)
+        integrations = await asyncio.gather(
+            *(loader.async_get_integration(hass, domain) for domain in domains)
+        )
+        await asyncio.gather(
+            *(integration.resolve_dependencies() for integration in integrations)
+        )
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -299,6 +428,78 @@ async def valid_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def template_compile_reload(hass):
+    """Compile 2000 templates at startup and on 5 reloads."""
+    return _template_compile_reload(hass, False)
+
+
+@benchmark
+async def template_compile_reload_uncached(hass):
+    """Compile 2000 templates at startup and on 5 reloads without sharing code."""
+    return _template_compile_reload(hass, True)
+
+
+def _template_compile_reload(hass, clear_cache):
+    """Compile 2000 templates from 200 distinct sources 6 times."""
+    # pylint: disable=protected-access
+    template._COMPILED_TEMPLATE_CACHE.clear()
+    sources = [
+        f"{{{{ states('sensor.power_{idx % 200}') | float(0) * {idx % 200} }}}}"
+        for idx in range(2000)
+    ]
+
+    start = timer()
+
+    for _ in range(6):
+        if clear_cache:
+            template._COMPILED_TEMPLATE_CACHE.clear()
+        templates = [template.Template(source, hass) for source in sources]
+        for tpl in templates:
+            tpl.ensure_valid()
+
+    return timer() - start
+
+
+@benchmark
+async def template_regex_filters(hass):
+    """Run the template regex filters 100k times each."""
+    return _template_regex_filters()
+
+
+@benchmark
+async def template_regex_filters_re_cache(hass):
+    """Run the template regex filters 100k times each with re.compile.
+
+    re.compile looks the patterns up in the 512 entry cache of the re module,
+    so this is the baseline the template regex cache is compared against.
+    """
+    # pylint: disable=protected-access
+    compile_regex = template._compile_regex
+    template._compile_regex = lambda find, ignorecase: re.compile(
+        find, re.I if ignorecase else 0
+    )
+    try:
+        return _template_regex_filters()
+    finally:
+        template._compile_regex = compile_regex
+
+
+def _template_regex_filters():
+    """Run the regex filters like an MQTT value template renders them."""
+    values = ["on", "off"] * 5 * 10**4
+
+    start = timer()
+
+    for value in values:
+        template.regex_search(value, "^(on|off)$", True)
+        template.regex_match(value, "o[nf]+")
+        template.regex_replace(value, "^o", "O")
+        template.regex_findall(value, "[a-z]")
+
+    return timer() - start
+
+
 @benchmark
 async def json_serialize_states(hass):
     """Serialize million states with websocket default encoder."""
@@ -312,6 +513,524 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_states_20_clients(hass):
+    """Serialize 5k states for 20 clients connecting with the cached JSON."""
+    return _serialize_states_for_clients(True)
+
+
+@benchmark
+async def json_serialize_states_20_clients_uncached(hass):
+    """Serialize 5k states for each of 20 clients connecting."""
+    return _serialize_states_for_clients(False)
+
+
+def _serialize_states_for_clients(cached):
+    """Serialize states like get_states and subscribe_entities per client."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.websocket_api.messages import (
+        construct_event_message,
+        construct_result_message,
+    )
+
+    states = [
+        core.State(
+            f"sensor.power_{idx}",
+            str(idx),
+            {
+                "friendly_name": f"Power {idx}",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+            },
+        )
+        for idx in range(5000)
+    ]
+
+    start = timer()
+    for iden in range(20):
+        if cached:
+            construct_result_message(
+                iden, "[" + ",".join(state.as_dict_json() for state in states) + "]"
+            )
+            added = ",".join(state.as_compressed_state_json() for state in states)
+            construct_event_message(iden, '{"a":{' + added + "}}")
+        else:
+            JSON_DUMP({"id": iden, "type": "result", "result": states})
+            JSON_DUMP(
+                {
+                    "id": iden,
+                    "type": "event",
+                    "event": {
+                        "a": {
+                            state.entity_id: dict(state.as_compressed_state())
+                            for state in states
+                        }
+                    },
+                }
+            )
+    return timer() - start
+
+
+@benchmark
+async def websocket_compress_states_uncompressed(hass):
+    """Send 5k states and 5k state changes over a websocket uncompressed."""
+    return await _websocket_compress_states(0)
+
+
+@benchmark
+async def websocket_compress_states_level_1(hass):
+    """Send 5k states and 5k state changes compressed at level 1."""
+    return await _websocket_compress_states(1)
+
+
+@benchmark
+async def websocket_compress_states_level_6(hass):
+    """Send 5k states and 5k state changes compressed at level 6."""
+    return await _websocket_compress_states(6)
+
+
+async def _websocket_compress_states(level):
+    """Send the messages of a client loading and following the states."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.websocket_api.const import (
+        DEFAULT_COMPRESSION_THRESHOLD,
+    )
+    from homeassistant.components.websocket_api.http import CompressionWebSocketWriter
+    from homeassistant.components.websocket_api.messages import (
+        cached_state_diff_message,
+        construct_result_message,
+    )
+
+    class NullProtocol:
+        """Protocol that is always drained."""
+
+        async def _drain_helper(self):
+            """Return as drained."""
+
+    class NullTransport:
+        """Transport discarding the data."""
+
+        def is_closing(self):
+            """Return the transport is open."""
+            return False
+
+        def write(self, data):
+            """Discard the data."""
+
+    states = [
+        core.State(
+            f"sensor.power_{idx}",
+            str(idx),
+            {
+                "friendly_name": f"Power {idx}",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+            },
+        )
+        for idx in range(5000)
+    ]
+    messages = [
+        construct_result_message(
+            1, "[" + ",".join(state.as_dict_json() for state in states) + "]"
+        )
+    ]
+    for idx, old_state in enumerate(states):
+        new_state = core.State(old_state.entity_id, str(idx + 1), old_state.attributes)
+        event = core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": old_state.entity_id,
+                "old_state": old_state,
+                "new_state": new_state,
+            },
+        )
+        messages.append(cached_state_diff_message(2, event))
+
+    writer = CompressionWebSocketWriter(
+        NullProtocol(),
+        NullTransport(),
+        compress=15 if level else 0,
+        compression_level=level,
+        compression_threshold=DEFAULT_COMPRESSION_THRESHOLD,
+    )
+    start = timer()
+    for message in messages:
+        await writer.send(message)
+    runtime = timer() - start
+
+    saved = 1 - writer.bytes_sent / writer.message_bytes_sent
+    print(
+        f"Sent {writer.message_bytes_sent} bytes of messages "
+        f"in {writer.bytes_sent} bytes ({saved:.0%} saved)"
+    )
+    return runtime
+
+
+@benchmark
+async def sensor_write_state(hass):
+    """Write the state of a typical sensor entity 100k times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.sensor import SensorEntity
+
+    return _sensor_write_state(hass, SensorEntity)
+
+
+@benchmark
+async def sensor_write_state_cached(hass):
+    """Write the state of a sensor caching its static attributes 100k times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.sensor import SensorEntity
+
+    class CachingSensorEntity(SensorEntity):
+        _cache_static_state_attributes = True
+
+    return _sensor_write_state(hass, CachingSensorEntity)
+
+
+def _sensor_write_state(hass, entity_class):
+    """Write the state of a typical sensor entity of the class 100k times."""
+    entity = _create_power_sensor(hass, entity_class)
+    start = timer()
+    for value in range(10**5):
+        entity._attr_native_value = value  # pylint: disable=protected-access
+        entity.async_write_ha_state()
+    return timer() - start
+
+
+@benchmark
+async def entity_set_attributes(hass):
+    """Set attributes of a sensor entity 1M times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.sensor import SensorEntity
+
+    return _entity_set_attributes(hass, SensorEntity)
+
+
+@benchmark
+async def entity_set_attributes_cached(hass):
+    """Set attributes of a sensor caching its static attributes 1M times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.sensor import SensorEntity
+
+    class CachingSensorEntity(SensorEntity):
+        _cache_static_state_attributes = True
+
+    return _entity_set_attributes(hass, CachingSensorEntity)
+
+
+def _entity_set_attributes(hass, entity_class):
+    """Set an attribute and a static state attribute of an entity 500k times each."""
+    entity = _create_power_sensor(hass, entity_class)
+    start = timer()
+    for value in range(5 * 10**5):
+        # pylint: disable=protected-access
+        entity._attr_native_value = value
+        entity._attr_icon = "mdi:flash"
+    return timer() - start
+
+
+def _create_power_sensor(hass, entity_class):
+    """Create a typical power sensor entity of the class."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.sensor import (
+        SensorDeviceClass,
+        SensorEntityDescription,
+        SensorStateClass,
+    )
+
+    entity = entity_class()
+    entity.hass = hass
+    entity.entity_id = "sensor.power"
+    entity.entity_description = SensorEntityDescription(
+        key="power",
+        name="Power",
+        icon="mdi:flash",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement="W",
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+    return entity
+
+
+@benchmark
+async def entity_registry_save(hass):
+    """Measure the longest event loop stall saving 20k registry entries."""
+    return await _entity_registry_save(hass, True)
+
+
+@benchmark
+async def entity_registry_save_in_loop(hass):
+    """Measure the longest event loop stall saving 20k entries built in loop."""
+    return await _entity_registry_save(hass, False)
+
+
+async def _entity_registry_save(hass, snapshot):
+    """Save a large entity registry and return the longest loop stall."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from homeassistant.helpers import entity_registry as er
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        registry = er.EntityRegistry(hass)
+        await registry.async_load()
+        for idx in range(20000):
+            entry = registry.async_get_or_create(
+                "sensor",
+                "benchmark",
+                f"unique_{idx}",
+                capabilities={"state_class": "measurement"},
+                original_name=f"Sensor {idx}",
+                unit_of_measurement="W",
+            )
+        # Write everything once, so only the changed entry is journaled
+        await registry._store._async_handle_write_data()
+        registry.async_update_entity(entry.entity_id, name="Renamed")
+
+        if snapshot:
+            registry.async_schedule_save()
+        else:
+            registry._store.async_delay_save(
+                lambda: registry._data_to_save(registry._async_snapshot())
+            )
+
+        stall = 0.0
+
+        async def _measure_stall():
+            nonlocal stall
+            last = timer()
+            while True:
+                await asyncio.sleep(0)
+                now = timer()
+                stall = max(stall, now - last)
+                last = now
+
+        task = asyncio.create_task(_measure_stall())
+        await asyncio.sleep(0)
+        await registry._store._async_handle_write_data()
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    return stall
+
+
+@benchmark
+async def mqtt_match_10k_subscriptions(hass):
+    """Match 1k distinct topics against 10k subscriptions with a topic trie."""
+    return _mqtt_match_subscriptions(True)
+
+
+@benchmark
+async def mqtt_match_10k_subscriptions_linear(hass):
+    """Match 1k distinct topics against 10k subscriptions one by one."""
+    return _mqtt_match_subscriptions(False)
+
+
+def _mqtt_match_subscriptions(use_trie):
+    """Match topics like zigbee2mqtt and discovery publish them."""
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    from homeassistant.components.mqtt.util import TopicTrie
+
+    topic_filters = ["homeassistant/#", "zigbee2mqtt/bridge/#"]
+    for idx in range(9998):
+        if idx % 2:
+            topic_filters.append(f"zigbee2mqtt/device_{idx}")
+        else:
+            topic_filters.append(f"homeassistant/sensor/device_{idx}/+/state")
+    topics = [
+        topic
+        for idx in range(0, 10000, 20)
+        for topic in (
+            f"zigbee2mqtt/device_{idx}",
+            f"homeassistant/sensor/device_{idx}/power/state",
+        )
+    ]
+
+    if use_trie:
+        trie: TopicTrie[str] = TopicTrie()
+        for topic_filter in topic_filters:
+            trie.add(topic_filter, topic_filter)
+        match = trie.match
+    else:
+        matchers = []
+        for topic_filter in topic_filters:
+            matcher = MQTTMatcher()
+            matcher[topic_filter] = True
+            matchers.append((topic_filter, matcher))
+
+        def match(topic):
+            return [
+                topic_filter
+                for topic_filter, matcher in matchers
+                if next(matcher.iter_match(topic), False)
+            ]
+
+    start = timer()
+    for topic in topics:
+        match(topic)
+    return timer() - start
+
+
+@benchmark
+async def recorder_commit_states_generated_ids(hass):
+    """Commit 30k states with ids generated by the database."""
+    return await _recorder_commit_states(hass, False)
+
+
+@benchmark
+async def recorder_commit_states_assigned_ids(hass):
+    """Commit 30k states with ids assigned by the recorder."""
+    return await _recorder_commit_states(hass, True)
+
+
+async def _recorder_commit_states(hass, assign_ids):
+    """Commit 100 batches of 300 states like the recorder does every second."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from homeassistant.components.recorder.core import Recorder
+
+    instance = Recorder(
+        hass=hass,
+        auto_purge=False,
+        auto_repack=False,
+        keep_days=10,
+        purge_id_ranges=False,
+        commit_interval=1,
+        uri="sqlite://",
+        db_max_retries=1,
+        db_retry_wait=0,
+        db_read_url=None,
+        db_read_pool_size=0,
+        id_cache_size=2048,
+        entity_filter=lambda entity_id: True,
+        exclude_t=[],
+        exclude_attributes_by_domain={},
+    )
+    if not assign_ids:
+
+        def relate_pending_old_states():
+            """Leave the primary keys to the database, as the recorder did."""
+            for dbstate, old_state in instance._pending_old_states:
+                dbstate.old_state = old_state
+
+        instance._assign_pending_ids = relate_pending_old_states
+
+    entity_ids = [f"sensor.power_{idx}" for idx in range(300)]
+    old_states = {}
+    batches = []
+    for batch in range(100):
+        events = []
+        for entity_id in entity_ids:
+            new_state = core.State(entity_id, str(batch), {"batch": batch})
+            events.append(
+                core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_states.get(entity_id),
+                        "new_state": new_state,
+                    },
+                )
+            )
+            old_states[entity_id] = new_state
+        batches.append(events)
+
+    def commit_states():
+        instance._setup_connection()
+        instance._setup_run()
+        try:
+            start = timer()
+            for events in batches:
+                for event in events:
+                    instance._process_one_event(event)
+                instance._commit_event_session_or_retry()
+            return timer() - start
+        finally:
+            instance._close_event_session()
+            instance._close_connection()
+
+    return await hass.async_add_executor_job(commit_states)
+
+
+@benchmark
+async def history_lazy_state_response(hass):
+    """Convert 7 days of history for 200 sensors to LazyState and JSON."""
+    return await hass.async_add_executor_job(_history_response, False)
+
+
+@benchmark
+async def history_columnar_response(hass):
+    """Convert 7 days of history for 200 sensors to columns and JSON."""
+    return await hass.async_add_executor_job(_history_response, True)
+
+
+def _history_response(columnar):
+    """Convert the history of 200 sensors changing every 5 minutes."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.history import (
+        QUERY_STATE_NO_ATTR,
+        _sorted_states_to_columns,
+        _sorted_states_to_dict,
+    )
+    from homeassistant.components.recorder.models import Base, States
+    import homeassistant.util.dt as dt_util
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    start_time = dt_util.utcnow() - timedelta(days=7)
+    step = timedelta(minutes=5)
+    with engine.begin() as conn:
+        for idx in range(200):
+            entity_id = f"sensor.power_{idx}"
+            conn.execute(
+                States.__table__.insert(),
+                [
+                    {
+                        "entity_id": entity_id,
+                        "state": str(row % 100),
+                        "last_changed": start_time + step * row,
+                        "last_updated": start_time + step * row,
+                    }
+                    for row in range(2016)
+                ],
+            )
+    session = Session(engine)
+    rows = session.execute(
+        select(*QUERY_STATE_NO_ATTR).order_by(States.entity_id, States.last_updated)
+    ).all()
+    session.close()
+
+    def _convert():
+        if columnar:
+            result = _sorted_states_to_columns(
+                None, session, rows, start_time, None, include_start_time_state=False
+            )
+        else:
+            result = _sorted_states_to_dict(
+                None, session, rows, start_time, None, include_start_time_state=False
+            )
+        return JSON_DUMP(result)
+
+    start = timer()
+    _convert()
+    runtime = timer() - start
+
+    tracemalloc.start()
+    _convert()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Peak memory: {peak / 2**20:.1f} MiB")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -319,7 +1038,7 @@ def _create_state_changed_event_from_old_new(
     attributes = {}
     if new_state is not None:
         attributes = new_state.get("attributes")
-    attributes_json = json.dumps(attributes, cls=JSONEncoder)
+    attributes_json = json_dumps(attributes)
     if attributes_json == "null":
         attributes_json = "{}"
     row = collections.namedtuple(
@@ -33,6 +33,8 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP_TIME = "setup_time"
 
+DATA_SETUP_TRACE = "setup_trace"
+
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
 
@@ -40,6 +42,140 @@ SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
 
+class SetupTrace:
+    """Timings of the setup phases of the integrations set up during startup."""
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self.start = timer()
+        self.end: float | None = None
+        self.spans: list[tuple[str, str, float, float]] = []
+        self.dependencies: dict[str, set[str]] = {}
+
+    @property
+    def finished(self) -> bool:
+        """Return if startup finished and the trace no longer records."""
+        return self.end is not None
+
+    @core.callback
+    def async_finish(self) -> None:
+        """Stop recording when startup has finished."""
+        self.end = timer()
+
+    @core.callback
+    def async_add_span(
+        self, integration: str, phase: str, start: float, end: float
+    ) -> None:
+        """Record how long a setup phase of an integration took."""
+        self.spans.append((integration, phase, start - self.start, end - self.start))
+
+    @core.callback
+    def async_add_dependencies(self, integration: str, dependencies: set[str]) -> None:
+        """Record the integrations an integration waits for to be set up."""
+        self.dependencies.setdefault(integration, set()).update(dependencies)
+
+    def critical_path(self) -> list[dict[str, Any]]:
+        """Return the chain of integrations which gated startup the longest.
+
+        Starts at the integration which finished setting up last and walks back
+        through the dependency that finished last until reaching an integration
+        without traced dependencies.
+        """
+        started: dict[str, float] = {}
+        finished: dict[str, float] = {}
+        for integration, _, start, end in self.spans:
+            started[integration] = min(start, started.get(integration, start))
+            finished[integration] = max(end, finished.get(integration, end))
+
+        path: list[str] = []
+        candidates: Iterable[str] = finished
+        while candidates := [
+            integration
+            for integration in candidates
+            if integration in finished and integration not in path
+        ]:
+            integration = max(candidates, key=finished.__getitem__)
+            path.append(integration)
+            candidates = self.dependencies.get(integration, ())
+
+        return [
+            {
+                "domain": integration,
+                "start": round(started[integration], 6),
+                "end": round(finished[integration], 6),
+                "seconds": round(finished[integration] - started[integration], 6),
+            }
+            for integration in reversed(path)
+        ]
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the trace in the Chrome trace event format."""
+        thread_ids: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for integration, phase, start, end in self.spans:
+            if (tid := thread_ids.get(integration)) is None:
+                tid = thread_ids[integration] = len(thread_ids) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": integration},
+                    }
+                )
+            events.append(
+                {
+                    "name": phase,
+                    "cat": "setup",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": round(start * 1e6),
+                    "dur": round((end - start) * 1e6),
+                }
+            )
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "finished": self.finished,
+                "seconds": round((self.end or timer()) - self.start, 6),
+                "critical_path": self.critical_path(),
+            },
+        }
+
+
+@core.callback
+def async_start_setup_trace(hass: core.HomeAssistant) -> SetupTrace:
+    """Start tracing the setup of integrations."""
+    trace: SetupTrace = hass.data.setdefault(DATA_SETUP_TRACE, SetupTrace())
+    return trace
+
+
+@core.callback
+def async_get_setup_trace(hass: core.HomeAssistant) -> SetupTrace | None:
+    """Return the trace of the integrations set up during startup."""
+    return hass.data.get(DATA_SETUP_TRACE)
+
+
+@contextlib.contextmanager
+def async_trace_setup_phase(
+    hass: core.HomeAssistant, integration: str, phase: str
+) -> Generator[None, None, None]:
+    """Record how long a setup phase of an integration takes during startup."""
+    if (trace := hass.data.get(DATA_SETUP_TRACE)) is None or trace.finished:
+        yield
+        return
+
+    start = timer()
+    try:
+        yield
+    finally:
+        trace.async_add_span(integration, phase, start, timer())
+
+
 @core.callback
 def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: set[str]) -> None:
     """Set domains that are going to be loaded from the config.
@@ -107,6 +243,12 @@ async def _async_process_dependencies(
                 to_be_loaded[dep].wait()
             )
 
+    if (trace := hass.data.get(DATA_SETUP_TRACE)) is not None and not trace.finished:
+        trace.async_add_dependencies(
+            integration.domain,
+            {*integration.dependencies, *after_dependencies_tasks},
+        )
+
     if not dependencies_tasks and not after_dependencies_tasks:
         return []
 
@@ -123,10 +265,11 @@ async def _async_process_dependencies(
             list(after_dependencies_tasks),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    with async_trace_setup_phase(hass, integration.domain, "dependencies"):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -187,7 +330,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_trace_setup_phase(hass, domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}")
         return False
@@ -231,8 +375,9 @@ async def _async_setup_component(
                 return False
 
             if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
+                with async_trace_setup_phase(hass, domain, "async_setup"):
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
         except asyncio.TimeoutError:
             _LOGGER.error(
                 "Setup of %s is taking longer than %s seconds."
@@ -313,7 +458,8 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        with async_trace_setup_phase(hass, integration.domain, f"import {domain}"):
+            platform = integration.get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -356,10 +502,11 @@ async def async_process_deps_reqs(
         raise DependencyError(failed_deps)
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        with async_trace_setup_phase(hass, integration.domain, "requirements"):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
@@ -445,6 +592,7 @@ def async_start_setup(
     """Keep track of when setup starts and finishes."""
     setup_started = hass.data.setdefault(DATA_SETUP_STARTED, {})
     started = dt_util.utcnow()
+    start = timer()
     unique_components: dict[str, str] = {}
     for domain in components:
         unique = ensure_unique_string(domain, setup_started)
@@ -455,10 +603,15 @@ def async_start_setup(
 
     setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
     time_taken = dt_util.utcnow() - started
+    end = timer()
+    if (trace := hass.data.get(DATA_SETUP_TRACE)) is not None and trace.finished:
+        trace = None
     for unique, domain in unique_components.items():
         del setup_started[unique]
         if "." in domain:
-            _, integration = domain.split(".", 1)
+            platform, integration = domain.split(".", 1)
+            if trace is not None:
+                trace.async_add_span(integration, f"{platform} platform", start, end)
         else:
             integration = domain
         if integration in setup_time:
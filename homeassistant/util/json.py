@@ -1,19 +1,30 @@
 """JSON utility functions."""
 from __future__ import annotations
 
+from array import array
 from collections import deque
 from collections.abc import Callable
+import datetime
+from functools import partial
 import json
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
 from .file import write_utf8_file, write_utf8_file_atomic
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 _LOGGER = logging.getLogger(__name__)
 
+# orjson.JSONEncodeError is a subclass of TypeError
+JSON_ENCODE_EXCEPTIONS: Final = (TypeError, ValueError)
+
 
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
@@ -23,6 +34,127 @@ class WriteError(HomeAssistantError):
     """Error writing the data."""
 
 
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects that the JSON backend can't handle.
+
+    Raises TypeError for objects that are not supported.
+    """
+    if isinstance(obj, State):
+        return obj.as_dict()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, array):
+        return obj.tolist()
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    if isinstance(obj, float):
+        # Subclasses of float are not serialized natively by orjson
+        return float(obj)
+    if isinstance(obj, tuple):
+        # Subclasses of tuple (namedtuple) are not serialized natively by orjson
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONEncoder(json.JSONEncoder):
+    """JSONEncoder that supports Home Assistant objects."""
+
+    def default(self, o: Any) -> Any:
+        """Convert Home Assistant objects.
+
+        Hand other objects to the original method.
+        """
+        try:
+            return json_encoder_default(o)
+        except TypeError:
+            return json.JSONEncoder.default(self, o)
+
+
+if orjson is not None:
+
+    def json_bytes(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes.
+
+        NaN and infinity are serialized as null.
+        """
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS, default=json_encoder_default
+        )
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string.
+
+        NaN and infinity are serialized as null.
+        """
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS, default=json_encoder_default
+        ).decode("utf-8")
+
+    def _json_dumps_with_default(
+        obj: Any, default: Callable[[Any], Any] | None, indent: bool = False
+    ) -> str:
+        """Serialize an object converting what the JSON backend can't handle.
+
+        NaN and infinity are serialized as null.
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=default).decode("utf-8")
+
+else:  # pragma: no cover
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string.
+
+        NaN and infinity are not allowed.
+        """
+        return json.dumps(
+            obj,
+            default=json_encoder_default,
+            allow_nan=False,
+            separators=(",", ":"),
+        )
+
+    def json_bytes(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        return json_dumps(obj).encode("utf-8")
+
+    def _json_dumps_with_default(
+        obj: Any, default: Callable[[Any], Any] | None, indent: bool = False
+    ) -> str:
+        """Serialize an object converting what the JSON backend can't handle."""
+        if indent:
+            return json.dumps(obj, indent=2, default=default)
+        return json.dumps(obj, default=default, separators=(",", ":"))
+
+
+def json_encoder_dumps(
+    encoder: type[json.JSONEncoder] | None, *, indent: bool = False
+) -> Callable[[Any], str]:
+    """Return a function serializing objects to JSON like the encoder.
+
+    Subclasses of JSONEncoder are serialized by the JSON backend, which hands
+    the objects it can't handle to the default method of the encoder. Other
+    encoders are used with json.dumps. Without an encoder, no objects are
+    converted.
+    """
+    default: Callable[[Any], Any] | None
+    if encoder is None:
+        default = None
+    elif encoder is JSONEncoder:
+        default = json_encoder_default
+    elif issubclass(encoder, JSONEncoder):
+        default = encoder().default
+    elif indent:
+        return partial(json.dumps, indent=2, cls=encoder)
+    else:
+        return partial(json.dumps, separators=(",", ":"), cls=encoder)
+    return partial(_json_dumps_with_default, default=default, indent=indent)
+
+
 def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """Load JSON data from a file and return as dict or list.
 
@@ -56,7 +188,7 @@ def save_json(
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        json_data = json_encoder_dumps(encoder, indent=True)(data)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
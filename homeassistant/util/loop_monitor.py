@@ -0,0 +1,268 @@
+"""Measure how late the event loop runs and how long jobs hold it."""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Callable, Coroutine, Generator
+import functools
+import logging
+from time import perf_counter
+from typing import Any, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_R = TypeVar("_R")
+
+# Upper bounds of the histogram buckets in seconds
+HISTOGRAM_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+# How often the scheduling lag of the event loop is probed in seconds
+LAG_PROBE_INTERVAL = 1.0
+
+
+class Histogram:
+    """Count observations in the buckets of HISTOGRAM_BUCKETS."""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add an observation."""
+        self.counts[bisect_left(HISTOGRAM_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, quantile: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket that holds it."""
+        if not self.count:
+            return 0.0
+        rank = quantile * self.count
+        seen = 0
+        for bound, count in zip(HISTOGRAM_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the histogram."""
+        return {
+            "buckets": dict(zip([*map(str, HISTOGRAM_BUCKETS), "+Inf"], self.counts)),
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+        }
+
+
+class SlowJobs:
+    """Jobs of a single owner that held the event loop too long."""
+
+    __slots__ = ("count", "total", "max", "slowest_job")
+
+    def __init__(self) -> None:
+        """Initialize the slow jobs."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.slowest_job = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the slow jobs."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "slowest_job": self.slowest_job,
+        }
+
+
+def _unwrap(target: Callable[..., Any]) -> Callable[..., Any]:
+    """Return the function called by a job target."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    return target
+
+
+def job_owner(target: Callable[..., Any]) -> str:
+    """Return the integration, or else the module, a job target belongs to."""
+    module: str = getattr(_unwrap(target), "__module__", None) or "unknown"
+    parts = module.split(".", 3)
+    if parts[:2] == ["homeassistant", "components"] and len(parts) > 2:
+        return parts[2]
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return module
+
+
+def job_name(target: Callable[..., Any]) -> str:
+    """Return the qualified name of a job target."""
+    target = _unwrap(target)
+    qualname = getattr(target, "__qualname__", None) or type(target).__qualname__
+    return f"{getattr(target, '__module__', None)}.{qualname}"
+
+
+class LoopMonitor:
+    """Measure the scheduling lag of the event loop and the time jobs hold it.
+
+    The time of a job excludes the time of the jobs it runs itself, so the
+    time is attributed to the job that actually spent it.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, slow_job_threshold: float
+    ) -> None:
+        """Initialize the loop monitor."""
+        self.loop = loop
+        self.slow_job_threshold = slow_job_threshold
+        self.lag = Histogram()
+        self.job_durations = Histogram()
+        self.slow_jobs: dict[str, SlowJobs] = {}
+        self.slow_job_count = 0
+        self._max_lag = 0.0
+        self._child_time = 0.0
+        self._expected_probe = 0.0
+        self._probe_handle: asyncio.TimerHandle | None = None
+
+    def start(self) -> None:
+        """Start probing the scheduling lag."""
+        if self._probe_handle is None:
+            self._schedule_probe()
+
+    def stop(self) -> None:
+        """Stop probing the scheduling lag."""
+        if self._probe_handle is not None:
+            self._probe_handle.cancel()
+            self._probe_handle = None
+
+    def _schedule_probe(self) -> None:
+        """Schedule the next lag probe."""
+        self._expected_probe = self.loop.time() + LAG_PROBE_INTERVAL
+        self._probe_handle = self.loop.call_at(self._expected_probe, self._probe)
+
+    def _probe(self) -> None:
+        """Measure how late the probe runs."""
+        lag = max(self.loop.time() - self._expected_probe, 0.0)
+        self.lag.observe(lag)
+        if lag > self._max_lag:
+            self._max_lag = lag
+        self._schedule_probe()
+
+    def pop_max_lag(self) -> float:
+        """Return the largest lag since the previous call."""
+        max_lag, self._max_lag = self._max_lag, 0.0
+        return max_lag
+
+    def run_callback(self, target: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        """Run a callback and measure it."""
+        self._run(target, target, args)
+
+    def wrap_coroutine(
+        self, target: Callable[..., Any], coro: Coroutine[Any, Any, _R]
+    ) -> Coroutine[Any, Any, _R]:
+        """Wrap a coroutine of a job to measure each of its steps."""
+        return _MonitoredCoroutine(self, target, coro)
+
+    def _run(
+        self,
+        target: Callable[..., Any],
+        func: Callable[..., _R],
+        args: tuple[Any, ...],
+    ) -> _R:
+        """Run a step of a job and record the time it held the loop."""
+        outer_child_time = self._child_time
+        self._child_time = 0.0
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            duration = perf_counter() - start
+            self._record(target, duration - self._child_time)
+            self._child_time = outer_child_time + duration
+
+    def _record(self, target: Callable[..., Any], duration: float) -> None:
+        """Record the time a job held the loop."""
+        self.job_durations.observe(duration)
+        if duration < self.slow_job_threshold:
+            return
+
+        owner = job_owner(target)
+        if (slow_jobs := self.slow_jobs.get(owner)) is None:
+            slow_jobs = self.slow_jobs[owner] = SlowJobs()
+        slow_jobs.count += 1
+        slow_jobs.total += duration
+        if duration > slow_jobs.max:
+            slow_jobs.max = duration
+            slow_jobs.slowest_job = job_name(target)
+        self.slow_job_count += 1
+        _LOGGER.debug("%s held the event loop for %.3fs", job_name(target), duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the measurements."""
+        return {
+            "slow_job_threshold": self.slow_job_threshold,
+            "lag": self.lag.as_dict(),
+            "job_durations": self.job_durations.as_dict(),
+            "slow_jobs": {
+                owner: slow_jobs.as_dict()
+                for owner, slow_jobs in sorted(
+                    self.slow_jobs.items(), key=lambda item: -item[1].total
+                )
+            },
+        }
+
+
+class _MonitoredCoroutine(Coroutine[Any, Any, _R]):
+    """Coroutine that measures each step of the coroutine it wraps."""
+
+    __slots__ = ("_monitor", "_target", "_coro")
+
+    def __init__(
+        self,
+        monitor: LoopMonitor,
+        target: Callable[..., Any],
+        coro: Coroutine[Any, Any, _R],
+    ) -> None:
+        """Initialize the monitored coroutine."""
+        self._monitor = monitor
+        self._target = target
+        self._coro = coro
+
+    def send(self, value: Any) -> Any:
+        """Run the next step of the coroutine."""
+        return self._monitor._run(  # pylint: disable=protected-access
+            self._target, self._coro.send, (value,)
+        )
+
+    def throw(self, *args: Any) -> Any:
+        """Raise an exception in the coroutine."""
+        return self._monitor._run(  # pylint: disable=protected-access
+            self._target, self._coro.throw, args
+        )
+
+    def close(self) -> None:
+        """Close the coroutine."""
+        self._coro.close()
+
+    def __await__(self) -> Generator[Any, None, _R]:
+        """Return an iterator running the coroutine."""
+        return self  # type: ignore[return-value]
+
+    def __iter__(self) -> _MonitoredCoroutine[_R]:
+        """Return an iterator running the coroutine."""
+        return self
+
+    def __next__(self) -> Any:
+        """Run the next step of the coroutine."""
+        return self.send(None)
+
+    def __repr__(self) -> str:
+        """Return the representation of the wrapped coroutine."""
+        return repr(self._coro)
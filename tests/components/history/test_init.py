@@ -1210,6 +1210,231 @@ async def test_history_during_period(hass, hass_ws_client, recorder_mock):
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_columnar(hass, hass_ws_client, recorder_mock):
+    """Test history_during_period with a columnar response."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "1.5", attributes={"any": "attr"})
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "2", attributes={"any": "attr"})
+    hass.states.async_set("sensor.test", "on", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.power"],
+            "significant_changes_only": False,
+            "columnar_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert list(result) == ["sensor.test", "sensor.power"]
+    assert result["sensor.test"]["s"] == ["on", "off"]
+    assert result["sensor.power"]["s"] == [1.5, 2.0]
+    assert len(result["sensor.test"]["lu"]) == 2
+    assert all(isinstance(ts, float) for ts in result["sensor.power"]["lu"])
+    assert result["sensor.power"]["lu"][0] < result["sensor.power"]["lu"][1]
+
+
+async def test_history_during_period_max_points(hass, hass_ws_client, recorder_mock):
+    """Test history_during_period downsampled to the compiled statistics."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "10", attributes=POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    do_adhoc_statistics(hass, start=now)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.power", "sensor.test"],
+            "max_points": 12,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["period"] == "5minute"
+    assert result["buckets"] == {
+        "sensor.power": {
+            "start": [approx(now.timestamp())],
+            "mean": [approx(10.0)],
+            "min": [approx(10.0)],
+            "max": [approx(10.0)],
+        }
+    }
+    assert list(result["states"]) == ["sensor.test"]
+    assert result["states"]["sensor.test"][0]["s"] == "on"
+
+    # Short windows are not downsampled
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.power", "sensor.test"],
+            "max_points": 2000,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["period"] is None
+    assert result["buckets"] == {}
+    assert sorted(result["states"]) == ["sensor.power", "sensor.test"]
+
+
+async def test_history_stream_during_period(hass, hass_ws_client, recorder_mock):
+    """Test history is streamed one window at a time."""
+    now = dt_util.utcnow()
+    one_and_half_days_ago = now - timedelta(days=1.5)
+    one_hour_ago = now - timedelta(hours=1)
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow",
+        return_value=one_and_half_days_ago,
+    ):
+        hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+        await async_wait_recording_done(hass)
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow",
+        return_value=one_hour_ago,
+    ):
+        hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+        await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.websocket_api.connection."
+        "ActiveConnection.async_wait_for_drain",
+    ) as mock_wait_for_drain:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream_during_period",
+                "start_time": (now - timedelta(days=3)).isoformat(),
+                "end_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "minimal_response": True,
+                "no_attributes": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["type"] == "result"
+
+        # The first window has no states so it is not sent
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        event = response["event"]
+        assert event["partial"] is True
+        assert event["start_time"] < one_and_half_days_ago.timestamp()
+        assert event["end_time"] > one_and_half_days_ago.timestamp()
+        assert [state["s"] for state in event["states"]["sensor.test"]] == ["on"]
+        assert event["states"]["sensor.test"][0]["lu"] == approx(
+            one_and_half_days_ago.timestamp()
+        )
+
+        response = await client.receive_json()
+        event = response["event"]
+        assert "partial" not in event
+        assert [state["s"] for state in event["states"]["sensor.test"]] == ["off"]
+
+    assert mock_wait_for_drain.await_count == 3
+
+
+async def test_history_stream_during_period_empty(hass, hass_ws_client, recorder_mock):
+    """Test an empty history stream still sends the final window."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream_during_period",
+            "start_time": (now - timedelta(days=2)).isoformat(),
+            "end_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response["event"] == {
+        "states": {},
+        "start_time": approx((now - timedelta(days=1)).timestamp()),
+        "end_time": now.timestamp(),
+    }
+
+    await client.send_json(
+        {"id": 2, "type": "history/stream_during_period", "start_time": "cats"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
+async def test_history_stream_during_period_unsubscribes(
+    hass, hass_ws_client, recorder_mock
+):
+    """Test a history stream is no longer subscribed once it is sent."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream_during_period",
+            "start_time": (now - timedelta(days=2)).isoformat(),
+            "end_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert "partial" not in response["event"]
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
 async def test_history_during_period_impossible_conditions(
     hass, hass_ws_client, recorder_mock
 ):
@@ -0,0 +1,30 @@
+"""Tests for Home Assistant system health."""
+from unittest.mock import patch
+
+from homeassistant.helpers import template
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info_template_caches(hass):
+    """Test the hit rate of the template caches is reported."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+
+    with patch.object(
+        template, "_COMPILED_TEMPLATE_CACHE", template.TemplateCache(10)
+    ), patch.object(template, "_REGEX_CACHE", template.TemplateCache(5)):
+        info = await get_system_health_info(hass, "homeassistant")
+        assert info["template_cache"] == "0/10 entries, - hits"
+        assert info["template_regex_cache"] == "0/5 entries, - hits"
+
+        for _ in range(4):
+            template.Template("{{ value | regex_match('o[nf]') }}", hass).async_render(
+                {"value": "on"}
+            )
+
+        info = await get_system_health_info(hass, "homeassistant")
+
+    assert info["template_cache"] == "1/10 entries, 75.0% hits"
+    assert info["template_regex_cache"] == "1/5 entries, 75.0% hits"
@@ -0,0 +1 @@
+"""Tests for the Event Loop Monitor integration."""
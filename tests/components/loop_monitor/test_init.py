@@ -0,0 +1,53 @@
+"""Tests for the Event Loop Monitor integration."""
+from homeassistant.components.loop_monitor.const import DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.util.loop_monitor import LoopMonitor
+
+from tests.common import MockConfigEntry
+
+
+async def test_load_unload_config_entry(hass: HomeAssistant) -> None:
+    """Test the loop monitor measures jobs while it is loaded."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    monitor = hass.job_monitor
+    assert isinstance(monitor, LoopMonitor)
+
+    count = monitor.job_durations.count
+    hass.async_run_hass_job(HassJob(callback(lambda: None)))
+    assert monitor.job_durations.count == count + 1
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.NOT_LOADED
+    assert hass.job_monitor is None
+    assert DOMAIN not in hass.data
+
+
+async def test_websocket_stats(hass: HomeAssistant, hass_ws_client) -> None:
+    """Test the histograms are returned over the websocket."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "loop_monitor/stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["slow_job_threshold"] == 0.05
+    assert response["result"]["job_durations"]["count"] > 0
+    assert set(response["result"]["lag"]) == {"buckets", "count", "sum", "max"}
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    await client.send_json({"id": 2, "type": "loop_monitor/stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
@@ -0,0 +1,47 @@
+"""Tests for the Event Loop Monitor sensors."""
+from unittest.mock import patch
+
+from homeassistant.components.loop_monitor.const import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_component import async_update_entity
+
+from tests.common import MockConfigEntry
+
+
+async def test_sensors(hass: HomeAssistant) -> None:
+    """Test the sensors summarize the measurements."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    monitor = hass.job_monitor
+    monitor.lag.observe(0.2)
+    monitor._max_lag = 0.2  # pylint: disable=protected-access
+
+    def slow_job():
+        """Job holding the loop too long."""
+
+    slow_job.__module__ = "homeassistant.components.slow"
+    with patch("homeassistant.util.loop_monitor.perf_counter", side_effect=[0, 0.1]):
+        monitor.run_callback(slow_job, ())
+
+    for entity_id in (
+        "sensor.event_loop_lag",
+        "sensor.event_loop_job_duration",
+        "sensor.event_loop_slow_jobs",
+    ):
+        await async_update_entity(hass, entity_id)
+
+    state = hass.states.get("sensor.event_loop_lag")
+    assert state.state == "200.0"
+    assert state.attributes["unit_of_measurement"] == "ms"
+    assert state.attributes["p99"] == 200.0
+
+    state = hass.states.get("sensor.event_loop_job_duration")
+    assert float(state.state) > 0
+
+    state = hass.states.get("sensor.event_loop_slow_jobs")
+    assert state.state == "1"
+    assert state.attributes["threshold"] == 50.0
+    assert state.attributes["slow"] == 1
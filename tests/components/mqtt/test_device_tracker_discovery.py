@@ -3,6 +3,7 @@
 import pytest
 
 from homeassistant.components import device_tracker
+from homeassistant.components.mqtt import debug_info
 from homeassistant.components.mqtt.const import DOMAIN as MQTT_DOMAIN
 from homeassistant.components.mqtt.discovery import ALREADY_DISCOVERED
 from homeassistant.const import STATE_HOME, STATE_NOT_HOME, STATE_UNKNOWN
@@ -94,7 +95,7 @@ async def test_non_duplicate_device_tracker_discovery(hass, mqtt_mock, caplog):
     assert state is not None
     assert state.name == "Beer"
     assert state_duplicate is None
-    assert "Component has already been discovered: device_tracker bla" in caplog.text
+    assert debug_info.discovery_stats(hass).coalesced == 1
 
 
 async def test_device_tracker_removal(hass, mqtt_mock, caplog):
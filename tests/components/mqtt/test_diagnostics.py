@@ -30,6 +30,14 @@ default_config = {
     },
 }
 
+default_message_stats = {
+    "messages": 0,
+    "batches": 0,
+    "average_batch_size": 0,
+    "max_batch_size": 0,
+    "messages_per_second": 0,
+}
+
 
 @pytest.fixture
 def device_reg(hass):
@@ -45,8 +53,22 @@ async def test_entry_diagnostics(hass, device_reg, hass_client, mqtt_mock):
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
         "devices": [],
+        "message_stats": default_message_stats,
         "mqtt_config": default_config,
-        "mqtt_debug_info": {"entities": [], "triggers": []},
+        "mqtt_debug_info": {
+            "entities": [],
+            "triggers": [],
+            "discovery": {
+                "received": 0,
+                "unchanged": 0,
+                "coalesced": 0,
+                "processed": 0,
+                "batches": 0,
+                "max_batch_size": 0,
+                "processing_time": 0,
+                "messages_per_second": 0,
+            },
+        },
     }
 
     # Discover a device with an entity and a trigger
@@ -129,8 +151,9 @@ async def test_entry_diagnostics(hass, device_reg, hass_client, mqtt_mock):
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
         "devices": [expected_device],
+        "message_stats": default_message_stats,
         "mqtt_config": default_config,
-        "mqtt_debug_info": expected_debug_info,
+        "mqtt_debug_info": {**expected_debug_info, "discovery": ANY},
     }
 
     assert await get_diagnostics_for_device(
@@ -249,8 +272,9 @@ async def test_redact_diagnostics(hass, device_reg, hass_client, mqtt_mock):
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
         "devices": [expected_device],
+        "message_stats": default_message_stats,
         "mqtt_config": expected_config,
-        "mqtt_debug_info": expected_debug_info,
+        "mqtt_debug_info": {**expected_debug_info, "discovery": ANY},
     }
 
     assert await get_diagnostics_for_device(
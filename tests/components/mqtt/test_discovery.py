@@ -8,6 +8,7 @@ import pytest
 
 from homeassistant import config_entries
 from homeassistant.components import mqtt
+from homeassistant.components.mqtt import debug_info
 from homeassistant.components.mqtt.abbreviations import (
     ABBREVIATIONS,
     DEVICE_ABBREVIATIONS,
@@ -390,7 +391,46 @@ async def test_non_duplicate_discovery(hass, mqtt_mock, caplog):
     assert state is not None
     assert state.name == "Beer"
     assert state_duplicate is None
-    assert "Component has already been discovered: binary_sensor bla" in caplog.text
+    assert debug_info.discovery_stats(hass).coalesced == 1
+
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Beer", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("binary_sensor.beer1") is None
+    assert "Ignoring unchanged discovery payload for binary_sensor bla" in caplog.text
+
+
+async def test_discovery_stats(hass, mqtt_mock, caplog):
+    """Test unchanged configs are skipped and bursts are processed in a batch."""
+    for name in ("beer", "milk", "wine"):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/binary_sensor/{name}/config",
+            f'{{ "name": "{name}", "state_topic": "test-topic" }}',
+        )
+    await hass.async_block_till_done()
+    assert len(hass.states.async_entity_ids("binary_sensor")) == 3
+
+    # The retained configs are received again after a reconnect
+    for name in ("beer", "milk", "wine"):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/binary_sensor/{name}/config",
+            f'{{ "name": "{name}", "state_topic": "test-topic" }}',
+        )
+    await hass.async_block_till_done()
+
+    stats = debug_info.discovery_stats(hass).as_dict()
+    assert stats["received"] == 6
+    assert stats["unchanged"] == 3
+    assert stats["processed"] == 3
+    assert stats["batches"] == 1
+    assert stats["max_batch_size"] == 3
+    assert stats["messages_per_second"] > 0
 
 
 async def test_removal(hass, mqtt_mock, caplog):
@@ -576,24 +616,29 @@ async def test_rapid_reconfigure(hass, mqtt_mock, caplog):
     await hass.async_block_till_done()
 
     assert len(hass.states.async_entity_ids("binary_sensor")) == 1
-    state = hass.states.get("binary_sensor.beer")
+    state = hass.states.get("binary_sensor.wine")
     assert state is not None
 
-    assert len(events) == 3
-    # Add the entity
-    assert events[0].data["entity_id"] == "binary_sensor.beer"
+    # The configs received in a burst are coalesced
+    assert len(events) == 1
+    assert events[0].data["entity_id"] == "binary_sensor.wine"
     assert events[0].data["old_state"] is None
-    assert events[0].data["new_state"].attributes["friendly_name"] == "Beer"
-    # Update the entity
-    assert events[1].data["entity_id"] == "binary_sensor.beer"
+    assert events[0].data["new_state"].attributes["friendly_name"] == "Wine"
+    assert debug_info.discovery_stats(hass).coalesced == 2
+
+    # Reconfigure after the component has been added
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic2" }',
+    )
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    assert events[1].data["entity_id"] == "binary_sensor.wine"
     assert events[1].data["new_state"] is not None
     assert events[1].data["old_state"] is not None
     assert events[1].data["new_state"].attributes["friendly_name"] == "Milk"
-    # Update the entity
-    assert events[2].data["entity_id"] == "binary_sensor.beer"
-    assert events[2].data["new_state"] is not None
-    assert events[2].data["old_state"] is not None
-    assert events[2].data["new_state"].attributes["friendly_name"] == "Wine"
 
 
 async def test_duplicate_removal(hass, mqtt_mock, caplog):
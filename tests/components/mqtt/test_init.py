@@ -8,6 +8,7 @@ import logging
 import ssl
 from unittest.mock import ANY, AsyncMock, MagicMock, call, mock_open, patch
 
+from paho.mqtt.matcher import MQTTMatcher
 import pytest
 import voluptuous as vol
 import yaml
@@ -595,6 +596,50 @@ def test_validate_publish_topic():
     mqtt.valid_publish_topic("$SYS/")
 
 
+def test_topic_trie():
+    """Test the topic trie matches like the paho matcher."""
+    filters = [
+        "#",
+        "+",
+        "a",
+        "a/#",
+        "a/+",
+        "a/+/c",
+        "a/b/c",
+        "+/b/#",
+        "$SYS/#",
+        "$SYS/+/c",
+        "a/b/c",
+    ]
+    trie = mqtt.util.TopicTrie()
+    items = [object() for _ in filters]
+    for topic_filter, item in zip(filters, items):
+        trie.add(topic_filter, item)
+
+    for topic in ("a", "a/b", "a/b/c", "a/b/c/d", "b", "x/b", "$SYS", "$SYS/b/c", "/"):
+        expected = []
+        for topic_filter, item in zip(filters, items):
+            matcher = MQTTMatcher()
+            matcher[topic_filter] = True
+            if next(matcher.iter_match(topic), False):
+                expected.append(item)
+        assert trie.match(topic) == expected, topic
+
+    assert trie.has_filter("a/b/c")
+    trie.remove("a/b/c", items[6])
+    assert trie.has_filter("a/b/c")
+    trie.remove("a/b/c", items[10])
+    assert not trie.has_filter("a/b/c")
+    assert trie.match("a/b/c") == [items[0], items[3], items[5], items[7]]
+    with pytest.raises(KeyError):
+        trie.remove("a/b/c", items[10])
+
+    for topic_filter, item in zip(filters[:6], items[:6]):
+        trie.remove(topic_filter, item)
+    assert trie.match("a/b") == [items[7]]
+    assert trie.match("a/x") == []
+
+
 def test_entity_device_info_schema():
     """Test MQTT entity device info validation."""
     # just identifier
@@ -714,6 +759,54 @@ async def test_subscribe_topic(hass, mqtt_mock, calls, record_calls):
         unsub()
 
 
+async def test_messages_delivered_in_batches(
+    hass, mqtt_client_mock, mqtt_mock, calls, record_calls
+):
+    """Test messages from the client thread are delivered in one batch."""
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    on_message = mqtt_client_mock.on_message
+
+    def receive_messages():
+        for index in range(3):
+            on_message(None, None, ReceiveMessage(f"test-topic/{index}", b"", 0, False))
+
+    with patch.object(hass.loop, "call_soon_threadsafe") as mock_call_soon:
+        receive_messages()
+    assert len(mock_call_soon.mock_calls) == 1
+    mock_call_soon.call_args[0][0]()
+    assert [call[0].topic for call in calls] == [f"test-topic/{i}" for i in range(3)]
+
+    await hass.async_add_executor_job(receive_messages)
+    await hass.async_block_till_done()
+    assert len(calls) == 6
+
+    stats = on_message.__self__.message_stats
+    assert stats.messages == 6
+    assert stats.batches == 2
+    assert stats.max_batch_size == 3
+    assert stats.as_dict(hass.loop.time())["average_batch_size"] == 3
+
+
+def test_message_stats():
+    """Test the rate of messages is measured over a window."""
+    stats = mqtt.models.MessageStats()
+    assert stats.messages_per_second(0) == 0
+
+    stats.record_batch(10, 100)
+    stats.record_batch(20, 105)
+    assert stats.messages_per_second(105) == 0
+    stats.record_batch(30, 110)
+    assert stats.messages_per_second(115) == 6
+    assert stats.messages_per_second(130) == 0
+    assert stats.as_dict(115) == {
+        "messages": 60,
+        "batches": 3,
+        "average_batch_size": 20,
+        "max_batch_size": 30,
+        "messages_per_second": 6,
+    }
+
+
 async def test_subscribe_topic_non_async(hass, mqtt_mock, calls, record_calls):
     """Test the subscription of a topic using the non-async function."""
     unsub = await hass.async_add_executor_job(
@@ -0,0 +1,57 @@
+"""Test the recorder shared id caches."""
+from homeassistant.components.recorder.cache import SharedIdCache
+
+
+def test_shared_id_cache_counts_hits_and_misses():
+    """Test the cache counts hits and misses."""
+    cache = SharedIdCache(2)
+    assert cache.as_dict() == {
+        "size": 0,
+        "max_size": 2,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "hit_rate": None,
+    }
+    assert cache.get('{"a":1}') is None
+    cache['{"a":1}'] = 1
+    assert cache.get('{"a":1}') == 1
+    assert cache.get('{"a":1}') == 1
+    assert '{"a":1}' in cache
+    assert cache.as_dict() == {
+        "size": 1,
+        "max_size": 2,
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+        "hit_rate": 0.6667,
+    }
+
+
+def test_shared_id_cache_evictions():
+    """Test the cache is bounded and counts evictions."""
+    cache = SharedIdCache(2)
+    cache['{"a":1}'] = 1
+    cache['{"b":2}'] = 2
+    cache['{"c":3}'] = 3
+    assert len(cache) == 2
+    assert '{"a":1}' not in cache
+    assert cache.evictions == 1
+    assert cache.max_size == 2
+    assert cache.get('{"c":3}') == 3
+
+
+def test_shared_id_cache_evict_ids():
+    """Test evicting purged ids from the cache."""
+    cache = SharedIdCache(10)
+    cache['{"a":1}'] = 1
+    cache['{"b":2}'] = 2
+    cache['{"b":2}'] = 3
+    cache.evict_ids([1, 2, 4])
+    assert '{"a":1}' not in cache
+    assert cache.get('{"b":2}') == 3
+    assert cache.evictions == 0
+
+    cache.clear()
+    assert len(cache) == 0
+    cache.evict_ids([3])
@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 # pylint: disable=protected-access,invalid-name
+from array import array
 from copy import copy
 from datetime import datetime, timedelta
 import json
 from unittest.mock import patch, sentinel
 
 import pytest
+from pytest import approx
 from sqlalchemy import text
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import history
+from homeassistant.components.recorder import history, statistics
 from homeassistant.components.recorder.models import (
     Events,
     LazyState,
@@ -24,11 +26,13 @@ from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.json import JSONEncoder
+from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
 
 from tests.common import SetupRecorderInstanceT, mock_state_change_event
 from tests.components.recorder.common import (
     async_wait_recording_done,
+    do_adhoc_statistics,
     wait_recording_done,
 )
 
@@ -572,6 +576,61 @@ def test_get_significant_states_only(hass_recorder):
     assert states == hist[entity_id]
 
 
+def test_get_significant_states_columnar(hass_recorder):
+    """Test significant states are returned as per-entity columns."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    one = (zero + timedelta(seconds=1)).timestamp()
+    two = (zero + timedelta(seconds=2)).timestamp()
+    three = (zero + timedelta(seconds=3)).timestamp()
+
+    hist = history.get_significant_states_columnar(hass, zero, four)
+    assert set(hist) == set(states)
+    # Numeric states are float64 and duplicate states are dropped
+    assert hist["thermostat.test"] == {
+        "s": array("d", [20.0, 21.0]),
+        "lu": array("d", [one, two]),
+    }
+    assert hist["media_player.test"] == {
+        "s": ["idle", "YouTube", "Netflix"],
+        "lu": array("d", [one, one, three]),
+    }
+    assert hist["script.can_cancel_this_one"] == {
+        "s": ["off"],
+        "lu": array("d", [two]),
+    }
+
+
+def test_get_significant_states_columnar_with_initial(hass_recorder):
+    """Test the columnar response starts with the state at the start time."""
+    hass = hass_recorder()
+    zero, four, _ = record_states(hass)
+    one_and_half = zero + timedelta(seconds=1.5)
+    three = (zero + timedelta(seconds=3)).timestamp()
+
+    hist = history.get_significant_states_columnar(
+        hass,
+        one_and_half,
+        four,
+        entity_ids=["media_player.test", "media_player.test2", "sensor.missing"],
+    )
+    assert list(hist) == ["media_player.test", "media_player.test2"]
+    assert hist["media_player.test"] == {
+        "s": ["YouTube", "Netflix"],
+        "lu": array("d", [one_and_half.timestamp(), three]),
+    }
+    assert hist["media_player.test2"] == {
+        "s": ["YouTube"],
+        "lu": array("d", [one_and_half.timestamp()]),
+    }
+
+    hist = history.get_significant_states_columnar(
+        hass, one_and_half, four, include_start_time_state=False
+    )
+    assert hist["media_player.test"] == {"s": ["Netflix"], "lu": array("d", [three])}
+    assert "media_player.test2" not in hist
+
+
 def record_states(hass) -> tuple[datetime, datetime, dict[str, list[State]]]:
     """Record some test states.
 
@@ -652,6 +711,154 @@ def record_states(hass) -> tuple[datetime, datetime, dict[str, list[State]]]:
     return zero, four, states
 
 
+@pytest.mark.parametrize(
+    "window,max_points,period",
+    [
+        (timedelta(hours=1), 2000, None),
+        (timedelta(days=1), 2000, None),
+        (timedelta(days=2), 2000, "5minute"),
+        (timedelta(days=30), 2000, "hour"),
+        (timedelta(days=365), 2000, "day"),
+        (timedelta(days=365), 10, "month"),
+    ],
+)
+def test_downsample_period(window, max_points, period):
+    """Test the statistics period history is downsampled to."""
+    end_time = dt_util.utcnow()
+    assert history.downsample_period(end_time - window, end_time, max_points) == period
+
+
+def test_get_significant_states_downsampled(hass_recorder):
+    """Test downsampled history is in the unit of the states and ends with now."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)
+    zero = dt_util.utcnow() - timedelta(hours=1)
+    attributes = {
+        "device_class": "power",
+        "state_class": "measurement",
+        "unit_of_measurement": "kW",
+    }
+    for minutes, state in ((0, "10"), (27, "20")):
+        with patch(
+            "homeassistant.components.recorder.core.dt_util.utcnow",
+            return_value=zero + timedelta(minutes=minutes),
+        ):
+            hass.states.set("sensor.power", state, attributes)
+            wait_recording_done(hass)
+
+    # Only the first 5 minutes are compiled, the statistics are in W
+    do_adhoc_statistics(hass, start=zero)
+    wait_recording_done(hass)
+
+    with patch.object(
+        history, "get_significant_states", wraps=history.get_significant_states
+    ) as get_significant_states:
+        result = history.get_significant_states_downsampled(
+            hass, zero, zero + timedelta(minutes=30), ["sensor.power"], 6
+        )
+    assert result["period"] == "5minute"
+    assert result["states"] == {}
+    bucket = result["buckets"]["sensor.power"]
+    # The newest bucket is summarized from the states not compiled yet, it
+    # is at most one period long
+    assert get_significant_states.call_args[0][1] == zero + timedelta(minutes=25)
+    assert list(bucket["start"]) == [
+        approx(zero.timestamp()),
+        approx((zero + timedelta(minutes=25)).timestamp()),
+    ]
+    assert bucket["mean"] == [approx(10), approx(16)]
+    assert bucket["min"] == [approx(10), approx(10)]
+    assert bucket["max"] == [approx(10), approx(20)]
+
+    # Statistics in a unit the states can't be converted to are not used
+    hass.states.set("sensor.power", "30", {**attributes, "unit_of_measurement": "A"})
+    wait_recording_done(hass)
+    result = history.get_significant_states_downsampled(
+        hass, zero, dt_util.utcnow(), ["sensor.power"], 12
+    )
+    assert result["period"] is None
+    assert result["buckets"] == {}
+    assert result["states"]["sensor.power"][-1].state == "30"
+
+
+def test_get_significant_states_downsampled_tail_per_entity(hass_recorder):
+    """Test the states of the tail are read from where each entity was compiled."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)
+    zero = dt_util.utcnow() - timedelta(hours=1)
+    attributes = {
+        "device_class": "power",
+        "state_class": "measurement",
+        "unit_of_measurement": "W",
+    }
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow", return_value=zero
+    ):
+        hass.states.set("sensor.old", "10", attributes)
+        hass.states.set("sensor.new", "20", attributes)
+        wait_recording_done(hass)
+    do_adhoc_statistics(hass, start=zero)
+    wait_recording_done(hass)
+    # The statistics of sensor.old stop when its state class is removed
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow",
+        return_value=zero + timedelta(minutes=6),
+    ):
+        hass.states.set(
+            "sensor.old", "10", {**attributes, "state_class": None, "changed": True}
+        )
+        wait_recording_done(hass)
+    for minutes in range(5, 30, 5):
+        do_adhoc_statistics(hass, start=zero + timedelta(minutes=minutes))
+        wait_recording_done(hass)
+
+    with patch.object(
+        history, "get_significant_states", wraps=history.get_significant_states
+    ) as get_significant_states:
+        result = history.get_significant_states_downsampled(
+            hass, zero, zero + timedelta(minutes=32), ["sensor.old", "sensor.new"], 7
+        )
+    assert result["period"] == "5minute"
+    assert sorted(
+        (call[0][1], call[0][3]) for call in get_significant_states.call_args_list
+    ) == [
+        (zero + timedelta(minutes=27), ["sensor.old"]),
+        (zero + timedelta(minutes=30), ["sensor.new"]),
+    ]
+    assert list(result["buckets"]["sensor.old"]["start"])[-1] == approx(
+        (zero + timedelta(minutes=27)).timestamp()
+    )
+    assert result["buckets"]["sensor.new"]["mean"][-1] == approx(20)
+
+
+def test_get_significant_states_downsampled_beyond_short_term_retention(
+    hass_recorder,
+):
+    """Test windows older than the short term statistics use hourly statistics."""
+    hass = hass_recorder()
+    end_time = dt_util.utcnow()
+    with patch.object(
+        statistics,
+        "statistics_during_period",
+        wraps=statistics.statistics_during_period,
+    ) as statistics_during_period, patch.object(
+        statistics,
+        "list_statistic_ids",
+        return_value=[{"statistic_id": "sensor.power"}],
+    ):
+        history.get_significant_states_downsampled(
+            hass, end_time - timedelta(days=2), end_time, ["sensor.power"], 2000
+        )
+        assert statistics_during_period.call_args[0][4] == "5minute"
+
+        history.get_significant_states_downsampled(
+            hass, end_time - timedelta(days=12), end_time, ["sensor.power"], 2000
+        )
+        assert statistics_during_period.call_args[0][4] == "hour"
+
+
 async def test_state_changes_during_period_query_during_migration_to_schema_25(
     hass: ha.HomeAssistant,
     async_setup_recorder_instance: SetupRecorderInstanceT,
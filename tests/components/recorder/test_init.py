@@ -6,10 +6,12 @@ import asyncio
 from datetime import datetime, timedelta
 import sqlite3
 import threading
+import time
 from typing import cast
 from unittest.mock import Mock, patch
 
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -24,7 +26,11 @@ from homeassistant.components.recorder import (
     Recorder,
     get_instance,
 )
-from homeassistant.components.recorder.const import DATA_INSTANCE, KEEPALIVE_TIME
+from homeassistant.components.recorder.const import (
+    DATA_INSTANCE,
+    DB_READER_PREFIX,
+    KEEPALIVE_TIME,
+)
 from homeassistant.components.recorder.models import (
     SCHEMA_VERSION,
     EventData,
@@ -77,10 +83,14 @@ def _default_recorder(hass):
         auto_purge=True,
         auto_repack=True,
         keep_days=7,
+        purge_id_ranges=False,
         commit_interval=1,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        db_read_url=None,
+        db_read_pool_size=2,
+        id_cache_size=2048,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_t=[],
         exclude_attributes_by_domain={},
@@ -1026,6 +1036,62 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_states_in_one_commit_uses_executemany(hass_recorder):
+    """Test states in one commit are inserted in one batch with resolved keys."""
+    # Commit explicitly so a slow run can't split the states across commits
+    hass = hass_recorder({CONF_COMMIT_INTERVAL: 3600})
+    wait_recording_done(hass)
+    instance = get_instance(hass)
+    inserts = []
+
+    @sqlalchemy_event.listens_for(instance.engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, params, context, many):
+        if statement.startswith("INSERT INTO states"):
+            inserts.append(len(params) if many else 1)
+
+    for state in ("on", "off", "on"):
+        hass.states.set("test.one", state, {"attr": state})
+        hass.states.set("test.two", state, {"attr": "same"})
+    hass.states.remove("test.two")
+    hass.block_till_done()
+    instance.queue_task(recorder.tasks.CommitTask())
+    instance.block_till_done()
+
+    assert inserts == [7]
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).order_by(States.state_id))
+        assert [state.state for state in states] == [
+            "on",
+            "on",
+            "off",
+            "off",
+            "on",
+            "on",
+            None,
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[1].state_id
+        assert states[4].old_state_id == states[2].state_id
+        assert states[5].old_state_id == states[3].state_id
+        assert states[6].old_state_id == states[5].state_id
+        assert len({state.attributes_id for state in states[:6]}) == 3
+        assert states[1].attributes_id == states[3].attributes_id
+        old_state_id = states[4].state_id
+        old_attributes_id = states[4].attributes_id
+
+    hass.states.set("test.one", "off", {"attr": "on"})
+    hass.block_till_done()
+    instance.queue_task(recorder.tasks.CommitTask())
+    instance.block_till_done()
+
+    with session_scope(hass=hass) as session:
+        last_state = session.query(States).order_by(States.state_id.desc()).first()
+        assert last_state.old_state_id == old_state_id
+        assert last_state.attributes_id == old_attributes_id
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -1211,6 +1277,33 @@ def test_service_disable_run_information_recorded(tmpdir):
     hass.stop()
 
 
+def test_shared_id_caches_are_warmed_on_startup(tmpdir):
+    """Test the shared id caches are loaded from the database on startup."""
+    test_db_file = tmpdir.mkdir("sqlite").join("test_warm_caches.db")
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    hass = get_test_home_assistant()
+    setup_component(hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl}})
+    hass.start()
+    hass.states.set("sensor.test", "on", {"unit": "W"})
+    hass.bus.fire("test_event", {"some": "data"})
+    wait_recording_done(hass)
+    hass.stop()
+
+    hass = get_test_home_assistant()
+    setup_component(hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl}})
+    hass.start()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert '{"unit":"W"}' in instance._state_attributes_ids
+    assert '{"some":"data"}' in instance._event_data_ids
+
+    hass.states.set("sensor.test", "off", {"unit": "W"})
+    wait_recording_done(hass)
+    assert instance.async_cache_info()["state_attributes"]["hits"] == 1
+    hass.stop()
+
+
 class CannotSerializeMe:
     """A class that the JSONEncoder cannot serialize."""
 
@@ -1284,6 +1377,118 @@ async def test_database_corruption_while_running(hass, tmpdir, caplog):
     hass.stop()
 
 
+async def test_read_only_connection_pool(hass, tmpdir):
+    """Test reads use their own read only connections to a SQLite database file."""
+
+    def _create_tmpdir_for_test_db():
+        return tmpdir.mkdir("sqlite").join("test.db")
+
+    test_db_file = await hass.async_add_executor_job(_create_tmpdir_for_test_db)
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl, CONF_COMMIT_INTERVAL: 0}}
+    )
+    await hass.async_block_till_done()
+    instance = get_instance(hass)
+    assert instance.read_engine is not None
+
+    hass.states.async_set("test.read", "on", {})
+    await async_wait_recording_done(hass)
+
+    def _read_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is instance.read_engine
+            return threading.current_thread().name, [
+                db_state.entity_id for db_state in session.query(States)
+            ]
+
+    thread_name, entity_ids = await instance.async_add_read_executor_job(_read_states)
+    assert thread_name.startswith(DB_READER_PREFIX)
+    assert entity_ids == ["test.read"]
+
+    def _write_state():
+        with session_scope(hass=hass, read_only=True) as session:
+            session.add(States(entity_id="test.write", state="on"))
+
+    with pytest.raises(OperationalError):
+        await instance.async_add_read_executor_job(_write_state)
+
+    recorder_thread_binds = []
+
+    class ReadOnRecorderThread(recorder.tasks.RecorderTask):
+        """Read in a read only scope on the recorder thread."""
+
+        def run(self, instance):
+            with session_scope(hass=hass, read_only=True) as session:
+                recorder_thread_binds.append(session.get_bind())
+
+    instance.queue_task(ReadOnRecorderThread())
+    await async_wait_recording_done(hass)
+    assert recorder_thread_binds == [instance.engine]
+
+    info = instance.async_read_query_info()
+    assert info["read_pool"] is True
+    assert info["read_pool_size"] == 2
+    assert info["queries"]["_read_states"]["count"] == 1
+    assert info["queries"]["_write_state"]["count"] == 1
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+
+async def test_read_only_connection_pool_concurrent_reads(hass, tmpdir, caplog):
+    """Test concurrent reads from several threads against a SQLite database file."""
+
+    def _create_tmpdir_for_test_db():
+        return tmpdir.mkdir("sqlite").join("test.db")
+
+    test_db_file = await hass.async_add_executor_job(_create_tmpdir_for_test_db)
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl, CONF_COMMIT_INTERVAL: 0}}
+    )
+    await hass.async_block_till_done()
+    instance = get_instance(hass)
+
+    hass.states.async_set("test.read", "on", {})
+    await async_wait_recording_done(hass)
+
+    def _read_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            time.sleep(0.01)
+            return (
+                threading.current_thread().name,
+                session.get_bind(),
+                [db_state.entity_id for db_state in session.query(States)],
+            )
+
+    results = await asyncio.gather(
+        *(
+            add_job(_read_states)
+            for _ in range(5)
+            for add_job in (
+                instance.async_add_read_executor_job,
+                instance.async_add_executor_job,
+            )
+        )
+    )
+
+    for thread_name, bind, entity_ids in results:
+        assert entity_ids == ["test.read"]
+        if thread_name.startswith(DB_READER_PREFIX):
+            assert bind is instance.read_engine
+        else:
+            assert bind is instance.engine
+    assert {bind for _, bind, _ in results} == {instance.engine, instance.read_engine}
+    assert "Exception closing connection" not in caplog.text
+    assert "ProgrammingError" not in caplog.text
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+
 def test_entity_id_filter(hass_recorder):
     """Test that entity ID filtering filters string and list."""
     hass = hass_recorder(
@@ -1502,12 +1707,15 @@ def test_deduplication_event_data_inside_commit_interval(hass_recorder, caplog):
         assert all(event.data_id == first_data_id for event in events)
 
 
-# Patch STATE_ATTRIBUTES_ID_CACHE_SIZE since otherwise
-# the CI can fail because the test takes too long to run
-@patch("homeassistant.components.recorder.core.STATE_ATTRIBUTES_ID_CACHE_SIZE", 5)
 def test_deduplication_state_attributes_inside_commit_interval(hass_recorder, caplog):
     """Test deduplication of state attributes inside the commit interval."""
-    hass = hass_recorder()
+    # Use a small id cache since otherwise
+    # the CI can fail because the test takes too long to run
+    hass = hass_recorder({recorder.CONF_ID_CACHE_SIZE: 5})
+    assert (
+        recorder.get_instance(hass).async_cache_info()["state_attributes"]["max_size"]
+        == 5
+    )
 
     entity_id = "test.recorder"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
@@ -2,13 +2,15 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
+from sqlalchemy import func
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
+from homeassistant.components.recorder import purge
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE, SupportedDialect
 from homeassistant.components.recorder.models import (
     EventData,
@@ -258,6 +260,149 @@ async def test_purge_old_events(
         assert events.count() == 2
 
 
+async def test_purge_old_data_by_id_range(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old states and events one day at a time."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.purge_id_ranges = True
+
+    await _add_test_states(hass)
+    await _add_events_with_event_data(hass)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        event_data = session.query(EventData).filter(
+            EventData.shared_data.like("%EVENT_TEST%")
+        )
+        assert states.count() == 6
+        assert state_attributes.count() == 3
+        assert events.count() == 6
+        assert event_data.count() == 6
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        # The id range of the oldest day is deleted first
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 4
+        assert state_attributes.count() == 2
+        assert events.count() == 4
+        assert event_data.count() == 4
+        assert "test.recorder2" in instance._old_states
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 2
+        assert state_attributes.count() == 1
+        assert events.count() == 2
+        assert event_data.count() == 2
+
+        states_after_purge = session.query(States)
+        assert states_after_purge[1].old_state_id == states_after_purge[0].state_id
+        assert states_after_purge[0].old_state_id is None
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert states.count() == 2
+        assert events.count() == 2
+        assert "test.recorder2" in instance._old_states
+
+        finished = purge_old_data(instance, dt_util.utcnow(), repack=False)
+        assert not finished
+        assert states.count() == 0
+        assert state_attributes.count() == 0
+        assert events.count() == 0
+        assert event_data.count() == 0
+        assert "test.recorder2" not in instance._old_states
+
+
+async def test_purge_old_data_by_id_range_in_chunks(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the id range of a day is deleted in chunks that are committed."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.purge_id_ranges = True
+
+    await _add_test_states(hass)
+    await _add_events_with_event_data(hass)
+
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        first_state_id = session.query(func.min(States.state_id)).scalar()
+        first_event_id = events.order_by(Events.event_id).first().event_id
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with patch.object(purge, "PURGE_RANGE_CHUNK_SIZE", 1), patch.object(
+        purge, "delete_states_range", wraps=purge.delete_states_range
+    ) as delete_states_range, patch.object(
+        purge, "delete_events_range", wraps=purge.delete_events_range
+    ) as delete_events_range, patch.object(
+        Session, "commit", autospec=True, side_effect=Session.commit
+    ) as commit:
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+
+    assert delete_states_range.call_args_list == [
+        call(first_state_id, first_state_id, ANY),
+        call(first_state_id + 1, first_state_id + 1, ANY),
+    ]
+    assert delete_events_range.call_args_list == [
+        call(first_event_id, first_event_id, ANY),
+        call(first_event_id + 1, first_event_id + 1, ANY),
+    ]
+    assert commit.call_count >= 4
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 4
+        assert (
+            session.query(Events).filter(Events.event_type.like("EVENT_TEST%")).count()
+            == 4
+        )
+
+
+async def test_purge_old_data_by_id_range_keeps_newer_states_in_range(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test states referring to a kept out of order state stay connected."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.purge_id_ranges = True
+    await async_wait_recording_done(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+    with session_scope(hass=hass) as session:
+        for state_id, last_updated, old_state_id in (
+            (1, eleven_days_ago, None),
+            # Recorded out of order, newer than the purge but inside its id range
+            (2, utcnow, 1),
+            (3, eleven_days_ago, 2),
+            (4, utcnow, 2),
+        ):
+            session.add(
+                States(
+                    state_id=state_id,
+                    entity_id="test.recorder2",
+                    state=str(state_id),
+                    last_changed=last_updated,
+                    last_updated=last_updated,
+                    old_state_id=old_state_id,
+                )
+            )
+
+    with session_scope(hass=hass) as session:
+        purge_before = utcnow - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+
+        states = {state.state_id: state for state in session.query(States)}
+        assert list(states) == [2, 4]
+        assert states[2].old_state_id is None
+        assert states[4].old_state_id == 2
+
+
 async def test_purge_old_recorder_runs(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -26,6 +26,7 @@ from homeassistant.components.recorder.statistics import (
     get_latest_short_term_statistics,
     get_metadata,
     list_statistic_ids,
+    statistic_to_state_unit_converter,
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -196,6 +197,58 @@ def mock_from_stats():
         yield
 
 
+def test_hourly_statistics_accumulator():
+    """Test the hourly statistics are summarized from the 5-minute statistics."""
+    accumulator = statistics.HourlyStatisticsAccumulator()
+    hour_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 00:00:00"))
+    last_reset = hour_start - timedelta(days=1)
+    periods = [hour_start + timedelta(minutes=5 * i) for i in range(12)]
+
+    for i, start in enumerate(periods[:11]):
+        accumulator.add_period(
+            start,
+            {
+                1: {"start": start, "mean": i, "min": i - 1, "max": i + 1},
+                2: {"start": start, "last_reset": last_reset, "state": i, "sum": i},
+            },
+        )
+    # The hour is not summarized until all 5-minute periods are known
+    assert accumulator.summary(hour_start) is None
+
+    accumulator.add_period(
+        periods[11],
+        {1: {"start": periods[11], "mean": None, "min": None, "max": None}},
+    )
+    assert accumulator.summary(hour_start) == {
+        1: {
+            "start": hour_start,
+            "mean": approx(5.0),
+            "min": -1,
+            "max": 11,
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        },
+        2: {
+            "start": hour_start,
+            "mean": None,
+            "min": None,
+            "max": None,
+            "last_reset": last_reset,
+            "state": 10,
+            "sum": 10,
+        },
+    }
+    assert accumulator.summary(hour_start + timedelta(hours=1)) is None
+
+    # Adding a period of the next hour starts over
+    accumulator.add_period(periods[0] + timedelta(hours=1), {})
+    assert accumulator.summary(hour_start) is None
+
+    accumulator.reset()
+    assert accumulator.summary(hour_start + timedelta(hours=1)) is None
+
+
 def test_compile_periodic_statistics_exception(
     hass_recorder, mock_sensor_statistics, mock_from_stats
 ):
@@ -250,6 +303,34 @@ def test_compile_periodic_statistics_exception(
     }
 
 
+@pytest.mark.parametrize(
+    "statistic_unit,state_unit,statistic,state",
+    [
+        (None, None, 10, 10),
+        ("W", "W", 10, 10),
+        ("W", "kW", 10000, 10),
+        ("kWh", "Wh", 1.5, 1500),
+        ("Pa", "hPa", 101300, 1013),
+        ("°C", "°F", 100, 212),
+        ("m³", "ft³", 1, 35.314667),
+    ],
+)
+def test_statistic_to_state_unit_converter(
+    statistic_unit, state_unit, statistic, state
+):
+    """Test converting statistics to the unit of their states."""
+    convert = statistic_to_state_unit_converter(statistic_unit, state_unit)
+    assert convert(statistic) == approx(state)
+
+
+@pytest.mark.parametrize(
+    "statistic_unit,state_unit", [("W", None), ("W", "A"), ("Pa", "°C"), (None, "W")]
+)
+def test_statistic_to_state_unit_converter_unsupported(statistic_unit, state_unit):
+    """Test statistics are not converted to an unrelated unit."""
+    assert statistic_to_state_unit_converter(statistic_unit, state_unit) is None
+
+
 def test_rename_entity(hass_recorder):
     """Test statistics is migrated when entity_id is changed."""
     hass = hass_recorder()
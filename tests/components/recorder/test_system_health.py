@@ -26,6 +26,8 @@ async def test_recorder_system_health(hass, recorder_mock):
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "state_attributes_cache": ANY,
+        "event_data_cache": ANY,
     }
 
 
@@ -50,6 +52,8 @@ async def test_recorder_system_health_alternate_dbms(hass, recorder_mock, dialec
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "state_attributes_cache": ANY,
+        "event_data_cache": ANY,
     }
 
 
@@ -68,4 +72,18 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "state_attributes_cache": ANY,
+        "event_data_cache": ANY,
     }
+
+
+async def test_recorder_system_health_cache_info(hass, recorder_mock):
+    """Test recorder system health reports the shared id cache statistics."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.test", "on", {"unit": "W"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.test", "off", {"unit": "W"})
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["state_attributes_cache"] == "1 hits, 1 misses, 0 evictions"
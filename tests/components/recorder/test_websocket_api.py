@@ -274,6 +274,47 @@ async def test_recorder_info(hass, hass_ws_client, recorder_mock):
     }
 
 
+async def test_recorder_cache_info(hass, hass_ws_client, recorder_mock):
+    """Test getting the recorder shared id cache statistics."""
+    client = await hass_ws_client()
+
+    hass.states.async_set("sensor.test", "on", {"unit": "W"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.test", "off", {"unit": "W"})
+    await async_wait_recording_done(hass)
+
+    await client.send_json({"id": 1, "type": "recorder/cache_info"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["state_attributes"] == {
+        "size": 1,
+        "max_size": 2048,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "hit_rate": 0.5,
+    }
+    assert response["result"]["event_data"]["max_size"] == 2048
+
+
+async def test_recorder_read_query_info(hass, hass_ws_client, recorder_mock):
+    """Test getting the latency of the read only queries."""
+    client = await hass_ws_client()
+
+    await client.send_json({"id": 1, "type": "recorder/get_statistics_metadata"})
+    response = await client.receive_json()
+    assert response["success"]
+
+    await client.send_json({"id": 2, "type": "recorder/read_query_info"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["read_pool"] is False
+    assert response["result"]["read_pool_size"] == 2
+    stats = response["result"]["queries"]["list_statistic_ids"]
+    assert stats["count"] == 1
+    assert stats["max_run_ms"] >= stats["mean_run_ms"] >= 0
+
+
 async def test_recorder_info_no_recorder(hass, hass_ws_client):
     """Test getting recorder status when recorder is not present."""
     client = await hass_ws_client()
@@ -21,6 +21,7 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.sensor import recorder as sensor_recorder
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
@@ -211,6 +212,44 @@ def test_compile_hourly_statistics_purged_state_changes(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_from_recorded_states(hass_recorder):
+    """Test statistics are compiled from the recorded states without a query."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    hass.states.set("sensor.other", "1")  # Start tracking the recorded states
+    wait_recording_done(hass)
+    zero = dt_util.utcnow()
+    record_states(hass, zero, "sensor.test1", POWER_SENSOR_ATTRIBUTES)
+    record_states(
+        hass, zero, "sensor.test2", ENERGY_SENSOR_ATTRIBUTES, seq=[10, 15, 20]
+    )
+    end = zero + timedelta(minutes=5)
+
+    with patch(
+        "homeassistant.components.sensor.recorder.history."
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        from_memory = sensor_recorder.compile_statistics(hass, zero, end)
+    get_history.assert_not_called()
+    assert {stat["meta"]["statistic_id"] for stat in from_memory.platform_stats} == {
+        "sensor.test1",
+        "sensor.test2",
+    }
+
+    # The statistics compiled from the states table must be identical
+    hass.data.pop(sensor_recorder.RECORDED_STATES)
+    with patch(
+        "homeassistant.components.sensor.recorder.history."
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        from_db = sensor_recorder.compile_statistics(hass, zero, end)
+    assert get_history.call_count == 2
+    assert from_memory.platform_stats == from_db.platform_stats
+
+
 @pytest.mark.parametrize("attributes", [TEMPERATURE_SENSOR_ATTRIBUTES])
 def test_compile_hourly_statistics_unsupported(hass_recorder, caplog, attributes):
     """Test compiling hourly statistics for unsupported sensor."""
@@ -20,7 +20,11 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    async_setup_component,
+    async_start_setup_trace,
+)
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -618,14 +622,35 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
-async def test_get_states_not_allows_nan(hass, websocket_client):
-    """Test get_states command not allows NaN floats."""
+async def test_get_states_converts_nan(hass, websocket_client):
+    """Test get_states command converts NaN floats to None."""
     hass.states.async_set("greeting.hello", "world")
     hass.states.async_set("greeting.bad", "data", {"hello": float("NaN")})
     hass.states.async_set("greeting.bye", "universe")
 
     await websocket_client.send_json({"id": 5, "type": "get_states"})
 
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    bad = dict(hass.states.get("greeting.bad").as_dict())
+    bad["attributes"] = {"hello": None}
+    assert msg["result"] == [
+        hass.states.get("greeting.hello").as_dict(),
+        bad,
+        hass.states.get("greeting.bye").as_dict(),
+    ]
+
+
+async def test_get_states_skips_unserializable(hass, websocket_client):
+    """Test get_states command skips states that can't be serialized."""
+    hass.states.async_set("greeting.hello", "world")
+    hass.states.async_set("greeting.bad", "data", {"hello": object()})
+    hass.states.async_set("greeting.bye", "universe")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+
     msg = await websocket_client.receive_json()
     assert msg["id"] == 5
     assert msg["type"] == const.TYPE_RESULT
@@ -1042,6 +1067,71 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_batched_state_changes(
+    hass, websocket_client, hass_admin_user
+):
+    """Test a batch of state changes is sent as one combined diff."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {
+            "entities": {
+                "entity_ids": {
+                    "light.changed": True,
+                    "light.removed": True,
+                    "light.added": True,
+                    "light.added_and_removed": True,
+                }
+            }
+        }
+    )
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert set(msg["event"]["a"]) == {"light.changed", "light.removed"}
+
+    with hass.bus.async_batch():
+        hass.states.async_set("light.changed", "on", {"color": "red"})
+        hass.states.async_set("light.not_permitted", "on")
+        hass.states.async_set("light.changed", "on", {"color": "blue"})
+        hass.states.async_set("light.added", "on")
+        hass.states.async_set("light.added_and_removed", "on")
+        hass.states.async_remove("light.added_and_removed")
+        hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "off")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.changed": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "s": "on",
+                }
+            }
+        },
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "r": ["light.removed"],
+    }
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {"light.added": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -1690,6 +1780,46 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
     ]
 
 
+async def test_integration_setup_trace(hass, websocket_client):
+    """Test getting the trace of the integration setups during startup."""
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_trace"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    trace = async_start_setup_trace(hass)
+    trace.async_add_span("august", "async_setup", trace.start, trace.start + 1.5)
+    trace.async_finish()
+    await websocket_client.send_json({"id": 8, "type": "integration/setup_trace"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert msg["result"]["traceEvents"] == [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 1,
+            "args": {"name": "august"},
+        },
+        {
+            "name": "async_setup",
+            "cat": "setup",
+            "ph": "X",
+            "pid": 1,
+            "tid": 1,
+            "ts": 0,
+            "dur": 1500000,
+        },
+    ]
+    assert msg["result"]["otherData"]["critical_path"] == [
+        {"domain": "august", "start": 0, "end": 1.5, "seconds": 1.5}
+    ]
+
+
 @pytest.mark.parametrize(
     "key,config",
     (
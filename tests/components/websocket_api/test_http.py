@@ -1,12 +1,15 @@
 """Test Websocket API http module."""
 import asyncio
 from datetime import timedelta
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import Mock, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
 
+import homeassistant
 from homeassistant.components.websocket_api import const, http
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -67,6 +70,44 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+async def test_wait_for_drain(hass, hass_ws_client):
+    """Test waiting for the pending messages to be written."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        await hass_ws_client()
+
+    await instance._async_wait_for_drain()
+
+    orig_send_str = instance.wsock.send_str
+    write_allowed = asyncio.Event()
+
+    async def _slow_send_str(message):
+        await write_allowed.wait()
+        await orig_send_str(message)
+
+    instance.wsock.send_str = _slow_send_str
+    instance._send_message({"id": 1, "type": "event"})
+    instance._send_message({"id": 2, "type": "event"})
+
+    drain_task = asyncio.create_task(instance._async_wait_for_drain())
+    await asyncio.sleep(0)
+    assert not drain_task.done()
+
+    write_allowed.set()
+    await asyncio.wait_for(drain_task, 1)
+    assert instance._to_write.empty()
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialize non JSON objects."""
     bad_data = object()
@@ -79,7 +120,7 @@ async def test_non_json_message(hass, websocket_client, caplog):
     assert msg["success"]
     assert msg["result"] == []
     assert (
-        f"Unable to serialize to JSON. Bad data found at $.result[0](State: test_domain.entity).attributes.bad={bad_data}(<class 'object'>"
+        f"Unable to serialize to JSON. Bad data found at $(State: test_domain.entity).attributes.bad={bad_data}(<class 'object'>"
         in caplog.text
     )
 
@@ -93,3 +134,133 @@ async def test_prepare_fail(hass, hass_ws_client, caplog):
         await hass_ws_client(hass)
 
     assert "Timeout preparing request" in caplog.text
+
+
+async def test_compression(
+    hass, aiohttp_client, hass_read_only_access_token, socket_enabled
+):
+    """Test large messages are compressed and the bytes sent are counted."""
+    assert await async_setup_component(
+        hass, "websocket_api", {"websocket_api": {"compression_level": 1}}
+    )
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    client = await aiohttp_client(hass.http.app)
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await client.ws_connect(http.URL, compress=15)
+        assert (await websocket_client.receive_json())["type"] == "auth_required"
+        await websocket_client.send_json(
+            {"type": "auth", "access_token": hass_read_only_access_token}
+        )
+        assert (await websocket_client.receive_json())["type"] == "auth_ok"
+
+    assert websocket_client.compress == 15
+    wsock = instance.wsock
+    # The auth messages are below the threshold
+    assert wsock.message_bytes_sent > 0
+    assert wsock.bytes_sent > wsock.message_bytes_sent
+    message_bytes_sent = wsock.message_bytes_sent
+    bytes_sent = wsock.bytes_sent
+
+    hass.states.async_set(
+        "light.kitchen", "on", {"effect_list": [f"effect {idx}" for idx in range(100)]}
+    )
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"][0]["entity_id"] == "light.kitchen"
+
+    message_bytes_sent = wsock.message_bytes_sent - message_bytes_sent
+    assert message_bytes_sent > 1000
+    assert wsock.bytes_sent - bytes_sent < message_bytes_sent / 2
+
+    # The counters of their own connection are exposed to non-admin users
+    expected = {
+        "message_bytes_sent": wsock.message_bytes_sent,
+        "bytes_sent": wsock.bytes_sent,
+    }
+    await websocket_client.send_json({"id": 6, "type": "connection/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == expected
+
+
+async def test_compression_disabled(hass, hass_ws_client):
+    """Test compression is not negotiated by default."""
+    websocket_client = await hass_ws_client()
+    assert websocket_client.compress == 0
+
+    await websocket_client.send_json({"id": 5, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+
+def test_tested_aiohttp_version():
+    """Test the compression writer is tested against the pinned aiohttp."""
+    constraints = (
+        Path(homeassistant.__file__).parent / "package_constraints.txt"
+    ).read_text()
+    assert f"aiohttp=={http.TESTED_AIOHTTP_VERSION}\n" in constraints
+
+
+async def test_untested_aiohttp_version(hass, hass_ws_client, caplog):
+    """Test the aiohttp internals are not overridden with another aiohttp."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.TESTED_AIOHTTP_VERSION", "0.0.0"
+    ):
+        assert await async_setup_component(
+            hass, "websocket_api", {"websocket_api": {"compression_level": 1}}
+        )
+        with patch(
+            "homeassistant.components.websocket_api.http.WebSocketHandler",
+            instantiate_handler,
+        ):
+            websocket_client = await hass_ws_client()
+
+    assert "are only supported with aiohttp 0.0.0" in caplog.text
+    assert not isinstance(instance.wsock, http.CompressionWebSocketResponse)
+
+    await websocket_client.send_json({"id": 5, "type": "connection/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"message_bytes_sent": 0, "bytes_sent": 0}
+
+
+async def test_compression_threshold():
+    """Test messages below the threshold are sent uncompressed."""
+    transport = Mock(is_closing=Mock(return_value=False))
+    writer = http.CompressionWebSocketWriter(
+        Mock(),
+        transport,
+        compress=15,
+        compression_level=9,
+        compression_threshold=100,
+    )
+
+    await writer.send("x" * 50)
+    # Final text frame
+    assert transport.write.call_args[0][0][0] == 0x81
+    await writer.send("x" * 500)
+    # Final text frame with RSV1 set for compressed messages
+    assert transport.write.call_args[0][0][0] == 0xC1
+    await writer.send("x" * 50)
+    assert transport.write.call_args[0][0][0] == 0x81
+
+    assert writer.message_bytes_sent == 600
+    assert writer.bytes_sent < 200
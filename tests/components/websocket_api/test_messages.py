@@ -94,5 +94,12 @@ async def test_message_to_json(caplog):
     assert "Unable to serialize to JSON" in caplog.text
 
 
+async def test_message_to_json_nan():
+    """Test NaN and infinity in websocket messages are sent as null."""
+    json_str = message_to_json({"id": 1, "result": [float("nan"), float("inf")]})
+
+    assert json_str == '{"id":1,"result":[null,null]}'
+
+
 class _Unserializeable:
     """A class that cannot be serialized."""
@@ -592,6 +592,15 @@ def mock_get_source_ip():
         yield
 
 
+@pytest.fixture(autouse=True)
+def mock_manifest_index():
+    """Mock loading and saving the manifest index in the test config dir."""
+    with patch("homeassistant.loader.async_load_manifest_index"), patch(
+        "homeassistant.loader.async_save_manifest_index"
+    ):
+        yield
+
+
 @pytest.fixture
 def mock_zeroconf():
     """Mock zeroconf."""
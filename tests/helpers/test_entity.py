@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, PropertyMock, patch
 import pytest
 import voluptuous as vol
 
+from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
@@ -18,6 +19,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import Context, HomeAssistantError
 from homeassistant.helpers import entity, entity_registry
+from homeassistant.helpers.entity_values import EntityValues
 
 from tests.common import (
     MockConfigEntry,
@@ -888,6 +890,85 @@ async def test_attribution_attribute(hass):
     assert state.attributes.get(ATTR_ATTRIBUTION) == "Home Assistant"
 
 
+async def test_static_state_attributes_cache(hass):
+    """Test static state attributes are cached until their sources change."""
+
+    class DynamicIconEntity(entity.Entity):
+        """Entity with an icon depending on its state."""
+
+        _cache_static_state_attributes = True
+
+        @property
+        def icon(self):
+            """Return the icon of the current state."""
+            return f"mdi:numeric-{self._attr_state}"
+
+    ent = DynamicIconEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_name = "Hello"
+    ent._attr_state = 1
+    ent.async_write_ha_state()
+
+    state = hass.states.get("hello.world")
+    assert state.attributes == {"friendly_name": "Hello", "icon": "mdi:numeric-1"}
+    static_attr = ent._static_state_attributes
+    assert static_attr == {"friendly_name": "Hello"}
+
+    # Dynamic properties are read on every write
+    ent._attr_state = 2
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes == {"friendly_name": "Hello", "icon": "mdi:numeric-2"}
+    assert ent._static_state_attributes is static_attr
+
+    # Setting a declared property invalidates the cache
+    ent._attr_name = "Hello World"
+    ent._attr_device_class = "power"
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes == {
+        "device_class": "power",
+        "friendly_name": "Hello World",
+        "icon": "mdi:numeric-2",
+    }
+
+    # So does a registry entry update
+    ent.registry_entry = entity_registry.RegistryEntry(
+        entity_id="hello.world",
+        unique_id="test-unique-id",
+        platform="test-platform",
+        name="Registry Name",
+    )
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes["friendly_name"] == "Registry Name"
+
+    # And reloading customize
+    hass.data[DATA_CUSTOMIZE] = EntityValues({"hello.world": {"hidden": True}})
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes["hidden"] is True
+
+
+async def test_static_state_attributes_not_cached_by_default(hass):
+    """Test entities not opting in read their static properties on every write."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.entity_description = entity.EntityDescription(key="test", name="Hello")
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["friendly_name"] == "Hello"
+    assert ent._static_state_attributes is None
+    assert type(ent).__setattr__ is object.__setattr__
+
+    # Mutating the entity description in place is picked up
+    ent.entity_description.name = "Hello World"
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes["friendly_name"] == "Hello World"
+
+
 async def test_entity_category_property(hass):
     """Test entity category property."""
     mock_entity1 = entity.Entity()
@@ -6,7 +6,11 @@ from unittest.mock import ANY, Mock, patch
 
 import pytest
 
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+)
 from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import (
@@ -378,6 +382,92 @@ async def test_parallel_updates_sync_platform_with_constant(hass):
     assert entity.parallel_updates._value == 2
 
 
+async def test_batch_state_writes(hass):
+    """Test platforms can batch the state writes of their entities."""
+    platform = MockPlatform()
+    platform.BATCH_STATE_WRITES = True
+
+    mock_entity_platform(hass, "test_domain.platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    assert handle.batch_state_writes is True
+
+    batches = []
+
+    @callback
+    def batch_listener(events):
+        batches.append([event.data["entity_id"] for event in events])
+
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, batch_listener)
+
+    entities = [MockEntity(name=f"test_{idx}", state="off") for idx in range(3)]
+    await handle.async_add_entities(entities)
+    await hass.async_block_till_done()
+    assert batches == [
+        ["test_domain.test_0", "test_domain.test_1", "test_domain.test_2"]
+    ]
+
+    for entity in entities:
+        entity._values["state"] = "on"
+        entity.async_write_ha_state()
+    entities[0]._values["state"] = "unknown"
+    entities[0].async_write_ha_state()
+    assert hass.states.get("test_domain.test_0").state == "off"
+
+    await hass.async_block_till_done()
+    assert batches[1] == [
+        "test_domain.test_0",
+        "test_domain.test_1",
+        "test_domain.test_2",
+    ]
+    assert hass.states.get("test_domain.test_0").state == "unknown"
+    assert hass.states.get("test_domain.test_1").state == "on"
+
+
+async def test_batch_state_writes_isolates_errors(hass, caplog):
+    """Test an entity failing to write doesn't lose the writes of its batch."""
+
+    class BrokenEntity(MockEntity):
+        """Entity whose state raises once it is broken."""
+
+        @property
+        def state(self):
+            """Return the state of the entity."""
+            if self._values.get("broken"):
+                raise ValueError("Broken state")
+            return super().state
+
+    platform = MockPlatform()
+    platform.BATCH_STATE_WRITES = True
+    mock_entity_platform(hass, "test_domain.platform", platform)
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+    handle = list(component._platforms.values())[-1]
+
+    entities = [BrokenEntity(name=f"test_{idx}", state="off") for idx in range(3)]
+    await handle.async_add_entities(entities)
+    await hass.async_block_till_done()
+
+    entities[1]._values["broken"] = True
+    for entity in entities:
+        entity._values["state"] = "on"
+        entity.async_write_ha_state()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("test_domain.test_0").state == "on"
+    assert hass.states.get("test_domain.test_1").state == "off"
+    assert hass.states.get("test_domain.test_2").state == "on"
+    assert "Error writing state of test_domain.test_1" in caplog.text
+
+
 async def test_raise_error_on_update(hass):
     """Test the add entity if they raise an error on update."""
     updates = []
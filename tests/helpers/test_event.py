@@ -11,7 +11,7 @@ import jinja2
 import pytest
 
 from homeassistant.components import sun
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
@@ -446,6 +446,7 @@ async def test_async_track_state_change_event(hass):
     def callback_that_throws(event):
         raise ValueError
 
+    old_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
     unsub_single = async_track_state_change_event(
         hass, ["light.Bowl"], single_run_callback
     )
@@ -455,6 +456,8 @@ async def test_async_track_state_change_event(hass):
     unsub_throws = async_track_state_change_event(
         hass, ["light.Bowl", "switch.kitchen"], callback_that_throws
     )
+    # The bus looks up one listener per tracked entity_id
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 2
 
     # Adding state to state machine
     hass.states.async_set("light.Bowl", "on")
@@ -514,6 +517,7 @@ async def test_async_track_state_change_event(hass):
 
     unsub_multi()
     unsub_throws()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == old_count
 
 
 async def test_async_track_state_change_event_with_empty_list(hass):
@@ -2123,6 +2127,67 @@ async def test_track_template_result_iterator(hass):
     assert filter_runs == ["", "sensor.new"]
 
 
+async def test_track_template_result_only_renders_accessed_fields(hass):
+    """Test templates only re-render when the state fields they use change."""
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    template_state = Template("{{ states('sensor.power') }}", hass)
+    template_unit = Template(
+        "{{ state_attr('sensor.power', 'unit_of_measurement') }}", hass
+    )
+    template_other = Template("{{ states('sensor.other') }}", hass)
+    template_members = Template(
+        "{{ states.sensor | map(attribute='entity_id') | join(',') }}", hass
+    )
+    rendered = []
+    results = []
+    render_to_info = Template.async_render_to_info
+
+    def _render_to_info(self, *args, **kwargs):
+        rendered.append(self)
+        return render_to_info(self, *args, **kwargs)
+
+    @ha.callback
+    def _callback(event, updates):
+        results.extend(update.result for update in updates)
+
+    with patch.object(Template, "async_render_to_info", _render_to_info):
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(template_state, None),
+                TrackTemplate(template_unit, None),
+                TrackTemplate(template_other, None),
+                TrackTemplate(template_members, None, timedelta(seconds=0)),
+            ],
+            _callback,
+        )
+        await hass.async_block_till_done()
+        assert len(rendered) == 4
+        rendered.clear()
+
+        hass.states.async_set(
+            "sensor.power", "10", {"unit_of_measurement": "W", "icon": "mdi:flash"}
+        )
+        await hass.async_block_till_done()
+        assert rendered == []
+
+        hass.states.async_set("sensor.power", "11", {"unit_of_measurement": "W"})
+        await hass.async_block_till_done()
+        assert rendered == [template_state]
+        rendered.clear()
+
+        hass.states.async_set("sensor.power", "11", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert rendered == [template_unit]
+        rendered.clear()
+
+        hass.states.async_set("sensor.new", "on")
+        await hass.async_block_till_done()
+        assert rendered == [template_members]
+
+    assert results == [11, "kW", "sensor.new,sensor.power"]
+
+
 async def test_track_template_result_errors(hass, caplog):
     """Test tracking template with errors in the template."""
     template_syntax_error = Template("{{states.switch", hass)
@@ -1,11 +1,20 @@
 """Test Home Assistant remote methods and classes."""
+from array import array
+from collections import namedtuple
 import datetime
+import json
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_bytes,
+    json_dumps,
+)
 from homeassistant.util import dt as dt_util
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 
 @pytest.mark.parametrize("encoder", (JSONEncoder, ExtendedJSONEncoder))
@@ -64,3 +73,38 @@ def test_extended_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+def test_json_dumps(hass):
+    """Test dumping Home Assistant objects with the fast JSON serializer."""
+    now = dt_util.utcnow()
+    state = core.State("test.test", "hello", {"beer": "good"})
+
+    assert json_dumps(now) == f'"{now.isoformat()}"'
+    assert json.loads(json_dumps({"milk"})) == ["milk"]
+    assert json.loads(json_dumps(frozenset(["milk"]))) == ["milk"]
+    assert json.loads(json_dumps(state)) == json.loads(
+        json.dumps(state.as_dict(), cls=JSONEncoder)
+    )
+    assert json_dumps(ReadOnlyDict({"a": 1})) == '{"a":1}'
+    assert json_dumps({1: "one"}) == '{"1":"one"}'
+    assert json_bytes({"a": [1, 2]}) == b'{"a":[1,2]}'
+    assert json_dumps(array("d", [1.5, 2.0])) == "[1.5,2.0]"
+
+
+def test_json_dumps_subclasses(hass):
+    """Test dumping subclasses of builtin types."""
+
+    class FloatSubclass(float):
+        """Float subclass."""
+
+    point = namedtuple("Point", ["x", "y"])
+
+    assert json_dumps(FloatSubclass(1.5)) == "1.5"
+    assert json_dumps(point(1, 2)) == "[1,2]"
+
+
+def test_json_dumps_raises(hass):
+    """Test dumping unsupported objects raises TypeError."""
+    with pytest.raises(TypeError):
+        json_dumps(object())
@@ -203,6 +203,36 @@ async def test_hass_starting(hass):
     assert mock_write_data.called
 
 
+async def test_last_seen_of_unchanged_states(hass):
+    """Test unchanged states keep their last seen time between dumps."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b1", "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+    now = dt_util.utcnow()
+    with patch("homeassistant.util.dt.utcnow", return_value=now):
+        (stored_state,) = data.async_get_stored_states()
+    assert stored_state.last_seen == now
+
+    later = now + timedelta(hours=1)
+    with patch("homeassistant.util.dt.utcnow", return_value=later):
+        (stored_state,) = data.async_get_stored_states()
+    assert stored_state.last_seen == now
+
+    hass.states.async_set("input_boolean.b1", "off")
+    with patch("homeassistant.util.dt.utcnow", return_value=later):
+        (stored_state,) = data.async_get_stored_states()
+    assert stored_state.last_seen == later
+
+    much_later = later + timedelta(days=1, seconds=1)
+    with patch("homeassistant.util.dt.utcnow", return_value=much_later):
+        (stored_state,) = data.async_get_stored_states()
+    assert stored_state.last_seen == much_later
+
+
 async def test_dump_data(hass):
     """Test that we cache data."""
     states = [
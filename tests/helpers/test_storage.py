@@ -2,6 +2,9 @@
 import asyncio
 from datetime import timedelta
 import json
+from operator import itemgetter
+import os
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -25,6 +28,14 @@ MOCK_DATA = {"hello": "world"}
 MOCK_DATA2 = {"goodbye": "cruel world"}
 
 
+class DiskStore(storage.Store):
+    """Store that writes to disk, bypassing the mocked storage."""
+
+    _async_load = storage.Store._async_load
+    _write_data = storage.Store._write_data
+    async_remove = storage.Store.async_remove
+
+
 @pytest.fixture
 def store(hass):
     """Fixture of a store that prevents writing on Home Assistant stop."""
@@ -113,6 +124,32 @@ async def test_saving_with_delay(hass, store, hass_storage):
     }
 
 
+async def test_saving_with_snapshot(hass, store, hass_storage):
+    """Test only the snapshot is taken in the event loop."""
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def data_func(snapshot):
+        threads.append(threading.get_ident())
+        return dict(snapshot)
+
+    items = {"hello": "world"}
+    store.async_delay_save(data_func, 1, snapshot_func=lambda: tuple(items.items()))
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass_storage[store.key]["data"] == MOCK_DATA
+    assert threads and loop_thread not in threads
+
+    # Loading while a write is pending builds the data from a snapshot
+    items["hello"] = "earth"
+    store.async_delay_save(data_func, 1, snapshot_func=lambda: tuple(items.items()))
+    assert await store.async_load() == {"hello": "earth"}
+    items["hello"] = "mars"
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert hass_storage[store.key]["data"] == {"hello": "earth"}
+
+
 async def test_saving_on_final_write(hass, hass_storage):
     """Test delayed saves trigger when we quit Home Assistant."""
     store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
@@ -460,3 +497,119 @@ async def test_changing_delayed_written_data(hass, store, hass_storage):
         "key": MOCK_KEY,
         "data": {"hello": "world"},
     }
+
+
+@pytest.fixture
+def journal_store(hass, tmp_path):
+    """Fixture of a store in journal mode writing to a temporary directory."""
+    hass.config.config_dir = str(tmp_path)
+    return DiskStore(
+        hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": itemgetter("id")}
+    )
+
+
+def _read_journal(store):
+    """Return the entries of the journal of a store."""
+    with open(store.path + storage.JOURNAL_SUFFIX, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+async def test_journal_writes_changes(hass, journal_store):
+    """Test a store in journal mode only appends changed items."""
+    items = [{"id": "a", "value": 1}, {"id": "b", "value": 2}]
+    await journal_store.async_save({"items": items, "other": 1})
+    with open(journal_store.path, encoding="utf-8") as file:
+        written = json.load(file)
+    assert written["data"] == {"items": items, "other": 1}
+    assert not os.path.exists(journal_store.path + storage.JOURNAL_SUFFIX)
+
+    items = [{"id": "b", "value": 3}, {"id": "c", "value": 4}]
+    await journal_store.async_save({"items": items, "other": 1})
+    with open(journal_store.path, encoding="utf-8") as file:
+        assert json.load(file) == written
+    assert _read_journal(journal_store) == [
+        {"journal_id": written["journal_id"]},
+        {"c": "items", "k": "b", "v": {"id": "b", "value": 3}},
+        {"c": "items", "k": "c", "v": {"id": "c", "value": 4}},
+        {"c": "items", "k": "a", "v": None},
+    ]
+
+    # Writing unchanged data does not touch the journal
+    await journal_store.async_save({"items": list(items), "other": 1})
+    assert len(_read_journal(journal_store)) == 4
+
+    store = DiskStore(
+        hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": itemgetter("id")}
+    )
+    assert await store.async_load() == {"items": items, "other": 1}
+
+    await journal_store.async_remove()
+    assert not os.path.exists(journal_store.path)
+    assert not os.path.exists(journal_store.path + storage.JOURNAL_SUFFIX)
+
+
+async def test_journal_compaction(hass, journal_store):
+    """Test the journal is compacted into the main file."""
+    await journal_store.async_save({"items": [{"id": "a", "value": 0}]})
+    with patch.object(storage, "JOURNAL_MIN_COMPACT_ENTRIES", 2):
+        await journal_store.async_save({"items": [{"id": "a", "value": 1}]})
+        assert len(_read_journal(journal_store)) == 2
+        await journal_store.async_save({"items": [{"id": "a", "value": 2}]})
+        assert not os.path.exists(journal_store.path + storage.JOURNAL_SUFFIX)
+
+    # Other data than the journaled collections is written to the main file
+    await journal_store.async_save({"items": [{"id": "a", "value": 2}], "other": 1})
+    assert not os.path.exists(journal_store.path + storage.JOURNAL_SUFFIX)
+    with open(journal_store.path, encoding="utf-8") as file:
+        assert json.load(file)["data"] == {
+            "items": [{"id": "a", "value": 2}],
+            "other": 1,
+        }
+
+
+async def test_journal_stale_or_incomplete(hass, journal_store, caplog):
+    """Test stale journals and interrupted journal writes are ignored."""
+    await journal_store.async_save({"items": [{"id": "a", "value": 0}]})
+    await journal_store.async_save({"items": [{"id": "a", "value": 1}]})
+    with open(
+        journal_store.path + storage.JOURNAL_SUFFIX, "a", encoding="utf-8"
+    ) as file:
+        file.write('{"c":"items","k":"a","v":{"id":')
+
+    store = DiskStore(
+        hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": itemgetter("id")}
+    )
+    assert await store.async_load() == {"items": [{"id": "a", "value": 1}]}
+    assert "Ignoring incomplete journal entry" in caplog.text
+
+    with open(journal_store.path, encoding="utf-8") as file:
+        written = json.load(file)
+    written["journal_id"] = "other"
+    with open(journal_store.path, "w", encoding="utf-8") as file:
+        json.dump(written, file)
+    assert await store.async_load() == {"items": [{"id": "a", "value": 0}]}
+
+
+async def test_journal_migration(hass, tmp_path):
+    """Test migrations see the data with the journal applied."""
+    hass.config.config_dir = str(tmp_path)
+    store = DiskStore(
+        hass, MOCK_VERSION, MOCK_KEY, journal_keys={None: itemgetter("id")}
+    )
+    await store.async_save([{"id": "a"}, {"id": "b"}])
+    await store.async_save([{"id": "b"}, {"id": "c"}])
+    assert len(_read_journal(store)) == 3
+
+    async def migrate(old_major_version, old_minor_version, old_data):
+        return [{**item, "migrated": True} for item in old_data]
+
+    store_v_2 = DiskStore(
+        hass, MOCK_VERSION_2, MOCK_KEY, journal_keys={None: itemgetter("id")}
+    )
+    with patch.object(store_v_2, "_async_migrate_func", migrate):
+        data = await store_v_2.async_load()
+    assert data == [{"id": "b", "migrated": True}, {"id": "c", "migrated": True}]
+
+    # The first write after a migration compacts
+    await store_v_2.async_save(data)
+    assert not os.path.exists(store.path + storage.JOURNAL_SUFFIX)
@@ -215,6 +215,73 @@ def test_iterating_domain_states(hass):
     )
 
 
+def test_render_info_state_fields(hass):
+    """Test the fields of the states accessed by a template are collected."""
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    old_state = hass.states.get("sensor.power")
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.power') }}"
+        " {{ state_attr('sensor.power', 'unit_of_measurement') }}"
+        " {{ states.sensor.power.name }} {{ states.sensor.power.domain }}",
+    )
+    assert_result_info(info, "10 W power sensor", ["sensor.power"])
+    assert info.entity_fields == {
+        "sensor.power": {
+            "state",
+            ("attributes", "unit_of_measurement"),
+            ("attributes", "friendly_name"),
+        }
+    }
+
+    hass.states.async_set(
+        "sensor.power", "10", {"unit_of_measurement": "W", "icon": "mdi:flash"}
+    )
+    new_state = hass.states.get("sensor.power")
+    assert not info.state_fields_changed("sensor.power", old_state, new_state)
+
+    hass.states.async_set("sensor.power", "11", {"unit_of_measurement": "W"})
+    assert info.state_fields_changed(
+        "sensor.power", old_state, hass.states.get("sensor.power")
+    )
+
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "kW"})
+    assert info.state_fields_changed(
+        "sensor.power", old_state, hass.states.get("sensor.power")
+    )
+
+    info = render_to_info(hass, "{{ states.sensor.power }}")
+    assert info.entity_fields == {"sensor.power": {template._ALL_STATE_FIELDS}}
+    assert info.state_fields_changed("sensor.power", old_state, new_state)
+
+
+def test_render_info_iterated_states(hass):
+    """Test iterating states without accessing them only tracks membership."""
+    hass.states.async_set("sensor.power", "10")
+    old_state = hass.states.get("sensor.power")
+    hass.states.async_set("sensor.power", "11")
+    new_state = hass.states.get("sensor.power")
+
+    info = render_to_info(
+        hass, "{{ states.sensor | map(attribute='entity_id') | join(',') }}"
+    )
+    assert_result_info(info, "sensor.power", [], ["sensor"])
+    assert not info.iterated_states_accessed
+    assert not info.state_fields_changed("sensor.power", old_state, new_state)
+
+    info = render_to_info(hass, "{{ states | map(attribute='entity_id') | list }}")
+    assert_result_info(info, ["sensor.power"], all_states=True)
+    assert not info.state_fields_changed("sensor.power", old_state, new_state)
+
+    info = render_to_info(
+        hass, "{{ states.sensor | map(attribute='state') | join(',') }}"
+    )
+    assert_result_info(info, 11, [], ["sensor"])
+    assert info.iterated_states_accessed
+    assert info.state_fields_changed("sensor.power", old_state, new_state)
+
+
 def test_float_function(hass):
     """Test float function."""
     hass.states.async_set("sensor.temperature", "12")
@@ -1683,6 +1750,33 @@ def test_regex_findall_index(hass):
     assert tpl.async_render() == "LHR"
 
 
+def test_regex_cache(hass):
+    """Test the regex filters share compiled patterns."""
+    cache = template._REGEX_CACHE  # pylint: disable=protected-access
+    cache.clear()
+
+    tpl = template.Template(
+        """
+{{ 'Home' | regex_match('home', ignorecase=True) }}
+{{ 'Home' | regex_search('home', True) }}
+{{ 'Home' | regex_replace('home', 'Away', True) }}
+{{ 'Home' | regex_match('home') }}
+            """,
+        hass,
+    )
+    assert tpl.async_render() == "True\nTrue\nAway\nFalse"
+    assert ("home", True) in cache
+    assert ("home", False) in cache
+    assert template.regex_cache_info() == {
+        "size": 2,
+        "max_size": template.REGEX_CACHE_SIZE,
+        "hits": 2,
+        "misses": 2,
+        "evictions": 0,
+        "hit_rate": 0.5,
+    }
+
+
 def test_bitwise_and(hass):
     """Test bitwise_and method."""
     tpl = template.Template(
@@ -3432,35 +3526,70 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_template_cache(hass):
+    """Test compiled templates are shared and survive their templates."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
-    tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    cache = template._COMPILED_TEMPLATE_CACHE  # pylint: disable=protected-access
+    cache.clear()
 
-    tpl2 = template.Template(
-        (template_string),
-    )
-    tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    tpl = template.Template(template_string)
+    tpl.ensure_valid()
+    assert ("no_hass", template_string) in cache
+    assert template.compiled_template_cache_info() == {
+        "size": 1,
+        "max_size": template.COMPILED_TEMPLATE_CACHE_SIZE,
+        "hits": 0,
+        "misses": 1,
+        "evictions": 0,
+        "hit_rate": 0.0,
+    }
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    tpl = template.Template(template_string)
+    tpl.ensure_valid()
+    assert template.compiled_template_cache_info()["hits"] == 1
+
+    # Each environment flavour compiles the template on its own
+    template.TemplateEnvironment(hass).compile(template_string)
+    template.TemplateEnvironment(hass, limited=True).compile(template_string)
+    template.TemplateEnvironment(hass, strict=True).compile(template_string)
+    assert ("normal", template_string) in cache
+    assert ("limited", template_string) in cache
+    assert ("strict", template_string) in cache
+
+    assert template.Template(template_string, hass).async_render() == (
+        "foo=x%26y&bar=42"
+    )
+    assert template.compiled_template_cache_info() == {
+        "size": 4,
+        "max_size": template.COMPILED_TEMPLATE_CACHE_SIZE,
+        "hits": 2,
+        "misses": 4,
+        "evictions": 0,
+        "hit_rate": 0.3333,
+    }
+
+
+def test_template_cache_evicts_least_recently_used():
+    """Test the template cache is bounded."""
+    cache = template.TemplateCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.as_dict() == {
+        "size": 2,
+        "max_size": 2,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "hit_rate": 0.5,
+    }
 
 
 def test_is_template_string():
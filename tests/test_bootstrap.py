@@ -12,6 +12,7 @@ import homeassistant.config as config_util
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.setup import async_get_setup_trace, async_start_setup_trace
 
 from tests.common import (
     MockModule,
@@ -717,3 +718,23 @@ async def test_warning_logged_on_wrap_up_timeout(hass, caplog):
         await hass.async_block_till_done()
 
     assert "Setup timed out for bootstrap - moving forward" in caplog.text
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_not_traced_by_default(hass):
+    """Test integration setups are not traced unless startup is traced."""
+    mock_integration(hass, MockModule("untraced"))
+    await bootstrap._async_set_up_integrations(hass, {"untraced": {}})
+    assert "untraced" in hass.config.components
+    assert async_get_setup_trace(hass) is None
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_traced(hass):
+    """Test integration setups are traced until bootstrap finishes."""
+    trace = async_start_setup_trace(hass)
+    mock_integration(hass, MockModule("traced"))
+    await bootstrap._async_set_up_integrations(hass, {"traced": {}})
+    assert "traced" in hass.config.components
+    assert trace.finished
+    assert {integration for integration, *_ in trace.spans} == {"traced"}
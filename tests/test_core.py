@@ -6,6 +6,7 @@ import array
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -64,7 +65,7 @@ def test_split_entity_id():
 
 def test_async_add_hass_job_schedule_callback():
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock()
+    hass = MagicMock(job_monitor=None)
     job = MagicMock()
 
     ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(ha.callback(job)))
@@ -75,7 +76,7 @@ def test_async_add_hass_job_schedule_callback():
 
 def test_async_add_hass_job_schedule_partial_callback():
     """Test that we schedule partial coros and add jobs to the job pool."""
-    hass = MagicMock()
+    hass = MagicMock(job_monitor=None)
     job = MagicMock()
     partial = functools.partial(ha.callback(job))
 
@@ -87,7 +88,7 @@ def test_async_add_hass_job_schedule_partial_callback():
 
 def test_async_add_hass_job_schedule_coroutinefunction(loop):
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=loop))
+    hass = MagicMock(loop=MagicMock(wraps=loop), job_monitor=None)
 
     async def job():
         pass
@@ -100,7 +101,7 @@ def test_async_add_hass_job_schedule_coroutinefunction(loop):
 
 def test_async_add_hass_job_schedule_partial_coroutinefunction(loop):
     """Test that we schedule partial coros and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=loop))
+    hass = MagicMock(loop=MagicMock(wraps=loop), job_monitor=None)
 
     async def job():
         pass
@@ -115,7 +116,7 @@ def test_async_add_hass_job_schedule_partial_coroutinefunction(loop):
 
 def test_async_add_job_add_hass_threaded_job_to_pool():
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock()
+    hass = MagicMock(job_monitor=None)
 
     def job():
         pass
@@ -141,7 +142,7 @@ def test_async_create_task_schedule_coroutine(loop):
 
 def test_async_run_hass_job_calls_callback():
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(job_monitor=None)
     calls = []
 
     def job():
@@ -154,7 +155,7 @@ def test_async_run_hass_job_calls_callback():
 
 def test_async_run_hass_job_delegates_non_async():
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(job_monitor=None)
     calls = []
 
     def job():
@@ -398,6 +399,63 @@ def test_state_as_dict():
     assert state.as_dict() is as_dict_1
 
 
+def test_state_as_dict_json():
+    """Test a State as JSON is cached."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    as_dict_json_1 = state.as_dict_json()
+    assert json.loads(as_dict_json_1) == state.as_dict()
+    # 2nd time to verify cache
+    assert state.as_dict_json() is as_dict_json_1
+
+
+def test_state_as_compressed_state():
+    """Test a State as compressed state and JSON is cached."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    expected = {
+        "a": {"pig": "dog"},
+        "c": state.context.id,
+        "lc": last_time.timestamp(),
+        "s": "on",
+    }
+    as_compressed_state = state.as_compressed_state()
+    assert isinstance(as_compressed_state, ReadOnlyDict)
+    assert as_compressed_state == expected
+    assert state.as_compressed_state() is as_compressed_state
+
+    as_compressed_state_json = state.as_compressed_state_json()
+    assert json.loads(f"{{{as_compressed_state_json}}}") == {"happy.happy": expected}
+    assert state.as_compressed_state_json() is as_compressed_state_json
+
+    state = ha.State(
+        "happy.happy",
+        "on",
+        last_updated=last_time + timedelta(seconds=1),
+        last_changed=last_time,
+        context=ha.Context(user_id="abc"),
+    )
+    assert state.as_compressed_state() == {
+        "a": {},
+        "c": {"id": state.context.id, "parent_id": None, "user_id": "abc"},
+        "lc": last_time.timestamp(),
+        "lu": last_time.timestamp() + 1,
+        "s": "on",
+    }
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -446,6 +504,113 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_matching_listener(hass):
+    """Test listeners matching the entity_id of the event data."""
+    entity_calls = []
+    domain_calls = []
+    both_calls = []
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        return not event.data.get("filtered")
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub_entity = hass.bus.async_listen(
+        "test", entity_calls.append, match_entity_ids=["light.kitchen", "light.bed"]
+    )
+    unsub_domain = hass.bus.async_listen(
+        "test", domain_calls.append, event_filter=filter, match_domains=["switch"]
+    )
+    unsub_both = hass.bus.async_listen(
+        "test",
+        both_calls.append,
+        match_entity_ids=["switch.pump"],
+        match_domains=["switch"],
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+
+    for entity_id in ("light.kitchen", "light.hall", "switch.pump", "switch"):
+        hass.bus.async_fire("test", {"entity_id": entity_id})
+    hass.bus.async_fire("test", {"entity_id": "switch.fan", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in entity_calls] == ["light.kitchen"]
+    # An entity_id without a dot is not in the switch domain
+    assert [event.data["entity_id"] for event in domain_calls] == ["switch.pump"]
+    # Matching both the entity_id and the domain only runs the listener once
+    assert [event.data["entity_id"] for event in both_calls] == [
+        "switch.pump",
+        "switch.fan",
+    ]
+
+    unsub_entity()
+    unsub_domain()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "switch.pump"})
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 1
+    assert len(domain_calls) == 1
+    assert len(both_calls) == 3
+
+    unsub_both()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    with pytest.raises(ha.HomeAssistantError):
+        hass.bus.async_listen(MATCH_ALL, entity_calls.append, match_domains=["light"])
+
+
+async def test_eventbus_batch_listener(hass, caplog):
+    """Test batch listeners get the events fired in a batch at once."""
+    batches = []
+    calls = []
+
+    @ha.callback
+    def batch_listener(events):
+        """Mock batch listener."""
+        batches.append([event.data["idx"] for event in events])
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_batch("test", batch_listener)
+    hass.bus.async_listen("test", listener, run_immediately=True)
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"idx": 0})
+    with hass.bus.async_batch():
+        hass.bus.async_fire("test", {"idx": 1})
+        with hass.bus.async_batch():
+            hass.bus.async_fire("test", {"idx": 2})
+        hass.bus.async_fire("other", {"idx": 3})
+        assert batches == [[0]]
+        assert len(calls) == 3
+    hass.bus.async_fire("test", {"idx": 4})
+
+    assert batches == [[0], [1, 2], [4]]
+    assert [event.data["idx"] for event in calls] == [0, 1, 2, 4]
+
+    unsub()
+    hass.bus.async_fire("test", {"idx": 5})
+    assert batches == [[0], [1, 2], [4]]
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    unsub()
+    assert "Unable to remove unknown batch listener" in caplog.text
+
+    with pytest.raises(ha.HomeAssistantError):
+        hass.bus.async_listen_batch(MATCH_ALL, batch_listener)
+
+    with pytest.raises(ha.HomeAssistantError):
+        hass.bus.async_listen_batch("test", lambda events: None)
+
+
 async def test_eventbus_run_immediately(hass):
     """Test we can call events immediately."""
     calls = []
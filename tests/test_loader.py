@@ -673,3 +673,50 @@ async def test_loggers(hass):
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+@pytest.fixture
+def mock_manifest_index():
+    """Use the real manifest index for these tests."""
+
+
+async def test_manifest_index(hass, tmp_path):
+    """Test the manifest index only parses manifests which changed."""
+    hass.config.config_dir = str(tmp_path)
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"domain": "test", "name": "Test"}')
+
+    index = await loader.async_load_manifest_index(hass)
+    assert len(index) == 0
+    assert index.load_manifest(manifest_path) == {"domain": "test", "name": "Test"}
+    assert index.changed
+
+    await loader.async_save_manifest_index(hass)
+    assert not index.changed
+    assert (tmp_path / ".storage" / loader.MANIFEST_INDEX_FILE).is_file()
+
+    hass.data.pop(loader.DATA_MANIFEST_INDEX)
+    index = await loader.async_load_manifest_index(hass)
+    assert len(index) == 1
+    with patch("homeassistant.loader.json.loads") as mock_loads:
+        manifest = index.load_manifest(manifest_path)
+    assert not mock_loads.called
+    assert manifest == {"domain": "test", "name": "Test"}
+    assert not index.changed
+
+    # Changes to the returned manifest are not stored in the index
+    manifest["is_built_in"] = True
+    assert index.load_manifest(manifest_path) == {"domain": "test", "name": "Test"}
+
+    manifest_path.write_text('{"domain": "test", "name": "Test Changed"}')
+    assert index.load_manifest(manifest_path)["name"] == "Test Changed"
+    assert index.changed
+
+
+async def test_get_integration_uses_manifest_index(hass):
+    """Test resolving integrations loads manifests through the index."""
+    index = hass.data[loader.DATA_MANIFEST_INDEX] = loader.ManifestIndex()
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.domain == "hue"
+    assert len(index) == 1
+    assert index.changed
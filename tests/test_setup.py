@@ -708,3 +708,73 @@ async def test_async_start_setup_platforms(hass):
     assert "august" not in hass.data[setup.DATA_SETUP_STARTED]
     assert isinstance(hass.data[setup.DATA_SETUP_TIME]["august"], datetime.timedelta)
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
+
+
+async def test_setup_trace(hass, mock_handlers):
+    """Test the setup trace records setup phases and the critical path."""
+    trace = setup.async_start_setup_trace(hass)
+
+    async def slow_setup(hass, config):
+        """Set up the component slowly."""
+        await asyncio.sleep(0.01)
+        return True
+
+    mock_integration(hass, MockModule("comp_dep", async_setup=slow_setup))
+    mock_integration(
+        hass,
+        MockModule(
+            "comp",
+            dependencies=["comp_dep"],
+            async_setup_entry=AsyncMock(return_value=True),
+        ),
+    )
+    mock_integration(hass, MockModule("comp_other"))
+    mock_entity_platform(hass, "config_flow.comp", None)
+    MockConfigEntry(domain="comp").add_to_hass(hass)
+
+    assert await setup.async_setup_component(hass, "comp_other", {})
+    assert await setup.async_setup_component(hass, "comp", {})
+    with setup.async_start_setup(hass, ["sensor.comp"]):
+        pass
+    trace.async_finish()
+    assert await setup.async_setup_component(hass, "persistent_notification", {})
+
+    phases = {(integration, phase) for integration, phase, _, _ in trace.spans}
+    assert phases == {
+        ("comp_dep", "import"),
+        ("comp_dep", "async_setup"),
+        ("comp", "dependencies"),
+        ("comp", "import"),
+        ("comp", "async_setup"),
+        ("comp", "async_setup_entry"),
+        ("comp", "sensor platform"),
+        ("comp_other", "import"),
+        ("comp_other", "async_setup"),
+    }
+    assert trace.dependencies["comp"] == {"comp_dep"}
+
+    critical_path = trace.critical_path()
+    assert [item["domain"] for item in critical_path] == ["comp_dep", "comp"]
+    assert critical_path[0]["seconds"] >= 0.01
+
+    chrome_trace = trace.as_chrome_trace()
+    assert chrome_trace["otherData"]["finished"] is True
+    assert chrome_trace["otherData"]["critical_path"] == critical_path
+    thread_names = {
+        event["tid"]: event["args"]["name"]
+        for event in chrome_trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    assert sorted(thread_names.values()) == ["comp", "comp_dep", "comp_other"]
+    assert {
+        (thread_names[event["tid"]], event["name"])
+        for event in chrome_trace["traceEvents"]
+        if event["ph"] == "X"
+    } == phases
+
+
+async def test_setup_not_traced(hass):
+    """Test setup is only traced after the trace started."""
+    mock_integration(hass, MockModule("comp"))
+    assert await setup.async_setup_component(hass, "comp", {})
+    assert setup.async_get_setup_trace(hass) is None
@@ -1,19 +1,22 @@
 """Test Home Assistant json utility functions."""
-from datetime import datetime
+from datetime import datetime, timedelta
 from functools import partial
 from json import JSONEncoder, dumps
 import math
 import os
 from tempfile import mkdtemp
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.json import (
+    JSONEncoder as HAJSONEncoder,
     SerializationError,
     find_paths_unserializable_data,
+    json_dumps,
+    json_encoder_dumps,
     load_json,
     save_json,
 )
@@ -82,6 +85,14 @@ def test_save_bad_data():
     )
 
 
+def test_save_indents_output():
+    """Test saved JSON is indented by two spaces."""
+    fname = _path_for("test_indent")
+    save_json(fname, {"a": [1]})
+    with open(fname, encoding="utf-8") as fh:
+        assert fh.read() == '{\n  "a": [\n    1\n  ]\n}'
+
+
 def test_load_bad_data():
     """Test error from trying to load unserialisable data."""
     fname = _path_for("test5")
@@ -107,6 +118,50 @@ def test_custom_encoder():
     assert data == "9"
 
 
+def test_home_assistant_encoder():
+    """Test the Home Assistant encoder is handled by the JSON backend."""
+    fname = _path_for("test7")
+    state = State("light.kitchen", "on", {"brightness": 100})
+    with patch("homeassistant.util.json.json.dumps") as mock_dumps:
+        save_json(fname, {"state": state, "ids": {1}}, encoder=HAJSONEncoder)
+    assert not mock_dumps.called
+    data = load_json(fname)
+    assert data["state"]["entity_id"] == "light.kitchen"
+    assert data["state"]["attributes"] == {"brightness": 100}
+    assert data["ids"] == [1]
+
+
+def test_home_assistant_encoder_subclass():
+    """Test subclasses of the Home Assistant encoder are handled by the backend."""
+
+    class TimedeltaEncoder(HAJSONEncoder):
+        """Encoder also converting timedeltas."""
+
+        def default(self, o):
+            """Convert timedeltas to seconds."""
+            if isinstance(o, timedelta):
+                return o.total_seconds()
+            return super().default(o)
+
+    fname = _path_for("test8")
+    with patch("homeassistant.util.json.json.dumps") as mock_dumps:
+        save_json(
+            fname, {"delay": timedelta(minutes=1), "ids": {1}}, encoder=TimedeltaEncoder
+        )
+        dumps = json_encoder_dumps(TimedeltaEncoder)
+        assert dumps({"delay": timedelta(seconds=2)}) == '{"delay":2.0}'
+    assert not mock_dumps.called
+    assert load_json(fname) == {"delay": 60.0, "ids": [1]}
+
+
+def test_json_dumps_nan_and_infinity():
+    """Test NaN and infinity are serialized as null."""
+    assert (
+        json_dumps({"nan": math.nan, "inf": math.inf, "-inf": -math.inf})
+        == '{"nan":null,"inf":null,"-inf":null}'
+    )
+
+
 def test_find_unserializable_data():
     """Find unserializeable data."""
     assert find_paths_unserializable_data(1) == {}
@@ -0,0 +1,140 @@
+"""Test the event loop monitor."""
+import asyncio
+from functools import partial
+from unittest.mock import patch
+
+from homeassistant.core import HassJob, callback
+from homeassistant.util import loop_monitor
+
+
+def test_histogram():
+    """Test observations are counted in their buckets."""
+    histogram = loop_monitor.Histogram()
+    assert histogram.quantile(0.99) == 0
+
+    for value in (0.0005, 0.002, 0.002, 0.03, 7):
+        histogram.observe(value)
+
+    assert histogram.count == 5
+    assert histogram.max == 7
+    assert histogram.quantile(0.5) == 0.005
+    assert histogram.quantile(0.8) == 0.05
+    assert histogram.quantile(1) == 7
+    as_dict = histogram.as_dict()
+    assert as_dict["buckets"]["0.001"] == 1
+    assert as_dict["buckets"]["0.005"] == 2
+    assert as_dict["buckets"]["+Inf"] == 1
+    assert sum(as_dict["buckets"].values()) == 5
+
+
+def test_job_owner():
+    """Test jobs are attributed to their integration."""
+
+    def target():
+        """Test target."""
+
+    target.__module__ = "homeassistant.components.hue.light"
+    assert loop_monitor.job_owner(target) == "hue"
+    assert loop_monitor.job_owner(partial(target, 1)) == "hue"
+    assert loop_monitor.job_name(partial(target, 1)) == (
+        "homeassistant.components.hue.light.test_job_owner.<locals>.target"
+    )
+
+    target.__module__ = "custom_components.my_integration"
+    assert loop_monitor.job_owner(target) == "my_integration"
+
+    target.__module__ = "homeassistant.helpers.event"
+    assert loop_monitor.job_owner(target) == "homeassistant.helpers.event"
+
+
+async def test_slow_jobs_are_attributed_exclusively():
+    """Test the time of jobs run by other jobs is attributed to them."""
+    monitor = loop_monitor.LoopMonitor(asyncio.get_running_loop(), 0.5)
+    times = iter([0, 0.1, 0.9, 1.0])
+
+    def inner():
+        """Inner job."""
+
+    def outer():
+        """Outer job running the inner job."""
+        monitor.run_callback(inner, ())
+
+    inner.__module__ = "homeassistant.components.slow"
+    with patch.object(loop_monitor, "perf_counter", side_effect=times):
+        monitor.run_callback(outer, ())
+
+    assert monitor.job_durations.count == 2
+    assert monitor.slow_job_count == 1
+    assert list(monitor.slow_jobs) == ["slow"]
+    assert monitor.slow_jobs["slow"].count == 1
+    assert round(monitor.slow_jobs["slow"].max, 3) == 0.8
+    assert monitor.slow_jobs["slow"].slowest_job.endswith("inner")
+    assert monitor.as_dict()["slow_jobs"]["slow"]["count"] == 1
+
+
+async def test_wrap_coroutine():
+    """Test each step of a coroutine is measured."""
+    monitor = loop_monitor.LoopMonitor(asyncio.get_running_loop(), 10)
+
+    async def target(value):
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return value
+
+    result = await asyncio.get_running_loop().create_task(
+        monitor.wrap_coroutine(target, target(5))
+    )
+    assert result == 5
+    assert monitor.job_durations.count == 3
+
+    async def failing():
+        await asyncio.sleep(0)
+        raise ValueError
+
+    task = asyncio.get_running_loop().create_task(
+        monitor.wrap_coroutine(failing, failing())
+    )
+    await asyncio.wait([task])
+    assert isinstance(task.exception(), ValueError)
+    assert monitor.job_durations.count == 5
+
+
+async def test_lag_probe():
+    """Test the scheduling lag is probed."""
+    loop = asyncio.get_running_loop()
+    monitor = loop_monitor.LoopMonitor(loop, 1)
+    with patch.object(loop_monitor, "LAG_PROBE_INTERVAL", 0):
+        monitor.start()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        monitor.stop()
+
+    count = monitor.lag.count
+    assert count > 0
+    assert monitor.pop_max_lag() == monitor.lag.max
+    assert monitor.pop_max_lag() == 0
+    await asyncio.sleep(0)
+    assert monitor.lag.count == count
+
+
+async def test_hass_jobs_are_measured(hass):
+    """Test Home Assistant runs its jobs through the monitor."""
+    monitor = loop_monitor.LoopMonitor(hass.loop, 10)
+    hass.job_monitor = monitor
+    calls = []
+
+    @callback
+    def callback_target(value):
+        calls.append(value)
+
+    async def coroutine_target(value):
+        calls.append(value)
+
+    hass.async_run_hass_job(HassJob(callback_target), 1)
+    hass.async_add_hass_job(HassJob(callback_target), 2)
+    hass.async_add_hass_job(HassJob(coroutine_target), 3)
+    await hass.async_block_till_done()
+    hass.job_monitor = None
+
+    assert calls == [1, 2, 3]
+    assert monitor.job_durations.count == 3